@@ -0,0 +1,5 @@
+"""Throughput benchmarks for the loader, validator, patcher, resolver and simulator.
+
+Run with `python -m benchmarks run --scale small --output results.json` and
+compare two result files with `python -m benchmarks compare base.json new.json`.
+"""
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import tempfile
+from pathlib import Path
+
+from benchmarks.harness import TIMINGS_HEADER, compare, format_comparison, format_timing, measure, results_document
+from benchmarks.suite import build_suite
+from benchmarks.synthetic import SCALES, generate_mod_set
+
+
+def _run(args: argparse.Namespace) -> int:
+    with tempfile.TemporaryDirectory(prefix="pvz-bench-") as tmp:
+        if args.mods is not None:
+            mods_dir, scale_name = args.mods, "custom"
+        else:
+            mods_dir, scale_name = generate_mod_set(Path(tmp), SCALES[args.scale], seed=args.seed), args.scale
+
+        suite = [
+            bench for bench in build_suite(mods_dir, args.schemas)
+            if any(fnmatch.fnmatch(bench.name, pattern) for pattern in args.filter)
+        ]
+        timings = []
+        print(TIMINGS_HEADER)
+        for bench in suite:
+            timings.append(measure(bench, repeat=args.repeat, warmup=args.warmup))
+            print(format_timing(timings[-1]))
+
+    if args.output is not None:
+        document = results_document(timings, meta={"scale": scale_name, "seed": args.seed, "mods": str(mods_dir)})
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"Results written to {args.output}")
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    current = json.loads(args.current.read_text(encoding="utf-8"))
+    rows = compare(baseline, current, threshold=args.threshold)
+    print(format_comparison(rows))
+    regressed = [row.name for row in rows if row.status == "regressed"]
+    if regressed:
+        print(f"Regressions beyond {args.threshold:.0%}: {', '.join(regressed)}")
+        return 1
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="pvz engine benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run benchmarks against a synthetic or existing mod set")
+    run.add_argument("--scale", choices=sorted(SCALES), default="small")
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--mods", type=Path, default=None, help="benchmark an existing mods directory instead")
+    run.add_argument("--schemas", type=Path, default=Path("schemas"))
+    run.add_argument("--filter", nargs="*", default=["*"], help="glob(s) over benchmark names")
+    run.add_argument("--repeat", type=int, default=5)
+    run.add_argument("--warmup", type=int, default=1)
+    run.add_argument("--output", type=Path, default=None, help="write machine-readable JSON results")
+    run.set_defaults(handler=_run)
+
+    cmp = commands.add_parser("compare", help="compare two result files; exits 1 on regressions")
+    cmp.add_argument("baseline", type=Path)
+    cmp.add_argument("current", type=Path)
+    cmp.add_argument("--threshold", type=float, default=0.10, help="fractional change treated as significant")
+    cmp.set_defaults(handler=_compare)
+
+    args = parser.parse_args()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
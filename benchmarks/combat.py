@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+
+from pvz.combat.grid import LaneGrid, Projectile, step_projectiles
+from pvz.content.stats import StatTables
+
+
+CELL_WIDTH = 10.0
+
+
+@dataclass
+class LaneScenario:
+    grid: LaneGrid
+    projectiles: list[Projectile]
+    hp: list[int]
+    speed: list[float]
+
+
+def lane_scenario(
+    stats: StatTables,
+    *,
+    lanes: int = 6,
+    zombies: int = 600,
+    projectiles: int = 1200,
+    seed: int = 0,
+) -> LaneScenario:
+    """Zombies and projectiles with stats sampled from the tables, scattered uniformly over the lawn."""
+    rng = random.Random(seed)
+    zombie_rows = [
+        row
+        for row in range(len(stats.zombies))
+        if stats.zombies.column("max_hp")[row] > 0 and stats.zombies.column("speed")[row] > 0
+    ]
+    projectile_rows = [row for row in range(len(stats.projectiles)) if stats.projectiles.column("speed")[row] > 0]
+    grid = LaneGrid(lanes, cell_width=CELL_WIDTH)
+    hp: list[int] = []
+    speed: list[float] = []
+    for zombie in range(zombies):
+        row = rng.choice(zombie_rows)
+        hp.append(stats.zombies.column("max_hp")[row])
+        speed.append(stats.zombies.column("speed")[row])
+        grid.add(zombie, rng.randrange(lanes), rng.uniform(0.0, grid.width))
+
+    table = stats.projectiles
+    shots = []
+    for _ in range(projectiles):
+        row = rng.choice(projectile_rows)
+        shots.append(
+            Projectile(
+                lane=rng.randrange(lanes),
+                x=rng.uniform(0.0, grid.width),
+                speed=table.column("speed")[row],
+                damage=table.column("damage")[row],
+                pierce=table.column("pierce")[row],
+                ttl=table.column("lifetime_ticks")[row],
+            )
+        )
+    return LaneScenario(grid=grid, projectiles=shots, hp=hp, speed=speed)
+
+
+def run_grid(scenario: LaneScenario, ticks: int) -> None:
+    for _ in range(ticks):
+        scenario.grid.advance(scenario.speed)
+        scenario.projectiles = step_projectiles(scenario.grid, scenario.projectiles, scenario.hp)
+
+
+def run_naive(scenario: LaneScenario, ticks: int) -> dict[int, tuple[int, float]]:
+    """Reference all-pairs version of `run_grid`: every projectile scans every zombie each tick.
+
+    Leaves `scenario.grid` untouched and returns the surviving zombies' `(lane, x)`.
+    """
+    positions = {
+        zombie: (lane, x) for lane in range(scenario.grid.lanes) for zombie, x in scenario.grid.lane(lane)
+    }
+    width = scenario.grid.width
+    for _ in range(ticks):
+        before = dict(positions)
+        for zombie, (lane, x) in before.items():
+            positions[zombie] = (lane, x - scenario.speed[zombie])
+
+        flying = []
+        for projectile in scenario.projectiles:
+            end = projectile.x + projectile.speed
+            met = []
+            for zombie, (lane, x) in positions.items():
+                start = before[zombie][1]
+                if lane == projectile.lane and start > projectile.x and x <= end and zombie not in projectile.hits:
+                    # Time within the tick at which the shot and the zombie meet.
+                    met.append(((start - projectile.x) / (projectile.speed + start - x), zombie))
+            for _, zombie in sorted(met)[: projectile.pierce + 1 - len(projectile.hits)]:
+                projectile.hits.add(zombie)
+                scenario.hp[zombie] -= projectile.damage
+                if scenario.hp[zombie] <= 0:
+                    del positions[zombie]
+            projectile.x = end
+            projectile.ttl -= 1
+            if len(projectile.hits) <= projectile.pierce and projectile.ttl > 0 and end <= width:
+                flying.append(projectile)
+        scenario.projectiles = flying
+    return positions
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import gc
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+
+@dataclass
+class Benchmark:
+    """One timed operation.
+
+    `setup` runs untimed before every repeat and its return value is passed to
+    `run`, so benchmarks that mutate their input (patching, simulation) start
+    from a fresh state each time. `items` is the number of logical units one
+    `run` processes and turns timings into throughput.
+    """
+
+    name: str
+    run: Callable[[Any], Any]
+    setup: Callable[[], Any] | None = None
+    number: int = 1
+    items: int | None = None
+    params: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class Timing:
+    name: str
+    samples_s: list[float]
+    number: int
+    items: int | None = None
+    params: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def min_s(self) -> float:
+        return min(self.samples_s)
+
+    @property
+    def median_s(self) -> float:
+        return statistics.median(self.samples_s)
+
+    @property
+    def stdev_s(self) -> float:
+        return statistics.stdev(self.samples_s) if len(self.samples_s) > 1 else 0.0
+
+    def to_json(self) -> dict[str, Any]:
+        payload: dict[str, Any] = {
+            "min_s": self.min_s,
+            "median_s": self.median_s,
+            "mean_s": statistics.fmean(self.samples_s),
+            "stdev_s": self.stdev_s,
+            "repeat": len(self.samples_s),
+            "number": self.number,
+            "params": self.params,
+        }
+        if self.items:
+            payload["items"] = self.items
+            payload["items_per_s"] = self.items / self.median_s if self.median_s > 0 else 0.0
+        return payload
+
+
+def measure(bench: Benchmark, *, repeat: int = 5, warmup: int = 1) -> Timing:
+    """Time `bench.run` with the GC disabled; each sample is seconds per call."""
+    samples: list[float] = []
+    for index in range(warmup + repeat):
+        state = bench.setup() if bench.setup is not None else None
+        gc.collect()
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for _ in range(bench.number):
+                bench.run(state)
+            elapsed = time.perf_counter() - start
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        if index >= warmup:
+            samples.append(elapsed / bench.number)
+    return Timing(name=bench.name, samples_s=samples, number=bench.number, items=bench.items, params=bench.params)
+
+
+def environment() -> dict[str, Any]:
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def results_document(timings: list[Timing], *, meta: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "meta": {**environment(), **meta},
+        "results": {timing.name: timing.to_json() for timing in timings},
+    }
+
+
+@dataclass
+class Comparison:
+    name: str
+    baseline_s: float | None
+    current_s: float | None
+    status: str
+
+    @property
+    def ratio(self) -> float | None:
+        if not self.baseline_s or self.current_s is None:
+            return None
+        return self.current_s / self.baseline_s
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], *, threshold: float = 0.10) -> list[Comparison]:
+    """Compare median timings; a change beyond `threshold` (fractional) is a regression/improvement."""
+    base_results = baseline.get("results", {})
+    current_results = current.get("results", {})
+    rows: list[Comparison] = []
+    for name in sorted(base_results.keys() | current_results.keys()):
+        base = base_results.get(name, {}).get("median_s")
+        cur = current_results.get(name, {}).get("median_s")
+        if base is None:
+            status = "new"
+        elif cur is None:
+            status = "missing"
+        elif cur > base * (1.0 + threshold):
+            status = "regressed"
+        elif cur < base * (1.0 - threshold):
+            status = "improved"
+        else:
+            status = "unchanged"
+        rows.append(Comparison(name=name, baseline_s=base, current_s=cur, status=status))
+    return rows
+
+
+TIMINGS_HEADER = f"{'benchmark':<36} {'median':>11} {'min':>11} {'stdev':>9} {'items/s':>12}"
+
+
+def format_timing(timing: Timing) -> str:
+    rate = timing.to_json().get("items_per_s")
+    rate_text = f"{rate:12.0f}" if rate is not None else f"{'-':>12}"
+    return (
+        f"{timing.name:<36} {timing.median_s * 1000:9.3f}ms {timing.min_s * 1000:9.3f}ms "
+        f"{timing.stdev_s * 1000:7.3f}ms {rate_text}"
+    )
+
+
+def format_comparison(rows: list[Comparison]) -> str:
+    lines = [f"{'benchmark':<36} {'baseline':>11} {'current':>11} {'ratio':>7}  status"]
+    for row in rows:
+        base = f"{row.baseline_s * 1000:9.3f}ms" if row.baseline_s is not None else f"{'-':>11}"
+        cur = f"{row.current_s * 1000:9.3f}ms" if row.current_s is not None else f"{'-':>11}"
+        ratio = f"{row.ratio:6.2f}x" if row.ratio is not None else f"{'-':>7}"
+        lines.append(f"{row.name:<36} {base} {cur} {ratio}  {row.status}")
+    return "\n".join(lines)
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+from pathlib import Path
+from typing import Any
+
+from benchmarks.combat import lane_scenario, run_grid, run_naive
+from benchmarks.harness import Benchmark
+from pvz.combat import BattleState, simulate_wave
+from pvz.content.dependency import resolve_load_order
+from pvz.content.loader import CATEGORY_SCHEMA, ModLoader
+from pvz.content.patcher import apply_patches
+from pvz.content.schema_validator import validate_against_schema
+from pvz.content.stats import STAT_CATEGORIES, StatTables
+from pvz.models import ContentRegistry, ModPackage
+
+
+SIM_TICKS = 200
+# Lane-grid scenario: entity counts well past a real wave, so all-pairs collision cost is visible.
+LANE_PARAMS = {"lanes": 6, "zombies": 1000, "projectiles": 2000}
+GRID_TICKS = 20
+NAIVE_TICKS = 1
+
+
+def _unpatched_registry(loader: ModLoader, ordered: list[ModPackage]) -> ContentRegistry:
+    registry = ContentRegistry()
+    for mod in ordered:
+        loader._load_content_for_mod(mod, registry)
+    return registry
+
+
+def _count_ops(path: Path) -> int:
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    return len(payload.get("ops", []) if isinstance(payload, dict) else payload)
+
+
+def _fresh_copy(registry: ContentRegistry) -> ContentRegistry:
+    # The patcher copies every nested container it touches, so only the item roots need copying.
+    return ContentRegistry(
+        categories={
+            category: {item_id: dataclasses.replace(item, data=dict(item.data)) for item_id, item in entries.items()}
+            for category, entries in registry.categories.items()
+        }
+    )
+
+
+def build_suite(mods_dir: Path, schemas_dir: Path) -> list[Benchmark]:
+    """Benchmarks over the mod set in `mods_dir`; fixtures are prepared once, up front."""
+    loader = ModLoader(mods_dir, schema_root=schemas_dir)
+    mod_map = loader.discover_mods()
+    ordered = resolve_load_order(mod_map)
+    base_registry = _unpatched_registry(loader, ordered)
+    item_count = sum(len(entries) for entries in base_registry.categories.values())
+
+    patch_files = [path for mod in ordered for path in sorted((mod.path / "patches").rglob("*.json"))]
+    patch_ops = sum(_count_ops(path) for path in patch_files)
+
+    validation_pairs = [
+        (item.data, loader.schemas.get(CATEGORY_SCHEMA[category]), str(item.source_path))
+        for category, entries in base_registry.categories.items()
+        if category in CATEGORY_SCHEMA
+        for item in entries.values()
+    ]
+
+    stats = StatTables.build(base_registry, loader.schemas)
+    plant_damage = stats.plants.column("damage")
+    zombie_hp = stats.zombies.column("max_hp")
+
+    def load(_: Any) -> None:
+        ModLoader(mods_dir, schema_root=schemas_dir).load()
+
+    def validate(_: Any) -> None:
+        for payload, schema, source in validation_pairs:
+            validate_against_schema(payload, schema, source=source)
+
+    def patch(registry: ContentRegistry) -> None:
+        for path in patch_files:
+            apply_patches(registry, path)
+
+    def resolve(_: Any) -> None:
+        resolve_load_order(mod_map, memoize=False)
+
+    def resolve_memoized(_: Any) -> None:
+        resolve_load_order(mod_map)
+
+    def battle() -> BattleState:
+        return BattleState(
+            sun=50_000,
+            lawns=5,
+            active_plants=[{"damage": damage} for damage in plant_damage],
+            active_zombies=[{"hp": hp * 20, "drain_sun": 1} for hp in zombie_hp],
+        )
+
+    def build_stats(_: Any) -> None:
+        StatTables.build(base_registry, loader.schemas)
+
+    def simulate(state: BattleState) -> None:
+        simulate_wave(state, duration_ticks=SIM_TICKS)
+
+    def scenario() -> Any:
+        return lane_scenario(stats, **LANE_PARAMS)
+
+    return [
+        Benchmark("loader.load", load, items=item_count, params={"mods": len(mod_map), "items": item_count}),
+        Benchmark("schema.validate", validate, items=len(validation_pairs)),
+        Benchmark(
+            "patcher.apply_patches",
+            patch,
+            setup=lambda: _fresh_copy(base_registry),
+            items=patch_ops,
+            params={"files": len(patch_files), "ops": patch_ops},
+        ),
+        Benchmark("dependency.resolve_load_order", resolve, number=10, items=len(mod_map)),
+        Benchmark("dependency.resolve_load_order.memo", resolve_memoized, number=100, items=len(mod_map)),
+        Benchmark(
+            "stats.build",
+            build_stats,
+            items=sum(len(getattr(stats, category)) for category in STAT_CATEGORIES),
+        ),
+        Benchmark(
+            "combat.simulate_wave",
+            simulate,
+            setup=battle,
+            items=SIM_TICKS,
+            params={"plants": len(stats.plants), "zombies": len(stats.zombies), "ticks": SIM_TICKS},
+        ),
+        Benchmark(
+            "combat.grid.step",
+            lambda state: run_grid(state, GRID_TICKS),
+            setup=scenario,
+            items=GRID_TICKS,
+            params={**LANE_PARAMS, "ticks": GRID_TICKS},
+        ),
+        Benchmark(
+            "combat.naive.step",
+            lambda state: run_naive(state, NAIVE_TICKS),
+            setup=scenario,
+            items=NAIVE_TICKS,
+            params={**LANE_PARAMS, "ticks": NAIVE_TICKS},
+        ),
+    ]
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import dataclasses
+from pathlib import Path
+
+from tools.gen_synthetic_mods import GeneratorConfig, generate
+
+
+SCALES: dict[str, GeneratorConfig] = {
+    "tiny": GeneratorConfig(mods=3, items_per_mod=40, patches_per_mod=5),
+    "small": GeneratorConfig(mods=10, items_per_mod=200, patches_per_mod=50),
+    "medium": GeneratorConfig(mods=50, items_per_mod=200, patches_per_mod=40),
+    "large": GeneratorConfig(mods=200, items_per_mod=500, patches_per_mod=25),
+}
+
+
+def generate_mod_set(root: Path, scale: GeneratorConfig, *, seed: int = 0) -> Path:
+    """Write the synthetic mod set for `scale` under `root` (see tools/gen_synthetic_mods.py)."""
+    generate(root, dataclasses.replace(scale, seed=seed))
+    return root
@@ -5,8 +5,12 @@ import json
 from pathlib import Path
 
 from pvz.combat import BattleState, simulate_wave
+from pvz.content.schema_validator import SchemaStore
+from pvz.content.stats import StatTable, StatTables
 from pvz.game import GameBootstrap
+from pvz.models import ContentItem
 from pvz.modes import CampaignService, ShopService, build_almanac
+from pvz.profiling import NULL_PROFILER, Profiler
 from pvz.scripting import HookContext, ScriptManager
 
 
@@ -17,6 +21,25 @@ def _parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--save", type=Path, default=Path("saves/profile.json"), help="save file path"
     )
+    parser.add_argument(
+        "--cache-dir", type=Path, default=None, help="directory for boot caches (localization)"
+    )
+    parser.add_argument(
+        "--freeze",
+        action="store_true",
+        help="make loaded content read-only after patches are applied",
+    )
+    parser.add_argument(
+        "--profile-boot",
+        action="store_true",
+        help="print a timing tree of the boot phases with per-mod and per-category totals",
+    )
+    parser.add_argument(
+        "--profile-trace",
+        type=Path,
+        default=None,
+        help="write boot timing spans as Chrome trace JSON (chrome://tracing, Perfetto)",
+    )
     parser.add_argument(
         "--validate-only",
         action="store_true",
@@ -30,29 +53,47 @@ def _parser() -> argparse.ArgumentParser:
     return parser
 
 
-def _pick_first(category: dict[str, dict]) -> dict | None:
-    if not category:
-        return None
-    return next(iter(category.values())).data
+def _first_stat(table: StatTable, category: dict[str, ContentItem], name: str, default: int) -> int:
+    item_id = next(iter(category), None)
+    if item_id is None:
+        return default
+    return int(table.get(item_id, name, default))
 
 
 def main() -> int:
     args = _parser().parse_args()
-    bootstrap = GameBootstrap(mods_dir=args.mods, schemas_dir=args.schemas, save_path=args.save)
+    profiler = Profiler() if args.profile_boot or args.profile_trace else NULL_PROFILER
+    bootstrap = GameBootstrap(
+        mods_dir=args.mods,
+        schemas_dir=args.schemas,
+        save_path=args.save,
+        cache_dir=args.cache_dir,
+        freeze=args.freeze,
+        profiler=profiler,
+    )
+
+    with profiler.span("boot"):
+        loaded = bootstrap.load_content()
+        script_manager = ScriptManager(profiler=profiler)
+        script_manager.load_from_mods(loaded.mods)
+        with profiler.span("on_startup"):
+            script_manager.run_hook("on_startup", context=HookContext(tick=0, payload={"phase": "startup"}))
+            script_manager.end_tick()
+        if not args.validate_only:
+            store = bootstrap.ensure_save()
+            save = store.load()
 
-    loaded = bootstrap.load_content()
     print(f"Loaded mods: {', '.join(loaded.mod_ids)}")
     print(f"Content categories: {', '.join(sorted(loaded.registry.categories.keys()))}")
-
-    script_manager = ScriptManager()
-    script_manager.load_from_mods(loaded.mods)
-    script_manager.run_hook("on_startup", context=HookContext(tick=0, payload={"phase": "startup"}))
+    if args.profile_boot:
+        print(profiler.report())
+    if args.profile_trace:
+        profiler.write_trace(args.profile_trace)
+        print(f"Boot trace written to {args.profile_trace}")
 
     if args.validate_only:
         return 0
 
-    store = bootstrap.ensure_save()
-    save = store.load()
     campaign = CampaignService(loaded.registry)
     shop = ShopService(loaded.registry)
 
@@ -62,15 +103,15 @@ def main() -> int:
     print(f"Almanac entries: {len(build_almanac(loaded.registry))}")
 
     if args.simulate:
-        plant = _pick_first(loaded.registry.categories.get("plants", {}))
-        zombie = _pick_first(loaded.registry.categories.get("zombies", {}))
+        registry = loaded.registry
+        stats = registry.stats or StatTables.build(registry, SchemaStore(args.schemas))
         state = BattleState(
             sun=int(current_level.get("sun_start", 50)),
             lawns=int(current_level.get("lawns", 5)),
-            active_plants=[{"damage": int((plant or {}).get("damage", 0))}],
+            active_plants=[{"damage": _first_stat(stats.plants, registry.categories.get("plants", {}), "damage", 0)}],
             active_zombies=[
                 {
-                    "hp": int((zombie or {}).get("max_hp", 30)),
+                    "hp": _first_stat(stats.zombies, registry.categories.get("zombies", {}), "max_hp", 30),
                     "drain_sun": 0,
                 }
             ],
@@ -1,5 +1,23 @@
 """Asset loader registry with pluggable handlers."""
 
-from pvz.assets.registry import AssetHandler, AssetRegistry, BuiltinJSONHandler
+from pvz.assets.cache import AssetCache, CacheStats
+from pvz.assets.prefetch import AssetPrefetcher, PrefetchJob, PrefetchPlan, plan_level_assets
+from pvz.assets.registry import (
+    AssetHandler,
+    AssetRegistry,
+    BuiltinJSONHandler,
+    StreamingAssetHandler,
+)
 
-__all__ = ["AssetHandler", "AssetRegistry", "BuiltinJSONHandler"]
+__all__ = [
+    "AssetCache",
+    "AssetHandler",
+    "AssetPrefetcher",
+    "AssetRegistry",
+    "BuiltinJSONHandler",
+    "CacheStats",
+    "PrefetchJob",
+    "PrefetchPlan",
+    "StreamingAssetHandler",
+    "plan_level_assets",
+]
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+from pvz.errors import AssetValidationError
+
+
+ARCHIVE_NAME = "assets.pak"
+MAGIC = b"PVZPAK\x00\x01"
+FORMAT_VERSION = 1
+DEFAULT_ALIGNMENT = 64
+
+# Formats that are already compressed; zlib rarely helps and costs a decode.
+INCOMPRESSIBLE_SUFFIXES = frozenset({".png", ".jpg", ".jpeg", ".webp", ".gif", ".ogg", ".mp3", ".m4a", ".zip"})
+
+_HEADER = struct.Struct("<8sIIQQ")
+
+
+@dataclass(frozen=True)
+class ArchiveEntry:
+    offset: int
+    size: int
+    stored_size: int
+    codec: str
+    crc32: int
+
+
+def _iter_files(assets_dir: Path, root: Path) -> Iterator[Path]:
+    """Files under `assets_dir` in sorted order, skipping symlinks that resolve outside `root`."""
+    if root not in assets_dir.resolve().parents:
+        return
+    for dirpath, dirnames, filenames in os.walk(assets_dir):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            path = Path(dirpath) / filename
+            if path.is_symlink() and root not in path.resolve().parents:
+                continue
+            yield path
+
+
+def write_archive(
+    mod_root: Path,
+    dest: Path | None = None,
+    *,
+    alignment: int = DEFAULT_ALIGNMENT,
+    compress: bool = True,
+    min_saving: float = 0.1,
+) -> Path:
+    """Pack `<mod_root>/assets/**` into one indexed archive.
+
+    Layout: fixed header, entry payloads each starting on an `alignment` boundary,
+    then a JSON table of contents keyed by mod-relative path (`assets/...`).
+    Symlinks pointing outside the mod are left out, as `AssetIndex` rejects them.
+    """
+    if alignment <= 0 or alignment & (alignment - 1):
+        raise ValueError("alignment must be a power of two")
+    dest = dest or mod_root / ARCHIVE_NAME
+    entries: dict[str, list] = {}
+
+    with dest.open("wb") as fp:
+        fp.write(b"\x00" * _HEADER.size)
+        for path in _iter_files(mod_root / "assets", mod_root.resolve()):
+            name = path.relative_to(mod_root).as_posix()
+            raw = path.read_bytes()
+            stored, codec = raw, "raw"
+            if compress and path.suffix.lower() not in INCOMPRESSIBLE_SUFFIXES and raw:
+                packed = zlib.compress(raw, 6)
+                if len(packed) <= len(raw) * (1.0 - min_saving):
+                    stored, codec = packed, "zlib"
+
+            offset = fp.tell()
+            padding = -offset % alignment
+            fp.write(b"\x00" * padding)
+            offset += padding
+            fp.write(stored)
+            entries[name] = [offset, len(raw), len(stored), codec, zlib.crc32(raw)]
+
+        toc = json.dumps({"entries": entries}, separators=(",", ":"), sort_keys=True).encode("utf-8")
+        toc_offset = fp.tell()
+        fp.write(toc)
+        fp.seek(0)
+        fp.write(_HEADER.pack(MAGIC, FORMAT_VERSION, alignment, toc_offset, len(toc)))
+    return dest
+
+
+class ModArchive:
+    """Read-only view of a packed archive; raw entries are zero-copy slices of one mmap."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with path.open("rb") as fp:
+            self._map = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        if len(self._view) < _HEADER.size:
+            raise AssetValidationError(f"{path}: truncated asset archive")
+        magic, version, self.alignment, toc_offset, toc_size = _HEADER.unpack_from(self._view)
+        if magic != MAGIC:
+            raise AssetValidationError(f"{path}: not an asset archive")
+        if version != FORMAT_VERSION:
+            raise AssetValidationError(f"{path}: unsupported asset archive version {version}")
+        toc = json.loads(bytes(self._view[toc_offset : toc_offset + toc_size]))
+        self.entries: dict[str, ArchiveEntry] = {
+            name: ArchiveEntry(*fields) for name, fields in toc["entries"].items()
+        }
+
+    @classmethod
+    def for_mod(cls, mod_root: Path) -> "ModArchive | None":
+        path = mod_root / ARCHIVE_NAME
+        return cls(path) if path.is_file() else None
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def names(self) -> list[str]:
+        return list(self.entries)
+
+    def size(self, name: str) -> int:
+        return self.entries[name].size
+
+    def read(self, name: str) -> memoryview | bytes:
+        entry = self.entries[name]
+        stored = self._view[entry.offset : entry.offset + entry.stored_size]
+        if entry.codec == "raw":
+            return stored
+        if entry.codec == "zlib":
+            return zlib.decompress(stored)
+        raise AssetValidationError(f"{self.path}: unsupported codec `{entry.codec}` for {name}")
+
+    def verify(self) -> list[str]:
+        return [name for name in self.entries if zlib.crc32(self.read(name)) != self.entries[name].crc32]
+
+    def close(self) -> None:
+        try:
+            self._view.release()
+            self._map.close()
+        except BufferError:
+            # Entry views handed out by read() are still alive; the map is freed with them.
+            pass
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import struct
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+from typing import Any
+
+from pvz.errors import AssetValidationError
+from pvz.models import ContentRegistry
+
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def read_png_size(data: bytes) -> tuple[int, int]:
+    if len(data) < 24 or data[:8] != PNG_SIGNATURE or data[12:16] != b"IHDR":
+        raise AssetValidationError("atlas textures must be PNG files")
+    width, height = struct.unpack(">II", data[16:24])
+    return width, height
+
+
+@dataclass(frozen=True)
+class TextureInfo:
+    width: int
+    height: int
+    digest: str
+
+    @classmethod
+    def from_file(cls, path: Path) -> "TextureInfo":
+        data = path.read_bytes()
+        width, height = read_png_size(data)
+        return cls(width=width, height=height, digest=hashlib.sha1(data).hexdigest())
+
+
+@dataclass
+class Placement:
+    page: int
+    x: int
+    y: int
+    width: int
+    height: int
+    digest: str
+
+
+@dataclass
+class Shelf:
+    y: int
+    height: int
+    cursor: int = 0
+
+
+@dataclass
+class AtlasLayout:
+    page_size: int = 2048
+    padding: int = 1
+    pages: list[list[Shelf]] = field(default_factory=list)
+    placements: dict[str, Placement] = field(default_factory=dict)
+    dirty_pages: set[int] = field(default_factory=set)
+
+    def uv(self, name: str) -> tuple[float, float, float, float]:
+        p = self.placements[name]
+        size = float(self.page_size)
+        return (p.x / size, p.y / size, (p.x + p.width) / size, (p.y + p.height) / size)
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "page_size": self.page_size,
+            "padding": self.padding,
+            "pages": [[asdict(shelf) for shelf in shelves] for shelves in self.pages],
+            "placements": {name: asdict(p) for name, p in sorted(self.placements.items())},
+            "uv": {name: list(self.uv(name)) for name in sorted(self.placements)},
+        }
+
+    @classmethod
+    def from_json(cls, payload: dict[str, Any]) -> "AtlasLayout":
+        return cls(
+            page_size=payload["page_size"],
+            padding=payload["padding"],
+            pages=[[Shelf(**shelf) for shelf in shelves] for shelves in payload["pages"]],
+            placements={name: Placement(**p) for name, p in payload["placements"].items()},
+        )
+
+    def _allocate(self, width: int, height: int) -> tuple[int, int, int]:
+        padded_w, padded_h = width + self.padding, height + self.padding
+        if padded_w > self.page_size or padded_h > self.page_size:
+            raise AssetValidationError(f"texture {width}x{height} does not fit atlas page {self.page_size}")
+
+        for page_index, shelves in enumerate(self.pages):
+            best: Shelf | None = None
+            for shelf in shelves:
+                fits = shelf.height >= padded_h and shelf.cursor + padded_w <= self.page_size
+                if fits and (best is None or shelf.height < best.height):
+                    best = shelf
+            if best is None:
+                top = shelves[-1].y + shelves[-1].height if shelves else 0
+                if top + padded_h > self.page_size:
+                    continue
+                best = Shelf(y=top, height=padded_h)
+                shelves.append(best)
+            x = best.cursor
+            best.cursor += padded_w
+            return page_index, x, best.y
+
+        self.pages.append([Shelf(y=0, height=padded_h, cursor=padded_w)])
+        return len(self.pages) - 1, 0, 0
+
+
+def pack_textures(
+    textures: dict[str, TextureInfo],
+    *,
+    previous: AtlasLayout | None = None,
+    page_size: int = 2048,
+    padding: int = 1,
+) -> AtlasLayout:
+    """Shelf-pack textures into fixed-size pages.
+
+    With `previous`, textures whose size is unchanged keep their slot, so editing one
+    animation config only places its new frames; `dirty_pages` lists pages whose
+    pixels must be recomposed because a placement on them was added, removed or
+    changed. Slots of removed or resized textures are not reclaimed until a full
+    rebuild (previous=None), but their pages are recomposed to clear the old pixels.
+    """
+    if previous is not None and (previous.page_size, previous.padding) == (page_size, padding):
+        layout = AtlasLayout(page_size=page_size, padding=padding, pages=copy.deepcopy(previous.pages))
+        for name, placement in previous.placements.items():
+            info = textures.get(name)
+            if info is None or (info.width, info.height) != (placement.width, placement.height):
+                layout.dirty_pages.add(placement.page)
+                continue
+            layout.placements[name] = replace(placement, digest=info.digest)
+            if info.digest != placement.digest:
+                layout.dirty_pages.add(placement.page)
+    else:
+        layout = AtlasLayout(page_size=page_size, padding=padding)
+
+    pending = [name for name in textures if name not in layout.placements]
+    pending.sort(key=lambda name: (-textures[name].height, -textures[name].width, name))
+    for name in pending:
+        info = textures[name]
+        page, x, y = layout._allocate(info.width, info.height)
+        layout.placements[name] = Placement(page, x, y, info.width, info.height, info.digest)
+        layout.dirty_pages.add(page)
+    return layout
+
+
+def load_layout(path: Path) -> AtlasLayout:
+    return AtlasLayout.from_json(json.loads(path.read_text(encoding="utf-8")))
+
+
+def texture_key(mod_id: str, ref: str) -> str:
+    return f"{mod_id}/{ref}"
+
+
+def collect_frame_textures(registry: ContentRegistry, *, mod_paths: dict[str, Path]) -> dict[str, Path]:
+    """Map every local `animation_configs` frame texture to its file on disk."""
+    textures: dict[str, Path] = {}
+    for item in registry.categories.get("animation_configs", {}).values():
+        root = mod_paths.get(item.source_mod)
+        if root is None:
+            continue
+        for frame in item.data.get("frames", []):
+            ref = frame.get("texture")
+            if isinstance(ref, str) and ref.startswith("assets/"):
+                textures.setdefault(texture_key(item.source_mod, ref), root / ref)
+    return textures
+
+
+def page_name(index: int) -> str:
+    return f"page_{index}.png"
+
+
+def apply_atlas(registry: ContentRegistry, layout: AtlasLayout) -> int:
+    """Attach atlas page + UV coordinates to every packed frame; returns frames updated."""
+    updated = 0
+    for item in registry.categories.get("animation_configs", {}).values():
+        frames = item.data.get("frames")
+        if not frames:
+            continue
+        # Frame lists may be shared with other items (pvz.content.dedup); rebuild instead of mutating.
+        patched = list(frames)
+        for index, frame in enumerate(frames):
+            ref = frame.get("texture")
+            if not isinstance(ref, str):
+                continue
+            key = texture_key(item.source_mod, ref)
+            if key not in layout.placements:
+                continue
+            placement = layout.placements[key]
+            patched[index] = {
+                **frame,
+                "atlas": {
+                    "page": page_name(placement.page),
+                    "rect": [placement.x, placement.y, placement.width, placement.height],
+                    "uv": list(layout.uv(key)),
+                },
+            }
+            updated += 1
+        item.data["frames"] = patched
+    return updated
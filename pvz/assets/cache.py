@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    refs: int = 0
+    pinned: bool = False
+
+    @property
+    def evictable(self) -> bool:
+        return self.refs == 0 and not self.pinned
+
+
+class AssetCache:
+    """Size-bounded LRU of decoded assets; referenced or pinned entries are never evicted."""
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def lookup(self, key: str, *, acquire: bool = False, pin: bool = False) -> tuple[bool, Any]:
+        """Return `(found, value)`; `acquire`/`pin` apply to a hit under the same lock."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            if acquire:
+                entry.refs += 1
+            if pin:
+                entry.pinned = True
+            return True, entry.value
+
+    def put(self, key: str, value: Any, size: int, *, acquire: bool = False, pin: bool = False) -> None:
+        """Insert or replace `key`; `pin` marks it before eviction runs, so it cannot be evicted on arrival."""
+        with self._lock:
+            entry = _Entry(value=value, size=size)
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size_bytes -= previous.size
+                entry.refs, entry.pinned = previous.refs, previous.pinned
+            if acquire:
+                entry.refs += 1
+            entry.pinned = entry.pinned or pin
+            self._entries[key] = entry
+            self.size_bytes += size
+            self._shrink()
+
+    def release(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries[key]
+            if entry.refs == 0:
+                raise ValueError(f"asset released more times than acquired: {key}")
+            entry.refs -= 1
+            self._shrink()
+
+    def pin(self, key: str) -> None:
+        with self._lock:
+            self._entries[key].pinned = True
+
+    def unpin(self, key: str) -> None:
+        with self._lock:
+            self._entries[key].pinned = False
+            self._shrink()
+
+    def invalidate(self, key: str) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not entry.evictable:
+                return False
+            del self._entries[key]
+            self.size_bytes -= entry.size
+            return True
+
+    def _shrink(self) -> None:
+        if self.size_bytes <= self.max_bytes:
+            return
+        for key in list(self._entries):
+            entry = self._entries[key]
+            if not entry.evictable:
+                continue
+            del self._entries[key]
+            self.size_bytes -= entry.size
+            self.stats.evictions += 1
+            if self.size_bytes <= self.max_bytes:
+                return
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import CancelledError, Executor, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable
+
+from pvz.assets.registry import AssetRegistry
+from pvz.models import ContentRegistry
+
+
+@dataclass
+class PrefetchPlan:
+    level_id: str
+    entities: list[str] = field(default_factory=list)
+    paths: list[Path] = field(default_factory=list)
+    remote: list[str] = field(default_factory=list)
+
+
+def _level_entities(registry: ContentRegistry, level: dict[str, Any], unlocked_plants: Iterable[str]) -> list[str]:
+    entities: dict[str, None] = {}
+    for zombie_id in level.get("zombie_pool", []):
+        entities[zombie_id] = None
+    for wave in level.get("waves", []):
+        entities[wave["zombie_id"]] = None
+
+    plants = registry.categories.get("plants", {})
+    for plant_id in unlocked_plants:
+        entities[plant_id] = None
+        plant = plants.get(plant_id)
+        if plant is not None and plant.data.get("projectile_id"):
+            entities[plant.data["projectile_id"]] = None
+    return list(entities)
+
+
+def plan_level_assets(
+    registry: ContentRegistry,
+    level_id: str,
+    *,
+    mod_paths: dict[str, Path],
+    unlocked_plants: Iterable[str] = (),
+) -> PrefetchPlan:
+    """Collect the animation and combat audio assets a level will touch.
+
+    Local refs are resolved against the mod that defined the referencing item;
+    http(s) refs are listed in `remote` for callers with a network fetcher.
+    """
+    level = registry.get("levels", level_id).data
+    plan = PrefetchPlan(level_id=level_id, entities=_level_entities(registry, level, unlocked_plants))
+    wanted = set(plan.entities)
+    # Remote refs dedup by URL, local ones by resolved path: two mods may ship the same relative name.
+    seen: set[str | Path] = set()
+
+    def add(ref: Any, source_mod: str) -> None:
+        if not isinstance(ref, str):
+            return
+        if ref.startswith(("http://", "https://")):
+            key, bucket = ref, plan.remote
+        elif source_mod in mod_paths:
+            key, bucket = mod_paths[source_mod] / ref, plan.paths
+        else:
+            return
+        if key not in seen:
+            seen.add(key)
+            bucket.append(key)
+
+    for item in registry.categories.get("animation_configs", {}).values():
+        if item.data.get("target_id") not in wanted:
+            continue
+        for frame in item.data.get("frames", []):
+            add(frame.get("texture"), item.source_mod)
+        for event in item.data.get("sound_events", []):
+            add(event.get("sound_url"), item.source_mod)
+
+    for item in registry.categories.get("audio_events", {}).values():
+        if "combat" in item.data.get("tags", []):
+            add(item.data.get("asset"), item.source_mod)
+
+    return plan
+
+
+@dataclass
+class PrefetchResult:
+    loaded: list[Path] = field(default_factory=list)
+    failed: dict[Path, str] = field(default_factory=dict)
+    cancelled: int = 0
+
+
+class PrefetchJob:
+    def __init__(self, futures: dict[Future, Path], cancel_event: threading.Event) -> None:
+        self._futures = futures
+        self._cancel_event = cancel_event
+
+    @property
+    def done(self) -> bool:
+        return all(future.done() for future in self._futures)
+
+    def cancel(self) -> None:
+        """Stop loading; assets already decoded stay in the cache."""
+        self._cancel_event.set()
+        for future in self._futures:
+            future.cancel()
+
+    def wait(self, timeout: float | None = None) -> PrefetchResult:
+        wait(self._futures, timeout=timeout)
+        result = PrefetchResult()
+        for future, path in self._futures.items():
+            if not future.done():
+                continue
+            try:
+                loaded = future.result()
+            except CancelledError:
+                result.cancelled += 1
+            except Exception as exc:
+                result.failed[path] = str(exc)
+            else:
+                if loaded:
+                    result.loaded.append(path)
+                else:
+                    result.cancelled += 1
+        return result
+
+
+class AssetPrefetcher:
+    def __init__(
+        self,
+        assets: AssetRegistry,
+        *,
+        max_workers: int = 4,
+        executor: Executor | None = None,
+    ) -> None:
+        self.assets = assets
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="pvz-prefetch"
+        )
+
+    def _load(self, path: Path, cancel_event: threading.Event) -> bool:
+        if cancel_event.is_set():
+            return False
+        self.assets.load_path(path)
+        return True
+
+    def start(self, plan: PrefetchPlan) -> PrefetchJob:
+        cancel_event = threading.Event()
+        futures: dict[Future, Path] = {}
+        for path in plan.paths:
+            if os.fspath(path) in self.assets.cache:
+                continue
+            futures[self._executor.submit(self._load, path, cancel_event)] = path
+        return PrefetchJob(futures, cancel_event)
+
+    def shutdown(self) -> None:
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self) -> "AssetPrefetcher":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 import json
+import mmap
+import os
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Any, Protocol
+from typing import Any, ClassVar, Iterator, Protocol
+
+from pvz.assets.archive import ModArchive
+from pvz.assets.cache import AssetCache
 
 
 class AssetHandler(Protocol):
@@ -14,8 +20,18 @@ class AssetHandler(Protocol):
         ...
 
 
+class StreamingAssetHandler(Protocol):
+    def can_handle(self, path: Path) -> bool:
+        ...
+
+    def load_stream(self, chunks: Iterator[bytes], *, path: Path) -> Any:
+        ...
+
+
 @dataclass
 class BuiltinJSONHandler:
+    suffixes: ClassVar[tuple[str, ...]] = (".json",)
+
     def can_handle(self, path: Path) -> bool:
         return path.suffix.lower() == ".json"
 
@@ -23,16 +39,128 @@ class BuiltinJSONHandler:
         return json.loads(data.decode("utf-8"))
 
 
+def map_file(path: Path) -> memoryview | bytes:
+    """Read-only zero-copy view of a file; the mapping lives as long as the view.
+
+    Empty files cannot be mapped and come back as `b""`.
+    """
+    with path.open("rb") as fp:
+        if os.fstat(fp.fileno()).st_size == 0:
+            return b""
+        mapped = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+    return memoryview(mapped)
+
+
+def iter_chunks(path: Path, chunk_size: int) -> Iterator[bytes]:
+    with path.open("rb") as fp:
+        yield from iter(partial(fp.read, chunk_size), b"")
+
+
 class AssetRegistry:
-    def __init__(self) -> None:
-        self._handlers: list[AssetHandler] = []
+    """Dispatches asset loads to handlers.
 
-    def register(self, handler: AssetHandler) -> None:
-        self._handlers.append(handler)
+    Handlers declaring `suffixes` are looked up by file suffix; others are probed
+    in registration order after the suffix matches. Handlers with `load_stream`
+    receive the file in chunks, and files of at least `mmap_threshold` bytes are
+    memory-mapped when unhandled or when the handler sets `accepts_buffer = True`.
+    Loaded values are kept in `cache`, accounted by their on-disk size. Paths
+    under a mounted mod root are served from that mod's packed archive first.
+    """
 
-    def load_path(self, path: Path) -> Any:
-        raw = path.read_bytes()
-        for handler in self._handlers:
+    def __init__(
+        self,
+        *,
+        mmap_threshold: int = 1 << 20,
+        chunk_size: int = 1 << 16,
+        cache: AssetCache | None = None,
+    ) -> None:
+        self.mmap_threshold = mmap_threshold
+        self.chunk_size = chunk_size
+        self.cache = cache if cache is not None else AssetCache()
+        self._by_suffix: dict[str, list[AssetHandler | StreamingAssetHandler]] = {}
+        self._fallback: list[AssetHandler | StreamingAssetHandler] = []
+        self._mounts: dict[Path, ModArchive] = {}
+
+    def mount(self, mod_root: Path, archive: ModArchive | None = None) -> bool:
+        """Serve `<mod_root>/assets/...` paths from a packed archive if the mod has one."""
+        archive = archive or ModArchive.for_mod(mod_root)
+        if archive is None:
+            return False
+        self._mounts[mod_root] = archive
+        return True
+
+    def _archive_entry(self, path: Path) -> tuple[ModArchive, str] | None:
+        for root, archive in self._mounts.items():
+            if not path.is_relative_to(root):
+                continue
+            name = path.relative_to(root).as_posix()
+            if name in archive:
+                return archive, name
+        return None
+
+    def register(self, handler: AssetHandler | StreamingAssetHandler) -> None:
+        suffixes = getattr(handler, "suffixes", None)
+        if not suffixes:
+            self._fallback.append(handler)
+            return
+        for suffix in suffixes:
+            self._by_suffix.setdefault(suffix.lower(), []).append(handler)
+
+    def handler_for(self, path: Path) -> AssetHandler | StreamingAssetHandler | None:
+        for handler in self._by_suffix.get(path.suffix.lower(), ()):
             if handler.can_handle(path):
-                return handler.load(raw, path=path)
-        return raw
+                return handler
+        for handler in self._fallback:
+            if handler.can_handle(path):
+                return handler
+        return None
+
+    def load_path(self, path: Path) -> Any:
+        return self._load_cached(path, acquire=False)
+
+    def acquire(self, path: Path) -> Any:
+        """Load through the cache and hold a reference until `release`."""
+        return self._load_cached(path, acquire=True)
+
+    def release(self, path: Path) -> None:
+        self.cache.release(os.fspath(path))
+
+    def pin(self, path: Path) -> Any:
+        """Load through the cache and keep the asset resident until `cache.unpin`, even over budget."""
+        return self._load_cached(path, acquire=False, pin=True)
+
+    def _load_cached(self, path: Path, *, acquire: bool, pin: bool = False) -> Any:
+        key = os.fspath(path)
+        found, value = self.cache.lookup(key, acquire=acquire, pin=pin)
+        if found:
+            return value
+        value, size = self._load(path)
+        self.cache.put(key, value, size, acquire=acquire, pin=pin)
+        return value
+
+    def _load(self, path: Path) -> tuple[Any, int]:
+        handler = self.handler_for(path)
+        wants_buffer = handler is None or getattr(handler, "accepts_buffer", False)
+        packed = self._archive_entry(path) if self._mounts else None
+
+        if packed is not None:
+            archive, name = packed
+            data: bytes | memoryview = archive.read(name)
+            size = len(data) if isinstance(data, bytes) else data.nbytes
+            if handler is not None and hasattr(handler, "load_stream"):
+                chunks = (data[i : i + self.chunk_size] for i in range(0, size, self.chunk_size))
+                return handler.load_stream(chunks, path=path), size
+            if not wants_buffer and isinstance(data, memoryview):
+                data = bytes(data)
+        else:
+            size = path.stat().st_size
+            if handler is not None and hasattr(handler, "load_stream"):
+                return handler.load_stream(iter_chunks(path, self.chunk_size), path=path), size
+            if wants_buffer and size >= self.mmap_threshold:
+                data = map_file(path)
+            else:
+                data = path.read_bytes()
+
+        if handler is None:
+            return data, size
+        return handler.load(data, path=path), size
@@ -1,5 +1,6 @@
 """Battle simulation primitives for lane-based combat."""
 
+from pvz.combat.grid import LaneGrid, Projectile, step_projectiles
 from pvz.combat.sim import BattleState, simulate_wave
 
-__all__ = ["BattleState", "simulate_wave"]
+__all__ = ["BattleState", "LaneGrid", "Projectile", "simulate_wave", "step_projectiles"]
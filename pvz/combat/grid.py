@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from typing import Collection, Mapping, MutableSequence, Sequence
+
+
+@dataclass
+class Projectile:
+    """A shot travelling towards +x; `pierce` is how many targets it passes through after the first."""
+
+    lane: int
+    x: float
+    speed: float
+    damage: int
+    pierce: int = 0
+    ttl: int = 1
+    hits: set[int] = field(default_factory=set)
+
+
+class LaneGrid:
+    """Zombie positions per lane, kept sorted by x, for broad-phase hit tests.
+
+    Zombies are dense integer handles (rows of the simulator's hp/speed arrays).
+    x runs from 0 at the house to `width` at the far edge, and the lawn is split
+    into `columns` cells of `cell_width`. Every lane stores parallel, x-sorted
+    lists of positions and handles, plus each zombie's position before the
+    last `advance`. A range or cell query is therefore two binary searches, and
+    hit tests only look at the window a lane's zombies could have crossed.
+    """
+
+    def __init__(self, lanes: int, *, columns: int = 9, cell_width: float = 1.0) -> None:
+        self.lanes = lanes
+        self.columns = columns
+        self.cell_width = cell_width
+        self._xs: list[list[float]] = [[] for _ in range(lanes)]
+        self._ids: list[list[int]] = [[] for _ in range(lanes)]
+        self._prev: list[list[float]] = [[] for _ in range(lanes)]
+        self._reach = [0.0] * lanes
+        self._where: dict[int, tuple[int, float]] = {}
+
+    @property
+    def width(self) -> float:
+        return self.columns * self.cell_width
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, zombie: object) -> bool:
+        return zombie in self._where
+
+    def add(self, zombie: int, lane: int, x: float) -> None:
+        if zombie in self._where:
+            raise ValueError(f"zombie {zombie} is already on the grid")
+        xs = self._xs[lane]
+        index = bisect_right(xs, x)
+        xs.insert(index, x)
+        self._ids[lane].insert(index, zombie)
+        self._prev[lane].insert(index, x)
+        self._where[zombie] = (lane, x)
+
+    def _locate(self, zombie: int) -> tuple[int, int]:
+        lane, x = self._where[zombie]
+        ids = self._ids[lane]
+        index = bisect_left(self._xs[lane], x)
+        while ids[index] != zombie:
+            index += 1
+        return lane, index
+
+    def remove(self, zombie: int) -> None:
+        lane, index = self._locate(zombie)
+        del self._xs[lane][index]
+        del self._ids[lane][index]
+        del self._prev[lane][index]
+        del self._where[zombie]
+
+    def move(self, zombie: int, x: float) -> None:
+        lane, _ = self._where[zombie]
+        self.remove(zombie)
+        self.add(zombie, lane, x)
+
+    def position(self, zombie: int) -> tuple[int, float]:
+        return self._where[zombie]
+
+    def lane(self, lane: int) -> list[tuple[int, float]]:
+        """`(zombie, x)` pairs of one lane, nearest the house first."""
+        return list(zip(self._ids[lane], self._xs[lane]))
+
+    def front(self, lane: int) -> int | None:
+        ids = self._ids[lane]
+        return ids[0] if ids else None
+
+    def cell_of(self, x: float) -> int:
+        return int(x // self.cell_width)
+
+    def in_cell(self, lane: int, cell: int) -> list[int]:
+        xs = self._xs[lane]
+        lower = cell * self.cell_width
+        return self._ids[lane][bisect_left(xs, lower) : bisect_left(xs, lower + self.cell_width)]
+
+    def query(self, lane: int, lower: float, upper: float) -> list[int]:
+        """Zombies with `lower < x <= upper`, in ascending x."""
+        xs = self._xs[lane]
+        return self._ids[lane][bisect_right(xs, lower) : bisect_right(xs, upper)]
+
+    def sweep(self, lane: int, lower: float, upper: float, limit: int, skip: Collection[int] = ()) -> list[int]:
+        """Up to `limit` zombies in `(lower, upper]`, nearest to `lower` first, ignoring `skip`."""
+        xs = self._xs[lane]
+        ids = self._ids[lane]
+        index = bisect_right(xs, lower)
+        end = bisect_right(xs, upper)
+        found: list[int] = []
+        while index < end and len(found) < limit:
+            zombie = ids[index]
+            if zombie not in skip:
+                found.append(zombie)
+            index += 1
+        return found
+
+    def crossings(
+        self, lane: int, x: float, distance: float, limit: int, skip: Collection[int] = ()
+    ) -> list[int]:
+        """Up to `limit` zombies, not in `skip`, that a shot moving from `x` to `x + distance` met last tick.
+
+        A zombie counts when it started the tick ahead of the shot and ended it
+        no further than `x + distance`. Hits come back in the order the shot
+        reaches them, i.e. by when the gap between the two closes.
+        """
+        xs = self._xs[lane]
+        prev = self._prev[lane]
+        ids = self._ids[lane]
+        # No zombie in the lane moved further than `_reach`, so earlier ones started behind `x`.
+        start = bisect_right(xs, x - self._reach[lane])
+        end = bisect_right(xs, x + distance)
+        met: list[tuple[float, int]] = []
+        for index in range(start, end):
+            before = prev[index]
+            zombie = ids[index]
+            if before > x and zombie not in skip:
+                met.append(((before - x) / (distance + before - xs[index]), zombie))
+        met.sort()
+        return [zombie for _, zombie in met[:limit]]
+
+    def advance(self, speed: Sequence[float] | Mapping[int, float], ticks: float = 1.0) -> list[float]:
+        """Move every zombie `speed[zombie] * ticks` towards the house; returns each lane's largest step.
+
+        Positions change by similar amounts, so lanes stay nearly sorted and the
+        stable re-sort is close to linear.
+        """
+        where = self._where
+        reach = [0.0] * self.lanes
+        for lane in range(self.lanes):
+            ids = self._ids[lane]
+            if not ids:
+                continue
+            steps = [speed[zombie] * ticks for zombie in ids]
+            before = self._xs[lane]
+            moved = [x - step for x, step in zip(before, steps)]
+            order = sorted(range(len(ids)), key=moved.__getitem__)
+            self._xs[lane] = xs = [moved[index] for index in order]
+            self._prev[lane] = [before[index] for index in order]
+            self._ids[lane] = ids = [ids[index] for index in order]
+            for zombie, x in zip(ids, xs):
+                where[zombie] = (lane, x)
+            reach[lane] = max(steps)
+        self._reach = reach
+        return list(reach)
+
+
+def step_projectiles(
+    grid: LaneGrid,
+    projectiles: list[Projectile],
+    hp: MutableSequence[int] | dict[int, int],
+) -> list[Projectile]:
+    """Move every projectile one tick and apply its hits; returns the projectiles still in flight.
+
+    Call after `LaneGrid.advance`. A projectile hits the zombies whose path
+    crossed its own this tick (see `LaneGrid.crossings`), in the order it meets
+    them, up to `pierce + 1` per projectile over its lifetime, and each zombie
+    at most once. Zombies whose hp drops to 0 or below are removed from the grid.
+    """
+    width = grid.width
+    flying: list[Projectile] = []
+    for projectile in projectiles:
+        end = projectile.x + projectile.speed
+        budget = projectile.pierce + 1 - len(projectile.hits)
+        for zombie in grid.crossings(projectile.lane, projectile.x, projectile.speed, budget, projectile.hits):
+            projectile.hits.add(zombie)
+            hp[zombie] -= projectile.damage
+            if hp[zombie] <= 0:
+                grid.remove(zombie)
+        projectile.x = end
+        projectile.ttl -= 1
+        if len(projectile.hits) <= projectile.pierce and projectile.ttl > 0 and end <= width:
+            flying.append(projectile)
+    return flying
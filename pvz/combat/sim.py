@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -14,20 +15,51 @@ class BattleState:
 
 
 def simulate_wave(state: BattleState, *, duration_ticks: int = 10) -> dict[str, Any]:
-    """Small deterministic simulation stub for validating content wiring."""
-    for _ in range(duration_ticks):
-        state.tick += 1
+    """Small deterministic simulation stub for validating content wiring.
 
-        for plant in state.active_plants:
-            plant_damage = int(plant.get("damage", 0))
-            if state.active_zombies and plant_damage > 0:
-                state.active_zombies[0]["hp"] = max(0, state.active_zombies[0].get("hp", 0) - plant_damage)
+    Each tick every plant hits the front zombie, dead zombies are removed and the
+    survivors drain sun. Plant and zombie stats are read and coerced once before
+    the tick loop; hp lives in a local list and is written back at the end.
+    """
+    # Every positive hit lands on the same front zombie, clamped at 0, so a tick's hits add up.
+    volley = sum(damage for damage in (int(plant.get("damage", 0)) for plant in state.active_plants) if damage > 0)
+    zombies = state.active_zombies
+    hp = [zombie.get("hp", 0) for zombie in zombies]
+    drain = [int(zombie.get("drain_sun", 0)) for zombie in zombies]
+    alive = deque(range(len(zombies)))
+    hit: set[int] = set()
+    # With no negative drains the per-zombie `max(0, ...)` steps collapse into one subtraction.
+    total_drain = sum(drain) if all(value >= 0 for value in drain) else None
+    sun = state.sun
 
-        state.active_zombies = [z for z in state.active_zombies if z.get("hp", 0) > 0]
+    for tick in range(duration_ticks):
+        if alive and volley:
+            front = alive[0]
+            hp[front] = max(0, hp[front] - volley)
+            hit.add(front)
 
-        for zombie in state.active_zombies:
-            state.sun = max(0, state.sun - int(zombie.get("drain_sun", 0)))
+        if tick == 0:
+            alive = deque(index for index in alive if hp[index] > 0)
+            if total_drain is not None:
+                total_drain = sum(drain[index] for index in alive)
+        elif alive and hp[alive[0]] <= 0:
+            # Only the front zombie takes damage, so it is the only one that can die after the first tick.
+            if total_drain is not None:
+                total_drain -= drain[alive[0]]
+            alive.popleft()
 
+        if total_drain is not None:
+            sun = max(0, sun - total_drain)
+        else:
+            for index in alive:
+                sun = max(0, sun - drain[index])
+
+    for index in hit:
+        zombies[index]["hp"] = hp[index]
+    if duration_ticks > 0:
+        state.active_zombies = [zombies[index] for index in alive]
+    state.tick += max(0, duration_ticks)
+    state.sun = sun
     return {
         "tick": state.tick,
         "sun": state.sun,
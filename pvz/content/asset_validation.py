@@ -1,45 +1,113 @@
 from __future__ import annotations
 
-from pathlib import Path
+import os
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
 from typing import Iterable
 
+from pvz.assets.archive import ModArchive
 from pvz.errors import AssetValidationError
 
 
-def _is_http_url(value: str) -> bool:
-    return value.startswith("http://") or value.startswith("https://")
+@dataclass
+class AssetIndex:
+    """One-time listing of a mod's `assets/` tree and packed archive; refs are checked with set lookups."""
+
+    mod_root: Path
+    paths: frozenset[str]
+    escaping: frozenset[str] = frozenset()
+    _verdicts: dict[str, str | None] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def build(cls, mod_root: Path) -> "AssetIndex":
+        root = mod_root.resolve()
+        paths: set[str] = set()
+        escaping: set[str] = set()
+        assets_dir = root / "assets"
+        if assets_dir.is_dir() and root not in assets_dir.resolve().parents:
+            # `assets` itself links out of the mod: nothing under it is a valid ref.
+            escaping.add("assets")
+        elif assets_dir.is_dir():
+            paths.add("assets")
+            visited = {assets_dir}
+            stack = [(assets_dir, "assets")]
+            while stack:
+                directory, rel = stack.pop()
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        entry_rel = f"{rel}/{entry.name}"
+                        target = Path(entry.path)
+                        if entry.is_symlink():
+                            target = target.resolve()
+                            if root not in target.parents:
+                                escaping.add(entry_rel)
+                                continue
+                            if not target.exists():
+                                continue
+                        if entry.is_dir():
+                            if target in visited:
+                                continue
+                            visited.add(target)
+                            stack.append((target, entry_rel))
+                        paths.add(entry_rel)
+
+        archive = ModArchive.for_mod(root)
+        if archive is not None:
+            for name in archive.names():
+                paths.add(name)
+                parent = name.rpartition("/")[0]
+                while parent and parent not in paths:
+                    paths.add(parent)
+                    parent = parent.rpartition("/")[0]
+            archive.close()
+        return cls(mod_root=mod_root, paths=frozenset(paths), escaping=frozenset(escaping))
 
+    def check(self, value: str) -> str | None:
+        """Return the reason a local ref is invalid, or None; results are memoized per ref."""
+        try:
+            return self._verdicts[value]
+        except KeyError:
+            pass
 
-def _validate_local_asset_path(value: str, *, mod_root: Path, source: str) -> None:
-    asset_path = Path(value)
-    if asset_path.is_absolute():
-        raise AssetValidationError(f"{source}: absolute asset path is not allowed: {value}")
-    if ".." in asset_path.parts:
-        raise AssetValidationError(f"{source}: parent traversal is not allowed: {value}")
-    if not value.startswith("assets/"):
-        raise AssetValidationError(f"{source}: local asset refs must start with assets/: {value}")
+        parts = PurePosixPath(value).parts
+        if value.startswith("/"):
+            verdict: str | None = "absolute asset path is not allowed"
+        elif ".." in parts:
+            verdict = "parent traversal is not allowed"
+        elif not value.startswith("assets/"):
+            verdict = "local asset refs must start with assets/"
+        else:
+            normalized = "/".join(parts)
+            # Escaping wins over `paths` so a stale or crafted archive entry can never whitelist it.
+            if normalized in self.escaping or "assets" in self.escaping:
+                verdict = "asset path escapes mod root"
+            elif normalized in self.paths:
+                verdict = None
+            else:
+                verdict = "missing asset file"
+        self._verdicts[value] = verdict
+        return verdict
 
-    resolved = (mod_root / asset_path).resolve()
-    mod_root_resolved = mod_root.resolve()
-    if mod_root_resolved not in resolved.parents and resolved != mod_root_resolved:
-        raise AssetValidationError(f"{source}: asset path escapes mod root: {value}")
-    if not resolved.exists():
-        raise AssetValidationError(f"{source}: missing asset file: {value}")
+
+def _is_http_url(value: str) -> bool:
+    return value.startswith("http://") or value.startswith("https://")
 
 
-def _validate_asset_ref(value: str, *, mod_root: Path, source: str) -> None:
+def _validate_asset_ref(value: str, *, index: AssetIndex, source: str) -> None:
     if _is_http_url(value):
         return
     if "://" in value:
         raise AssetValidationError(f"{source}: unsupported URL scheme: {value}")
-    _validate_local_asset_path(value, mod_root=mod_root, source=source)
+    reason = index.check(value)
+    if reason is not None:
+        raise AssetValidationError(f"{source}: {reason}: {value}")
 
 
-def _validate_many(values: Iterable[str], *, mod_root: Path, source: str) -> None:
-    for index, value in enumerate(values):
+def _validate_many(values: Iterable[str], *, index: AssetIndex, source: str) -> None:
+    for position, value in enumerate(values):
         if not isinstance(value, str):
-            raise AssetValidationError(f"{source}[{index}]: expected string, got {type(value).__name__}")
-        _validate_asset_ref(value, mod_root=mod_root, source=f"{source}[{index}]")
+            raise AssetValidationError(f"{source}[{position}]: expected string, got {type(value).__name__}")
+        _validate_asset_ref(value, index=index, source=f"{source}[{position}]")
 
 
 def validate_content_asset_refs(
@@ -48,16 +116,22 @@ def validate_content_asset_refs(
     category: str,
     mod_root: Path,
     source: str,
+    index: AssetIndex | None = None,
 ) -> None:
+    if category not in ("media_resources", "animation_configs"):
+        return
+    if index is None:
+        index = AssetIndex.build(mod_root)
+
     if category == "media_resources":
-        _validate_many(payload.get("textures", []), mod_root=mod_root, source=f"{source}.textures")
-        _validate_many(payload.get("sounds", []), mod_root=mod_root, source=f"{source}.sounds")
-        _validate_many(payload.get("page_sources", []), mod_root=mod_root, source=f"{source}.page_sources")
+        _validate_many(payload.get("textures", []), index=index, source=f"{source}.textures")
+        _validate_many(payload.get("sounds", []), index=index, source=f"{source}.sounds")
+        _validate_many(payload.get("page_sources", []), index=index, source=f"{source}.page_sources")
         raw_snapshot = payload.get("raw_snapshot")
         if raw_snapshot is not None:
             if not isinstance(raw_snapshot, str):
                 raise AssetValidationError(f"{source}.raw_snapshot: expected string")
-            _validate_asset_ref(raw_snapshot, mod_root=mod_root, source=f"{source}.raw_snapshot")
+            _validate_asset_ref(raw_snapshot, index=index, source=f"{source}.raw_snapshot")
         return
 
     if category == "animation_configs":
@@ -70,7 +144,7 @@ def validate_content_asset_refs(
                 )
             _validate_asset_ref(
                 texture,
-                mod_root=mod_root,
+                index=index,
                 source=f"{source}.frames[{frame_index}].texture",
             )
 
@@ -83,6 +157,6 @@ def validate_content_asset_refs(
                 )
             _validate_asset_ref(
                 sound_url,
-                mod_root=mod_root,
+                index=index,
                 source=f"{source}.sound_events[{event_index}].sound_url",
             )
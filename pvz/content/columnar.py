@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable
+
+from pvz.content.categories import CATEGORY_SCHEMA
+from pvz.content.schema_validator import SchemaStore
+from pvz.models import ContentRegistry
+
+
+# Schema scalar type -> `array` typecode; strings stay in a list.
+_TYPECODES = {"integer": "q", "number": "d", "boolean": "b"}
+_FILL = {"integer": 0, "number": float("nan"), "boolean": 0, "string": ""}
+# JSON integers are unbounded; `array('q')` holds int64 only.
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+SCALAR_TYPES = frozenset((*_TYPECODES, "string"))
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    name: str
+    kind: str
+    path: tuple[str, ...]
+
+
+def scalar_columns(schema: dict[str, Any], prefix: tuple[str, ...] = ()) -> list[ColumnSpec]:
+    """Schema-declared scalar fields in declaration order; nested objects flatten to dotted names."""
+    specs: list[ColumnSpec] = []
+    for key, prop in schema.get("properties", {}).items():
+        path = (*prefix, key)
+        kind = prop.get("type")
+        if kind in SCALAR_TYPES:
+            specs.append(ColumnSpec(".".join(path), kind, path))
+        elif kind == "object":
+            specs.extend(scalar_columns(prop, path))
+    return specs
+
+
+@dataclass
+class Column:
+    """Typed values plus a validity mask (1 = present).
+
+    Missing, mistyped or unrepresentable cells (integers outside int64, or too
+    large for a float) are masked and hold the kind's fill value.
+    """
+
+    name: str
+    kind: str
+    values: array | list[str]
+    valid: bytearray
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    def get(self, row: int) -> Any:
+        if not self.valid[row]:
+            return None
+        value = self.values[row]
+        return bool(value) if self.kind == "boolean" else value
+
+
+def _lookup(data: Any, path: tuple[str, ...]) -> Any:
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def _accepts(kind: str, value: Any) -> bool:
+    if kind == "string":
+        return isinstance(value, str)
+    if kind == "boolean":
+        return isinstance(value, bool)
+    if isinstance(value, bool):
+        return False
+    if kind == "integer":
+        return isinstance(value, int) and _INT64_MIN <= value <= _INT64_MAX
+    if isinstance(value, int):
+        try:
+            float(value)
+        except OverflowError:
+            return False
+        return True
+    return isinstance(value, float)
+
+
+@dataclass
+class ColumnarTable:
+    category: str
+    ids: list[str]
+    columns: dict[str, Column]
+    rows: dict[str, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        if not self.rows:
+            self.rows = {item_id: row for row, item_id in enumerate(self.ids)}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def column(self, name: str) -> Column:
+        return self.columns[name]
+
+    def value(self, item_id: str, name: str) -> Any:
+        return self.columns[name].get(self.rows[item_id])
+
+    def to_numpy(self) -> Any:
+        """NumPy record array with `id`, one field per column and a `<name>.valid` bool field each."""
+        import numpy as np
+
+        arrays = [np.array(self.ids, dtype=object)]
+        names = ["id"]
+        for column in self.columns.values():
+            if column.kind == "string":
+                arrays.append(np.array(column.values, dtype=object))
+            elif column.kind == "boolean":
+                arrays.append(np.frombuffer(column.values, dtype=np.int8).astype(bool))
+            else:
+                arrays.append(np.frombuffer(column.values, dtype=np.int64 if column.kind == "integer" else np.float64))
+            arrays.append(np.frombuffer(column.valid, dtype=np.uint8).astype(bool))
+            names += [column.name, f"{column.name}.valid"]
+        return np.rec.fromarrays(arrays, names=names)
+
+    def to_arrow(self) -> Any:
+        """pyarrow Table; masked cells become nulls."""
+        import pyarrow as pa
+
+        types = {"integer": pa.int64(), "number": pa.float64(), "boolean": pa.bool_(), "string": pa.string()}
+        data = {"id": pa.array(self.ids, type=pa.string())}
+        for column in self.columns.values():
+            values = [column.get(row) for row in range(len(column))]
+            data[column.name] = pa.array(values, type=types[column.kind])
+        return pa.table(data)
+
+    def write_parquet(self, path: Path) -> None:
+        import pyarrow.parquet as pq
+
+        pq.write_table(self.to_arrow(), path)
+
+
+def build_table(registry: ContentRegistry, category: str, schema: dict[str, Any]) -> ColumnarTable:
+    """Flatten one category's schema scalar fields into typed columns, rows sorted by id (the row key, not a column)."""
+    entries = registry.categories.get(category, {})
+    ids = sorted(entries)
+    columns: dict[str, Column] = {}
+    for spec in scalar_columns(schema):
+        if spec.path == ("id",):
+            continue
+        fill = _FILL[spec.kind]
+        values: array | list[str] = [] if spec.kind == "string" else array(_TYPECODES[spec.kind])
+        valid = bytearray(len(ids))
+        for row, item_id in enumerate(ids):
+            value = _lookup(entries[item_id].data, spec.path)
+            if value is not None and _accepts(spec.kind, value):
+                valid[row] = 1
+                values.append(float(value) if spec.kind == "number" else value)
+            else:
+                values.append(fill)
+        columns[spec.name] = Column(spec.name, spec.kind, values, valid)
+    return ColumnarTable(category=category, ids=ids, columns=columns)
+
+
+def build_tables(
+    registry: ContentRegistry,
+    schemas: SchemaStore,
+    categories: Iterable[str] | None = None,
+) -> dict[str, ColumnarTable]:
+    names = list(categories) if categories is not None else sorted(registry.categories)
+    return {
+        category: build_table(registry, category, schemas.get(CATEGORY_SCHEMA[category]))
+        for category in names
+        if category in CATEGORY_SCHEMA
+    }
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import hashlib
+import sys
+from dataclasses import dataclass
+from typing import Any
+
+
+def _hash(tag: bytes, parts: list[bytes]) -> bytes:
+    return hashlib.blake2b(tag + b"".join(parts), digest_size=16).digest()
+
+
+def _scalar_key(tag: bytes, payload: bytes) -> bytes:
+    # Scalars are keyed by their length-prefixed encoding; only containers pay for a hash.
+    return tag + len(payload).to_bytes(4, "little") + payload
+
+
+@dataclass
+class DedupStats:
+    nodes: int = 0
+    unique: int = 0
+    shared: int = 0
+
+
+class SubtreePool:
+    """Content-addressed store of JSON payload subtrees.
+
+    Lists and objects are keyed by a Merkle digest over their children's keys
+    (object keys sorted, types tagged so `1`, `1.0` and `true` differ); strings
+    by their own encoding. Identical subtrees resolve to one shared instance.
+
+    Shared containers are still plain dicts/lists: anything that mutates
+    registry data after loading must copy along the path first, as
+    `pvz.content.patcher` does.
+    """
+
+    def __init__(self) -> None:
+        self.stats = DedupStats()
+        self._nodes: dict[bytes, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def intern_item(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Return `payload` with deduplicated children; the top-level object stays private to its item."""
+        return {sys.intern(key): self._intern(value)[0] for key, value in payload.items()}
+
+    def intern(self, value: Any) -> Any:
+        return self._intern(value)[0]
+
+    def _share(self, key: bytes, value: Any) -> Any:
+        self.stats.nodes += 1
+        existing = self._nodes.get(key)
+        if existing is not None:
+            self.stats.shared += 1
+            return existing
+        self.stats.unique += 1
+        self._nodes[key] = value
+        return value
+
+    def _intern(self, value: Any) -> tuple[Any, bytes]:
+        if isinstance(value, str):
+            key = _scalar_key(b"s", value.encode("utf-8"))
+            return self._share(key, value), key
+        if isinstance(value, dict):
+            if not value:
+                return value, _EMPTY_DICT
+            children = {sys.intern(key): self._intern(child) for key, child in value.items()}
+            node_key = _scalar_key(
+                b"D",
+                _hash(b"d", [_scalar_key(b"k", key.encode("utf-8")) + children[key][1] for key in sorted(children)]),
+            )
+            return self._share(node_key, {key: child for key, (child, _) in children.items()}), node_key
+        if isinstance(value, list):
+            if not value:
+                return value, _EMPTY_LIST
+            children = [self._intern(child) for child in value]
+            node_key = _scalar_key(b"L", _hash(b"l", [child_key for _, child_key in children]))
+            return self._share(node_key, [child for child, _ in children]), node_key
+        if value is None:
+            return value, _NULL
+        if isinstance(value, bool):
+            return value, _TRUE if value else _FALSE
+        if isinstance(value, int):
+            return value, _scalar_key(b"i", str(value).encode("ascii"))
+        if isinstance(value, float):
+            return value, _scalar_key(b"f", repr(value).encode("ascii"))
+        raise TypeError(f"cannot intern non-JSON value of type {type(value).__name__}")
+
+
+_EMPTY_DICT = _scalar_key(b"D", b"")
+_EMPTY_LIST = _scalar_key(b"L", b"")
+_NULL = _scalar_key(b"n", b"")
+_TRUE = _scalar_key(b"b", b"1")
+_FALSE = _scalar_key(b"b", b"0")
@@ -1,49 +1,109 @@
 from __future__ import annotations
 
+import hashlib
 import heapq
-from collections import defaultdict
+import json
+import threading
+from pathlib import Path
+from typing import Iterable
 
 from pvz.errors import DependencyError
-from pvz.models import ModPackage
-from pvz.semver import satisfies
+from pvz.models import Dependency, ModManifest, ModPackage
+from pvz.semver import Constraint, SemVer, parse_version
 
 
-def _check_constraints(mods: dict[str, ModPackage]) -> None:
+ManifestKey = tuple[str, str, tuple[Dependency, ...], tuple[Dependency, ...], tuple[str, ...], tuple[str, ...]]
+
+_MEMO_SIZE = 16
+_ORDER_MEMO: dict[tuple[ManifestKey, ...], tuple[str, ...]] = {}
+# Loaders and tools may resolve from several threads; the solve itself runs outside the lock.
+_ORDER_MEMO_LOCK = threading.Lock()
+
+
+def manifest_key(manifest: ModManifest) -> ManifestKey:
+    """Hashable identity of everything that affects load order (entrypoints are irrelevant and unhashable)."""
+    return (
+        manifest.id,
+        manifest.version,
+        manifest.requires,
+        manifest.conflicts,
+        manifest.load_before,
+        manifest.load_after,
+    )
+
+
+def _check_constraints(mods: dict[str, ModPackage]) -> list[str]:
+    problems: list[str] = []
+    versions: dict[str, SemVer] = {}
+    for mod_id, mod in mods.items():
+        try:
+            versions[mod_id] = parse_version(mod.manifest.version)
+        except ValueError:
+            problems.append(f"{mod_id} has invalid version {mod.manifest.version!r}")
+
+    # Per target mod: what its dependents require, and what their conflicts exclude.
+    required: dict[str, list[tuple[str, Constraint]]] = {}
+    excluded: dict[str, list[tuple[str, Constraint]]] = {}
+
+    def compile_dep(manifest: ModManifest, dep: Dependency) -> Constraint | None:
+        try:
+            return Constraint.parse(dep.version)
+        except ValueError:
+            problems.append(f"{manifest.id} has invalid version constraint {dep.version!r} for {dep.id}")
+            return None
+
     for mod in mods.values():
         manifest = mod.manifest
         for dep in manifest.requires:
-            target = mods.get(dep.id)
-            if target is None:
-                raise DependencyError(f"{manifest.id} requires missing mod {dep.id}")
-            if dep.version and not satisfies(target.manifest.version, dep.version):
-                raise DependencyError(
-                    f"{manifest.id} requires {dep.id} {dep.version}, got {target.manifest.version}"
-                )
-
+            constraint = compile_dep(manifest, dep)
+            if constraint is not None:
+                required.setdefault(dep.id, []).append((manifest.id, constraint))
         for conflict in manifest.conflicts:
-            target = mods.get(conflict.id)
-            if target is None:
-                continue
-            if not conflict.version or satisfies(target.manifest.version, conflict.version):
-                version_hint = f" {conflict.version}" if conflict.version else ""
-                raise DependencyError(
-                    f"{manifest.id} conflicts with {conflict.id}{version_hint}"
-                )
+            constraint = compile_dep(manifest, conflict)
+            if constraint is not None and conflict.id in mods:
+                excluded.setdefault(conflict.id, []).append((manifest.id, constraint))
+
+    unsatisfiable: set[str] = set()
+    for target, wanted in required.items():
+        combined = Constraint.any()
+        for _, constraint in wanted:
+            combined = combined.intersect(constraint)
+        for _, constraint in excluded.get(target, []):
+            combined = combined.intersect(constraint.complement())
+        if combined.is_empty:
+            parts = [f"{mod_id} requires {constraint}" for mod_id, constraint in wanted]
+            parts += [f"{mod_id} conflicts with {constraint}" for mod_id, constraint in excluded.get(target, [])]
+            problems.append(f"no version of {target} can satisfy: {'; '.join(parts)}")
+            unsatisfiable.add(target)
+            continue
+
+        if target not in mods:
+            problems.extend(f"{mod_id} requires missing mod {target}" for mod_id, _ in wanted)
+            continue
+        version = versions.get(target)
+        if version is None:
+            continue
+        for mod_id, constraint in wanted:
+            if not constraint.contains(version):
+                problems.append(f"{mod_id} requires {target} {constraint}, got {mods[target].manifest.version}")
 
+    for target, conflicts in excluded.items():
+        version = versions.get(target)
+        if version is None or target in unsatisfiable:
+            continue
+        for mod_id, constraint in conflicts:
+            if constraint.contains(version):
+                version_hint = f" {constraint}" if constraint.source else ""
+                problems.append(f"{mod_id} conflicts with {target}{version_hint}")
+    return problems
 
-def resolve_load_order(mods: dict[str, ModPackage]) -> list[ModPackage]:
-    _check_constraints(mods)
 
-    graph: dict[str, set[str]] = defaultdict(set)
-    indegree: dict[str, int] = {mod_id: 0 for mod_id in mods.keys()}
+def _build_graph(mods: dict[str, ModPackage]) -> dict[str, list[str]]:
+    edges: dict[str, set[str]] = {mod_id: set() for mod_id in mods}
 
     def add_edge(before: str, after: str) -> None:
-        if before not in mods or after not in mods:
-            return
-        if after in graph[before]:
-            return
-        graph[before].add(after)
-        indegree[after] += 1
+        if before in mods and after in mods:
+            edges[before].add(after)
 
     for mod_id, mod in mods.items():
         manifest = mod.manifest
@@ -53,21 +113,176 @@ def resolve_load_order(mods: dict[str, ModPackage]) -> list[ModPackage]:
             add_edge(other, mod_id)
         for other in manifest.load_before:
             add_edge(mod_id, other)
+    return {mod_id: sorted(successors) for mod_id, successors in edges.items()}
+
+
+def strongly_connected_components(graph: dict[str, list[str]], nodes: Iterable[str]) -> list[list[str]]:
+    """Tarjan's algorithm (iterative) restricted to `nodes`; returns components in discovery order."""
+    allowed = set(nodes)
+    index: dict[str, int] = {}
+    lowlink: dict[str, int] = {}
+    on_stack: set[str] = set()
+    stack: list[str] = []
+    components: list[list[str]] = []
+    counter = 0
+
+    for root in sorted(allowed):
+        if root in index:
+            continue
+        work = [(root, iter(graph[root]))]
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            node, successors = work[-1]
+            advanced = False
+            for nxt in successors:
+                if nxt not in allowed:
+                    continue
+                if nxt not in index:
+                    index[nxt] = lowlink[nxt] = counter
+                    counter += 1
+                    stack.append(nxt)
+                    on_stack.add(nxt)
+                    work.append((nxt, iter(graph[nxt])))
+                    advanced = True
+                    break
+                if nxt in on_stack:
+                    lowlink[node] = min(lowlink[node], index[nxt])
+            if advanced:
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+            if lowlink[node] == index[node]:
+                component: list[str] = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(sorted(component))
+    return components
+
+
+def _cycle_path(graph: dict[str, list[str]], component: list[str]) -> list[str]:
+    members = set(component)
+    path: list[str] = []
+    seen: dict[str, int] = {}
+    node = component[0]
+    while node not in seen:
+        seen[node] = len(path)
+        path.append(node)
+        node = next(nxt for nxt in graph[node] if nxt in members)
+    return path[seen[node] :] + [node]
+
+
+def _cycle_problems(graph: dict[str, list[str]], stuck: list[str]) -> list[str]:
+    problems: list[str] = []
+    for component in strongly_connected_components(graph, stuck):
+        if len(component) == 1 and component[0] not in graph[component[0]]:
+            continue
+        cycle = " -> ".join(_cycle_path(graph, component))
+        problems.append(f"dependency cycle: {cycle} (members: {', '.join(component)})")
+    return problems
+
+
+def _resolve(mods: dict[str, ModPackage]) -> tuple[str, ...]:
+    problems = _check_constraints(mods)
+    if problems:
+        raise DependencyError.from_problems(problems)
+
+    graph = _build_graph(mods)
+    indegree = {mod_id: 0 for mod_id in mods}
+    for successors in graph.values():
+        for nxt in successors:
+            indegree[nxt] += 1
 
     heap = [mod_id for mod_id, count in indegree.items() if count == 0]
     heapq.heapify(heap)
     result: list[str] = []
-
     while heap:
         current = heapq.heappop(heap)
         result.append(current)
-        for nxt in sorted(graph[current]):
+        for nxt in graph[current]:
             indegree[nxt] -= 1
             if indegree[nxt] == 0:
                 heapq.heappush(heap, nxt)
 
     if len(result) != len(mods):
         stuck = [mod_id for mod_id, count in indegree.items() if count > 0]
-        raise DependencyError(f"dependency cycle detected: {sorted(stuck)}")
+        raise DependencyError.from_problems(_cycle_problems(graph, stuck))
+    return tuple(result)
+
+
+class LoadOrderCache:
+    """Persists resolved load orders keyed by a digest of the manifest set, for repeat boots."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._entries: dict[str, list[str]] = {}
+        self._dirty = False
+        if path.exists():
+            try:
+                self._entries = json.loads(path.read_text(encoding="utf-8"))
+            except ValueError:
+                self._entries = {}
+
+    @staticmethod
+    def digest(key: tuple[ManifestKey, ...]) -> str:
+        return hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+
+    def get(self, digest: str) -> list[str] | None:
+        return self._entries.get(digest)
+
+    def put(self, digest: str, order: Iterable[str]) -> None:
+        self._entries[digest] = list(order)
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self._entries, sort_keys=True), encoding="utf-8")
+        self._dirty = False
+
+
+def resolve_load_order(
+    mods: dict[str, ModPackage],
+    *,
+    cache: LoadOrderCache | None = None,
+    memoize: bool = True,
+) -> list[ModPackage]:
+    """Deterministic topological order (ties broken by id).
+
+    Every constraint violation, or every cycle, is reported at once through
+    `DependencyError.problems`. Results are memoized in-process by manifest set
+    and, with `cache`, persisted across runs.
+    """
+    key = tuple(sorted(manifest_key(mod.manifest) for mod in mods.values()))
+    order = None
+    if memoize:
+        with _ORDER_MEMO_LOCK:
+            order = _ORDER_MEMO.get(key)
+
+    digest = LoadOrderCache.digest(key) if cache is not None else None
+    if order is None and cache is not None:
+        cached = cache.get(digest)
+        if cached is not None and sorted(cached) == sorted(mods):
+            order = tuple(cached)
+
+    if order is None:
+        order = _resolve(mods)
+        if cache is not None:
+            cache.put(digest, order)
 
-    return [mods[mod_id] for mod_id in result]
+    if memoize:
+        with _ORDER_MEMO_LOCK:
+            _ORDER_MEMO.pop(key, None)
+            _ORDER_MEMO[key] = order
+            while len(_ORDER_MEMO) > _MEMO_SIZE:
+                del _ORDER_MEMO[next(iter(_ORDER_MEMO))]
+    return [mods[mod_id] for mod_id in order]
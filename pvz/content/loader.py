@@ -2,40 +2,66 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
+from itertools import groupby
 from pathlib import Path
 
-from pvz.content.asset_validation import validate_content_asset_refs
-from pvz.content.dependency import resolve_load_order
-from pvz.content.localization_validation import validate_localization_files
+from pvz.content.asset_validation import AssetIndex, validate_content_asset_refs
+from pvz.content.categories import CATEGORY_SCHEMA
+from pvz.content.dedup import SubtreePool
+from pvz.content.dependency import LoadOrderCache, resolve_load_order
+from pvz.content.localization_validation import ValidationCache, validate_localization_files
 from pvz.content.manifest import parse_manifest
 from pvz.content.patcher import apply_patches
 from pvz.content.schema_validator import SchemaStore, validate_against_schema
+from pvz.content.selection import select_versions
+from pvz.content.stats import StatTables
 from pvz.errors import ManifestError, MissingBaseModError
 from pvz.models import ContentItem, ContentRegistry, ModPackage
+from pvz.profiling import NULL_PROFILER, NullProfiler, Profiler
+
+
+def read_content_file(
+    mod_id: str,
+    mod_root: Path,
+    file_path: Path,
+    category: str,
+    *,
+    schemas: SchemaStore,
+    asset_index: AssetIndex,
+    profiler: Profiler | NullProfiler = NULL_PROFILER,
+) -> tuple[str, dict]:
+    """Parse one content file, qualify its id and validate it; shared by the loader and `tools.validate_mod`."""
+    with profiler.span("parse"):
+        payload = json.loads(file_path.read_text(encoding="utf-8"))
+    if not isinstance(payload, dict):
+        raise ManifestError(f"content file must be object: {file_path}")
+
+    explicit_id = str(payload.get("id", file_path.stem))
+    if ":" in explicit_id:
+        item_id = explicit_id
+    else:
+        item_id = f"{mod_id}:{category}:{explicit_id}"
+    payload["id"] = item_id
+
+    schema_name = CATEGORY_SCHEMA.get(category)
+    if schema_name:
+        schema = schemas.get(schema_name)
+        with profiler.span("schema"):
+            validate_against_schema(payload, schema, source=str(file_path))
+        with profiler.span("assets"):
+            validate_content_asset_refs(
+                payload,
+                category=category,
+                mod_root=mod_root,
+                source=str(file_path),
+                index=asset_index,
+            )
+    return item_id, payload
 
 
-CATEGORY_SCHEMA = {
-    "plants": "plant",
-    "zombies": "zombie",
-    "projectiles": "projectile",
-    "status_effects": "status_effect",
-    "levels": "level",
-    "waves": "wave",
-    "map_nodes": "map_node",
-    "mini_games": "minigame",
-    "puzzle_levels": "puzzle_level",
-    "survival_levels": "survival_level",
-    "shop": "shop_item",
-    "almanac": "almanac_entry",
-    "zen": "zen_item",
-    "unlock_rules": "unlock_rule",
-    "achievements": "achievement",
-    "economy": "economy",
-    "ui_screens": "ui_screen",
-    "audio_events": "audio_event",
-    "media_resources": "media_resource",
-    "animation_configs": "animation_config",
-}
+def content_category(content_root: Path, file_path: Path) -> str:
+    rel = file_path.relative_to(content_root)
+    return rel.parts[0] if rel.parts else "misc"
 
 
 @dataclass
@@ -55,13 +81,21 @@ class ModLoader:
         *,
         schema_root: Path,
         required_base_mod: str = "pvz.base",
+        cache_dir: Path | None = None,
+        dedup: bool = False,
+        profiler: Profiler | NullProfiler = NULL_PROFILER,
     ) -> None:
         self.mods_dir = mods_dir
         self.required_base_mod = required_base_mod
         self.schemas = SchemaStore(schema_root)
+        self.cache_dir = cache_dir
+        self.dedup = dedup
+        self.subtrees: SubtreePool | None = None
+        self.profiler = profiler
 
     def discover_mods(self) -> dict[str, ModPackage]:
-        mods: dict[str, ModPackage] = {}
+        """Map mod id to package; when several versions of an id are installed, pick a consistent set."""
+        candidates: dict[str, list[ModPackage]] = {}
         if not self.mods_dir.exists():
             raise ManifestError(f"mods directory does not exist: {self.mods_dir}")
 
@@ -72,29 +106,51 @@ class ModLoader:
             if not manifest_path.exists():
                 continue
 
-            manifest = parse_manifest(child)
-            if manifest.id in mods:
-                raise ManifestError(f"duplicate mod id: {manifest.id}")
-            mods[manifest.id] = ModPackage(manifest=manifest, path=child)
+            with self.profiler.span("manifest", mod=child.name):
+                manifest = parse_manifest(child)
+            versions = candidates.setdefault(manifest.id, [])
+            if any(other.manifest.version == manifest.version for other in versions):
+                raise ManifestError(f"duplicate mod id: {manifest.id} {manifest.version}")
+            versions.append(ModPackage(manifest=manifest, path=child))
 
-        if self.required_base_mod not in mods:
+        if self.required_base_mod not in candidates:
             raise MissingBaseModError(
                 f"required base mod `{self.required_base_mod}` is missing"
             )
 
-        return mods
+        if all(len(versions) == 1 for versions in candidates.values()):
+            return {mod_id: versions[0] for mod_id, versions in candidates.items()}
+        with self.profiler.span("select_versions"):
+            return select_versions(candidates)
 
     def load(self) -> LoadedGameData:
-        mod_map = self.discover_mods()
-        ordered_mods = resolve_load_order(mod_map)
-        registry = ContentRegistry()
-
-        for mod in ordered_mods:
-            self._load_content_for_mod(mod, registry)
-            validate_localization_files(mod.path)
-
-        for mod in ordered_mods:
-            self._apply_patches_for_mod(mod, registry)
+        profiler = self.profiler
+        with profiler.span("ModLoader.load"):
+            with profiler.span("discover"):
+                mod_map = self.discover_mods()
+            with profiler.span("resolve_load_order"):
+                order_cache = LoadOrderCache(self.cache_dir / "load_order.json") if self.cache_dir else None
+                ordered_mods = resolve_load_order(mod_map, cache=order_cache)
+                if order_cache is not None:
+                    order_cache.save()
+            registry = ContentRegistry()
+            self.subtrees = SubtreePool() if self.dedup else None
+            i18n_cache = ValidationCache(self.cache_dir / "localization.json") if self.cache_dir else None
+
+            for mod in ordered_mods:
+                with profiler.span("content", mod=mod.manifest.id):
+                    self._load_content_for_mod(mod, registry)
+                with profiler.span("localization", mod=mod.manifest.id):
+                    validate_localization_files(mod.path, cache=i18n_cache)
+            if i18n_cache is not None:
+                i18n_cache.save()
+
+            for mod in ordered_mods:
+                with profiler.span("patches", mod=mod.manifest.id):
+                    self._apply_patches_for_mod(mod, registry)
+
+            with profiler.span("stat_tables"):
+                registry.stats = StatTables.build(registry, self.schemas)
 
         return LoadedGameData(mods=ordered_mods, registry=registry)
 
@@ -103,40 +159,48 @@ class ModLoader:
         if not content_root.exists():
             return
 
-        for file_path in sorted(content_root.rglob("*.json")):
-            rel = file_path.relative_to(content_root)
-            category = rel.parts[0] if rel.parts else "misc"
-            payload = json.loads(file_path.read_text(encoding="utf-8"))
-            if not isinstance(payload, dict):
-                raise ManifestError(f"content file must be object: {file_path}")
-
-            explicit_id = str(payload.get("id", rel.stem))
-            if ":" in explicit_id:
-                item_id = explicit_id
-            else:
-                item_id = f"{mod.manifest.id}:{category}:{explicit_id}"
-            payload["id"] = item_id
-
-            schema_name = CATEGORY_SCHEMA.get(category)
-            if schema_name:
-                schema = self.schemas.get(schema_name)
-                validate_against_schema(payload, schema, source=str(file_path))
-                validate_content_asset_refs(
-                    payload,
-                    category=category,
-                    mod_root=mod.path,
-                    source=str(file_path),
-                )
-
-            registry.add(
-                ContentItem(
-                    id=item_id,
-                    category=category,
-                    data=payload,
-                    source_mod=mod.manifest.id,
-                    source_path=file_path,
-                )
+        profiler = self.profiler
+        mod_id = mod.manifest.id
+        with profiler.span("asset_index", mod=mod_id):
+            asset_index = AssetIndex.build(mod.path)
+
+        files = sorted(content_root.rglob("*.json"))
+        for category, group in groupby(files, key=lambda path: content_category(content_root, path)):
+            with profiler.span("category", mod=mod_id, category=category):
+                for file_path in group:
+                    self._load_content_file(mod, file_path, category, registry, asset_index)
+
+    def _load_content_file(
+        self,
+        mod: ModPackage,
+        file_path: Path,
+        category: str,
+        registry: ContentRegistry,
+        asset_index: AssetIndex,
+    ) -> None:
+        item_id, payload = read_content_file(
+            mod.manifest.id,
+            mod.path,
+            file_path,
+            category,
+            schemas=self.schemas,
+            asset_index=asset_index,
+            profiler=self.profiler,
+        )
+
+        if self.subtrees is not None:
+            with self.profiler.span("dedup"):
+                payload = self.subtrees.intern_item(payload)
+
+        registry.add(
+            ContentItem(
+                id=item_id,
+                category=category,
+                data=payload,
+                source_mod=mod.manifest.id,
+                source_path=file_path,
             )
+        )
 
     def _apply_patches_for_mod(self, mod: ModPackage, registry: ContentRegistry) -> None:
         patch_root = mod.path / "patches"
@@ -4,30 +4,67 @@ import json
 from pathlib import Path
 
 from pvz.errors import LocalizationValidationError
+from pvz.i18n.bundle import compile_template, read_bundle
 
 
-def validate_localization_files(mod_root: Path) -> None:
+def bundle_signatures(loc_root: Path) -> dict[str, list[int]]:
+    signatures: dict[str, list[int]] = {}
+    for path in sorted(loc_root.glob("*.json")):
+        stat = path.stat()
+        signatures[path.name] = [stat.st_mtime_ns, stat.st_size]
+    return signatures
+
+
+class ValidationCache:
+    """Remembers bundle signatures of mods whose localization already validated cleanly."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._entries: dict[str, dict[str, list[int]]] = {}
+        self._dirty = False
+        if path.exists():
+            try:
+                self._entries = json.loads(path.read_text(encoding="utf-8"))
+            except ValueError:
+                self._entries = {}
+
+    def is_fresh(self, loc_root: Path, signatures: dict[str, list[int]]) -> bool:
+        return self._entries.get(str(loc_root.resolve())) == signatures
+
+    def record(self, loc_root: Path, signatures: dict[str, list[int]]) -> None:
+        self._entries[str(loc_root.resolve())] = signatures
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self._entries, sort_keys=True), encoding="utf-8")
+        self._dirty = False
+
+
+def validate_localization_files(mod_root: Path, *, cache: ValidationCache | None = None) -> None:
     loc_root = mod_root / "localization"
     if not loc_root.exists():
         return
 
+    signatures = bundle_signatures(loc_root) if cache is not None else None
+    if cache is not None and cache.is_fresh(loc_root, signatures):
+        return
+
     bundles: dict[str, dict[str, str]] = {}
     for path in sorted(loc_root.glob("*.json")):
-        payload = json.loads(path.read_text(encoding="utf-8"))
-        if not isinstance(payload, dict):
-            raise LocalizationValidationError(f"{path}: localization bundle must be an object")
-        for key, value in payload.items():
-            if not isinstance(key, str):
-                raise LocalizationValidationError(f"{path}: localization key must be string")
-            if not isinstance(value, str):
-                raise LocalizationValidationError(
-                    f"{path}: localization value for `{key}` must be string"
-                )
-        bundles[path.name] = payload
+        bundles[path.name] = read_bundle(path)
 
-    if "en.json" not in bundles:
-        return
+    if "en.json" in bundles:
+        _compare_key_sets(loc_root, bundles)
+        _compare_placeholders(loc_root, bundles)
+
+    if cache is not None:
+        cache.record(loc_root, signatures)
 
+
+def _compare_key_sets(loc_root: Path, bundles: dict[str, dict[str, str]]) -> None:
     base_keys = set(bundles["en.json"].keys())
     for name, bundle in bundles.items():
         if name == "en.json":
@@ -45,3 +82,21 @@ def validate_localization_files(mod_root: Path) -> None:
             raise LocalizationValidationError(
                 f"{loc_root / name}: has {len(extra)} extra key(s) not in en.json (sample: {sample})"
             )
+
+
+def _compare_placeholders(loc_root: Path, bundles: dict[str, dict[str, str]]) -> None:
+    base = {
+        key: compile_template(value, source=f"{loc_root / 'en.json'}:{key}").placeholders
+        for key, value in bundles["en.json"].items()
+    }
+    for name, bundle in bundles.items():
+        if name == "en.json":
+            continue
+        for key, value in bundle.items():
+            found = compile_template(value, source=f"{loc_root / name}:{key}").placeholders
+            expected = base[key]
+            if found != expected:
+                raise LocalizationValidationError(
+                    f"{loc_root / name}: `{key}` uses placeholders {sorted(found)}, "
+                    f"en.json uses {sorted(expected)}"
+                )
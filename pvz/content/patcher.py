@@ -16,6 +16,24 @@ def _decode_pointer(path: str) -> list[str]:
     return [p.replace("~1", "/").replace("~0", "~") for p in path[1:].split("/")]
 
 
+def _detach(parent: Any, key: str | int) -> Any:
+    """Replace `parent[key]` with a shallow copy and return it.
+
+    Loaded payloads share identical subtrees between items (see
+    `pvz.content.dedup`), so every container on the path to a mutation is copied
+    first; siblings off the path stay shared.
+    """
+    child = parent[key]
+    if isinstance(child, dict):
+        child = dict(child)
+    elif isinstance(child, list):
+        child = list(child)
+    else:
+        return child
+    parent[key] = child
+    return child
+
+
 def _navigate(container: Any, pointer: str) -> tuple[Any, str | int | None]:
     tokens = _decode_pointer(pointer)
     if not tokens:
@@ -26,14 +44,14 @@ def _navigate(container: Any, pointer: str) -> tuple[Any, str | int | None]:
         if isinstance(parent, dict):
             if token not in parent:
                 raise PatchError(f"missing object key while navigating pointer: {token}")
-            parent = parent[token]
+            parent = _detach(parent, token)
         elif isinstance(parent, list):
             if token == "-":
                 raise PatchError("cannot traverse list with - token")
             index = int(token)
             if index >= len(parent):
                 raise PatchError(f"list index out of bounds: {index}")
-            parent = parent[index]
+            parent = _detach(parent, index)
         else:
             raise PatchError("cannot navigate through scalar value")
 
@@ -69,7 +87,7 @@ def _apply_single(data: dict[str, Any], op: dict[str, Any]) -> None:
 
     if operation == "merge":
         parent, key = _navigate(data, pointer)
-        target = data if key is None else (parent[key] if isinstance(parent, dict) else parent[key])
+        target = data if key is None else _detach(parent, key)
         value = op.get("value")
         if not isinstance(target, dict) or not isinstance(value, dict):
             raise PatchError("merge requires object target and object value")
@@ -78,7 +96,7 @@ def _apply_single(data: dict[str, Any], op: dict[str, Any]) -> None:
 
     if operation == "append":
         parent, key = _navigate(data, pointer)
-        target = data if key is None else (parent[key] if isinstance(parent, dict) else parent[key])
+        target = data if key is None else _detach(parent, key)
         if not isinstance(target, list):
             raise PatchError("append requires list target")
         target.append(op.get("value"))
@@ -129,6 +147,9 @@ def _apply_single(data: dict[str, Any], op: dict[str, Any]) -> None:
 
 
 def apply_patches(registry: ContentRegistry, patch_file: Path) -> None:
+    if registry.frozen:
+        raise PatchError(f"cannot apply {patch_file}: registry is frozen")
+    registry.stats = None
     payload = json.loads(patch_file.read_text(encoding="utf-8"))
     ops = payload.get("ops", payload)
     if not isinstance(ops, list):
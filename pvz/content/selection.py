@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import heapq
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from pvz.content.dependency import ManifestKey, manifest_key
+from pvz.errors import DependencyError
+from pvz.models import ModPackage
+from pvz.semver import Constraint, SemVer, parse_version
+
+
+_MEMO_SIZE = 16
+_SELECTION_MEMO: dict[tuple[ManifestKey, ...], tuple[tuple[str, str], ...] | DependencyError] = {}
+_SELECTION_MEMO_LOCK = threading.Lock()
+
+
+@dataclass
+class _Candidate:
+    package: ModPackage
+    version: SemVer
+    requires: dict[str, Constraint] = field(default_factory=dict)
+    conflicts: dict[str, Constraint] = field(default_factory=dict)
+
+
+@dataclass
+class SelectionStats:
+    assignments: int = 0
+    backjumps: int = 0
+    nogoods: int = 0
+
+
+class VersionSelector:
+    """Pick one installed version per mod id so that every `requires`/`conflicts` holds.
+
+    The search assigns the id with the fewest remaining versions next, trying the
+    newest version first, and forward-checks each choice against the versions
+    still open for related ids. When an id runs out of versions, the search
+    jumps straight back to the latest choice that caused it (conflict-directed
+    backjumping). The responsible combination is stored as a nogood, so it is
+    never tried again.
+    """
+
+    def __init__(self, candidates: dict[str, list[ModPackage]]) -> None:
+        self.stats = SelectionStats()
+        self.problems: list[str] = []
+        self.domains: dict[str, list[_Candidate]] = {}
+        for mod_id, packages in candidates.items():
+            compiled = [self._compile(package) for package in packages]
+            compiled = [candidate for candidate in compiled if candidate is not None]
+            compiled.sort(key=lambda candidate: candidate.version, reverse=True)
+            self.domains[mod_id] = compiled
+        self._prune_missing()
+
+        self.neighbors: dict[str, set[str]] = {mod_id: set() for mod_id in self.domains}
+        for mod_id, domain in self.domains.items():
+            for candidate in domain:
+                for target in (*candidate.requires, *candidate.conflicts):
+                    if target in self.domains and target != mod_id:
+                        self.neighbors[mod_id].add(target)
+                        self.neighbors[target].add(mod_id)
+
+        self.assignment: dict[str, _Candidate] = {}
+        self._nogoods: dict[tuple[str, SemVer], list[frozenset[tuple[str, SemVer]]]] = defaultdict(list)
+
+    def _compile(self, package: ModPackage) -> _Candidate | None:
+        manifest = package.manifest
+        try:
+            candidate = _Candidate(package=package, version=parse_version(manifest.version))
+            for dep in manifest.requires:
+                constraint = Constraint.parse(dep.version)
+                previous = candidate.requires.get(dep.id)
+                candidate.requires[dep.id] = constraint if previous is None else previous.intersect(constraint)
+            for dep in manifest.conflicts:
+                candidate.conflicts[dep.id] = Constraint.parse(dep.version)
+        except ValueError as exc:
+            self.problems.append(f"{manifest.id}@{manifest.version} ({package.path}) is invalid: {exc}")
+            return None
+        return candidate
+
+    def _prune_missing(self) -> None:
+        """Drop candidates whose requirements no installed version can meet, until nothing changes."""
+        changed = True
+        while changed:
+            changed = False
+            for mod_id, domain in self.domains.items():
+                kept = []
+                for candidate in domain:
+                    reason = self._static_reason(candidate)
+                    if reason is None:
+                        kept.append(candidate)
+                    else:
+                        self.problems.append(f"{mod_id}@{candidate.package.manifest.version} {reason}")
+                        changed = True
+                self.domains[mod_id] = kept
+
+    def _static_reason(self, candidate: _Candidate) -> str | None:
+        for target, constraint in candidate.requires.items():
+            options = self.domains.get(target)
+            if not options:
+                return f"requires missing mod {target}"
+            if not any(constraint.contains(option.version) for option in options):
+                versions = ", ".join(option.package.manifest.version for option in options)
+                return f"requires {target} {constraint}, installed: {versions}"
+        return None
+
+    @staticmethod
+    def _compatible(mod_id: str, candidate: _Candidate, other_id: str, other: _Candidate) -> bool:
+        required = candidate.requires.get(other_id)
+        if required is not None and not required.contains(other.version):
+            return False
+        excluded = candidate.conflicts.get(other_id)
+        if excluded is not None and excluded.contains(other.version):
+            return False
+        required = other.requires.get(mod_id)
+        if required is not None and not required.contains(candidate.version):
+            return False
+        excluded = other.conflicts.get(mod_id)
+        return excluded is None or not excluded.contains(candidate.version)
+
+    def _nogood_culprits(self, mod_id: str, candidate: _Candidate) -> set[str]:
+        assignment = self.assignment
+        for nogood in self._nogoods.get((mod_id, candidate.version), ()):
+            others = [(other, version) for other, version in nogood if other != mod_id]
+            if all(other in assignment and assignment[other].version == version for other, version in others):
+                return {other for other, _ in others}
+        return set()
+
+    def _learn(self, conflict: set[str]) -> None:
+        nogood = frozenset((mod_id, self.assignment[mod_id].version) for mod_id in conflict)
+        for entry in nogood:
+            self._nogoods[entry].append(nogood)
+        self.stats.nogoods += 1
+
+    def solve(self) -> dict[str, ModPackage]:
+        if any(not domain for domain in self.domains.values()):
+            raise DependencyError.from_problems(self.problems)
+        domains = self.domains
+        assignment = self.assignment
+        # pruned[id][index] = depth whose choice ruled that version out
+        pruned: dict[str, dict[int, int]] = {mod_id: {} for mod_id in domains}
+        pruned_by: dict[str, set[str]] = {mod_id: set() for mod_id in domains}
+        conflicts: dict[str, set[str]] = {mod_id: set() for mod_id in domains}
+        cursor: dict[str, int] = {}
+        trail: list[str] = []
+        reductions: list[list[tuple[str, int]]] = []
+
+        # Lazy heap of (versions left, id); stale entries are skipped when popped.
+        queue = [(len(domain), mod_id) for mod_id, domain in domains.items()]
+        heapq.heapify(queue)
+
+        def remaining(mod_id: str) -> int:
+            return len(domains[mod_id]) - len(pruned[mod_id])
+
+        def pick() -> str:
+            while True:
+                left, mod_id = heapq.heappop(queue)
+                if mod_id not in assignment and left == remaining(mod_id):
+                    return mod_id
+
+        def forward_check(mod_id: str, candidate: _Candidate, depth: int) -> str | None:
+            removed = reductions[depth]
+            for other_id in sorted(self.neighbors[mod_id]):
+                if other_id in assignment:
+                    continue
+                other_pruned = pruned[other_id]
+                other_domain = domains[other_id]
+                for index, other in enumerate(other_domain):
+                    if index not in other_pruned and not self._compatible(mod_id, candidate, other_id, other):
+                        other_pruned[index] = depth
+                        removed.append((other_id, index))
+                        pruned_by[other_id].add(mod_id)
+                heapq.heappush(queue, (remaining(other_id), other_id))
+                if len(other_pruned) == len(other_domain):
+                    return other_id
+            return None
+
+        def undo(depth: int) -> None:
+            mod_id = trail[depth]
+            touched = set()
+            for other_id, index in reductions[depth]:
+                del pruned[other_id][index]
+                pruned_by[other_id].discard(mod_id)
+                touched.add(other_id)
+            reductions[depth] = []
+            del assignment[mod_id]
+            for other_id in (*touched, mod_id):
+                heapq.heappush(queue, (remaining(other_id), other_id))
+
+        current = pick()
+        cursor[current] = 0
+        while True:
+            depth = len(trail)
+            domain = domains[current]
+            placed = False
+            while cursor[current] < len(domain):
+                index = cursor[current]
+                cursor[current] += 1
+                if index in pruned[current]:
+                    continue
+                candidate = domain[index]
+                culprits = self._nogood_culprits(current, candidate)
+                if culprits:
+                    conflicts[current] |= culprits
+                    continue
+                assignment[current] = candidate
+                trail.append(current)
+                reductions.append([])
+                self.stats.assignments += 1
+                wiped = forward_check(current, candidate, depth)
+                if wiped is None:
+                    placed = True
+                    break
+                conflicts[current] |= pruned_by[wiped] - {current}
+                undo(depth)
+                trail.pop()
+                reductions.pop()
+
+            if placed:
+                if len(assignment) == len(domains):
+                    break
+                current = pick()
+                cursor[current] = 0
+                conflicts[current] = set()
+                continue
+
+            conflict = conflicts[current] | pruned_by[current]
+            if not conflict:
+                self._fail(current)
+            self._learn(conflict)
+            target = max(trail.index(mod_id) for mod_id in conflict)
+            resume = trail[target]
+            while len(trail) > target:
+                undo(len(trail) - 1)
+                trail.pop()
+                reductions.pop()
+            self.stats.backjumps += depth - target
+            conflicts[current] = set()
+            conflicts[resume] |= conflict - {resume}
+            current = resume
+
+        return {mod_id: candidate.package for mod_id, candidate in assignment.items()}
+
+    def _fail(self, mod_id: str) -> None:
+        versions = ", ".join(candidate.package.manifest.version for candidate in self.domains[mod_id])
+        problem = f"no version of {mod_id} ({versions}) is compatible with any selection of the other mods"
+        raise DependencyError.from_problems([*self.problems, problem])
+
+
+def select_versions(candidates: dict[str, list[ModPackage]], *, memoize: bool = True) -> dict[str, ModPackage]:
+    """Choose one package per mod id, preferring newer versions; raises `DependencyError` if no set is consistent.
+
+    Outcomes, failures included, are memoized in-process by the set of candidate manifests.
+    """
+    key = tuple(sorted(manifest_key(package.manifest) for packages in candidates.values() for package in packages))
+    outcome = None
+    if memoize:
+        with _SELECTION_MEMO_LOCK:
+            outcome = _SELECTION_MEMO.get(key)
+    if outcome is None:
+        try:
+            selection = VersionSelector(candidates).solve()
+            outcome = tuple(sorted((mod_id, package.manifest.version) for mod_id, package in selection.items()))
+        except DependencyError as exc:
+            outcome = exc
+        if memoize:
+            with _SELECTION_MEMO_LOCK:
+                _SELECTION_MEMO[key] = outcome
+                while len(_SELECTION_MEMO) > _MEMO_SIZE:
+                    del _SELECTION_MEMO[next(iter(_SELECTION_MEMO))]
+    if isinstance(outcome, DependencyError):
+        raise DependencyError.from_problems(outcome.problems)
+
+    by_version = {
+        (package.manifest.id, package.manifest.version): package
+        for packages in candidates.values()
+        for package in packages
+    }
+    return {mod_id: by_version[(mod_id, version)] for mod_id, version in outcome}
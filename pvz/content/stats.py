@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from typing import Any
+
+from pvz.content.categories import CATEGORY_SCHEMA
+from pvz.content.columnar import build_table
+from pvz.content.schema_validator import SchemaStore
+from pvz.models import ContentRegistry
+
+
+STAT_CATEGORIES = ("plants", "zombies", "projectiles", "status_effects")
+NUMERIC_KINDS = frozenset(("integer", "number"))
+
+
+@dataclass
+class StatTable:
+    """Numeric stats of one category as contiguous arrays, one row per item.
+
+    `index` maps item ids to dense row numbers, so a hot loop resolves the ids
+    once and then reads `column(name)[row]`. Integer fields are `array('q')`
+    and number fields `array('d')`. Cells the item leaves out hold 0;
+    `present[name][row]` tells them apart from a real 0.
+    """
+
+    category: str
+    ids: list[str]
+    index: dict[str, int]
+    columns: dict[str, array]
+    present: dict[str, bytearray]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self.index
+
+    def row(self, item_id: str) -> int:
+        return self.index[item_id]
+
+    def column(self, name: str) -> array:
+        return self.columns[name]
+
+    def get(self, item_id: str, name: str, default: Any = 0) -> Any:
+        row = self.index[item_id]
+        return self.columns[name][row] if self.present[name][row] else default
+
+
+def build_stat_table(registry: ContentRegistry, category: str, schema: dict[str, Any]) -> StatTable:
+    table = build_table(registry, category, schema)
+    columns: dict[str, array] = {}
+    present: dict[str, bytearray] = {}
+    for name, column in table.columns.items():
+        if column.kind not in NUMERIC_KINDS:
+            continue
+        values = column.values
+        zero = 0.0 if column.kind == "number" else 0
+        columns[name] = array(values.typecode, (value if ok else zero for value, ok in zip(values, column.valid)))
+        present[name] = column.valid
+    return StatTable(category=category, ids=table.ids, index=table.rows, columns=columns, present=present)
+
+
+@dataclass
+class StatTables:
+    plants: StatTable
+    zombies: StatTable
+    projectiles: StatTable
+    status_effects: StatTable
+
+    @classmethod
+    def build(cls, registry: ContentRegistry, schemas: SchemaStore) -> "StatTables":
+        """Snapshot the registry's current (patched) stats; rebuild after further patching."""
+        return cls(
+            **{
+                category: build_stat_table(registry, category, schemas.get(CATEGORY_SCHEMA[category]))
+                for category in STAT_CATEGORIES
+            }
+        )
@@ -1,5 +1,9 @@
 """Domain errors for mod loading and runtime."""
 
+from __future__ import annotations
+
+from typing import Sequence
+
 
 class PvzError(Exception):
     """Base error for the project."""
@@ -24,6 +28,17 @@ class LocalizationValidationError(PvzError):
 class DependencyError(PvzError):
     """Raised when dependency constraints cannot be resolved."""
 
+    def __init__(self, message: str, problems: Sequence[str] = ()) -> None:
+        super().__init__(message)
+        self.problems = list(problems) or [message]
+
+    @classmethod
+    def from_problems(cls, problems: Sequence[str]) -> "DependencyError":
+        if len(problems) == 1:
+            return cls(problems[0], problems)
+        listing = "\n".join(f"  - {problem}" for problem in problems)
+        return cls(f"{len(problems)} dependency problems:\n{listing}", problems)
+
 
 class MissingBaseModError(PvzError):
     """Raised when required `pvz.base` mod is missing."""
@@ -35,3 +50,7 @@ class PatchError(PvzError):
 
 class ScriptSecurityError(PvzError):
     """Raised when a script performs forbidden operations."""
+
+
+class ReplayError(PvzError):
+    """Raised when a replay log is malformed or cannot be re-executed."""
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import Any, NoReturn
+
+
+class FrozenMap(dict):
+    """Read-only JSON object.
+
+    Subclasses `dict` so lookups stay at C speed and `json.dumps` handles it
+    natively; every mutating method raises. This guards against accidental
+    mutation, not a determined caller: `dict.__setitem__(m, k, v)` or calling
+    `m.__init__(...)` again still write through. The hash is computed once and
+    cached, so frozen payloads can key caches and sets.
+    """
+
+    __slots__ = ("_hash",)
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError("FrozenMap is immutable")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(frozenset(self.items()))
+            return self._hash
+
+    def __repr__(self) -> str:
+        return f"FrozenMap({dict.__repr__(self)})"
+
+    def __reduce__(self) -> tuple[type, tuple[dict[str, Any]]]:
+        return (FrozenMap, (dict(self),))
+
+    def __copy__(self) -> "FrozenMap":
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "FrozenMap":
+        return self
+
+
+def freeze_value(value: Any, memo: dict[int, Any] | None = None) -> Any:
+    """Convert JSON data to FrozenMap/tuple form (sets to frozensets); subtrees shared in the input stay shared."""
+    if isinstance(value, (FrozenMap, str, int, float, type(None))):
+        return value
+    if memo is None:
+        memo = {}
+    key = id(value)
+    frozen = memo.get(key)
+    if frozen is not None:
+        return frozen
+    if isinstance(value, dict):
+        frozen = FrozenMap((k, freeze_value(v, memo)) for k, v in value.items())
+    elif isinstance(value, (list, tuple)):
+        frozen = tuple(freeze_value(v, memo) for v in value)
+    elif isinstance(value, (set, frozenset)):
+        frozen = frozenset(freeze_value(v, memo) for v in value)
+    else:
+        raise TypeError(f"cannot freeze value of type {type(value).__name__}")
+    memo[key] = frozen
+    return frozen
+
+
+def thaw_value(value: Any) -> Any:
+    """Deep mutable copy of frozen (or plain) JSON data."""
+    if isinstance(value, dict):
+        return {k: thaw_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw_value(v) for v in value]
+    return value
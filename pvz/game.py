@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
+from pvz.assets.atlas import apply_atlas, load_layout
 from pvz.content.loader import LoadedGameData, ModLoader
+from pvz.i18n import LocalizationService
 from pvz.modes import CampaignService, ShopService, ZenService
+from pvz.profiling import NULL_PROFILER, NullProfiler, Profiler
 from pvz.save import SaveStore
 
 
@@ -13,10 +16,29 @@ class GameBootstrap:
     mods_dir: Path
     schemas_dir: Path
     save_path: Path
+    atlas_path: Path | None = None
+    cache_dir: Path | None = None
+    freeze: bool = False
+    profiler: Profiler | NullProfiler = field(default=NULL_PROFILER, repr=False)
 
     def load_content(self) -> LoadedGameData:
-        loader = ModLoader(self.mods_dir, schema_root=self.schemas_dir)
-        return loader.load()
+        with self.profiler.span("GameBootstrap.load_content"):
+            loader = ModLoader(
+                self.mods_dir,
+                schema_root=self.schemas_dir,
+                cache_dir=self.cache_dir,
+                # Shared subtrees are only safe once nothing can mutate them.
+                dedup=self.freeze,
+                profiler=self.profiler,
+            )
+            data = loader.load()
+            if self.atlas_path is not None and self.atlas_path.exists():
+                with self.profiler.span("apply_atlas"):
+                    apply_atlas(data.registry, load_layout(self.atlas_path))
+            if self.freeze:
+                with self.profiler.span("freeze"):
+                    data.registry.freeze()
+        return data
 
     def initialize_services(self) -> tuple[LoadedGameData, CampaignService, ShopService, ZenService]:
         data = self.load_content()
@@ -25,8 +47,14 @@ class GameBootstrap:
         zen = ZenService(data.registry)
         return data, campaign, shop, zen
 
+    def localization(self, data: LoadedGameData, *, locale: str = "en") -> LocalizationService:
+        cache_dir = self.cache_dir / "i18n" if self.cache_dir else None
+        with self.profiler.span("GameBootstrap.localization", locale=locale):
+            return LocalizationService([mod.path for mod in data.mods], locale=locale, cache_dir=cache_dir)
+
     def ensure_save(self) -> SaveStore:
-        store = SaveStore(self.save_path)
-        save = store.load()
-        store.save(save)
+        with self.profiler.span("GameBootstrap.ensure_save"):
+            store = SaveStore(self.save_path)
+            save = store.load()
+            store.save(save)
         return store
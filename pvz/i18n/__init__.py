@@ -0,0 +1,14 @@
+"""Compiled localization catalogs and runtime string lookup."""
+
+from pvz.i18n.bundle import Placeholder, Template, compile_template
+from pvz.i18n.catalog import Catalog, KeyTable, LocalizationService, compile_catalog
+
+__all__ = [
+    "Catalog",
+    "KeyTable",
+    "LocalizationService",
+    "Placeholder",
+    "Template",
+    "compile_catalog",
+    "compile_template",
+]
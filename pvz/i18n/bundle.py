@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from string import Formatter
+from typing import Any, Mapping
+
+from pvz.errors import LocalizationValidationError
+
+
+_FORMATTER = Formatter()
+
+
+@dataclass(frozen=True, slots=True)
+class Placeholder:
+    name: str
+    spec: str = ""
+    conversion: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class Template:
+    """A localization value pre-split into literal text and `{name}` placeholders."""
+
+    segments: tuple[str | Placeholder, ...]
+    placeholders: frozenset[str]
+
+    def format(self, values: Mapping[str, Any]) -> str:
+        parts: list[str] = []
+        for segment in self.segments:
+            if segment.__class__ is str:
+                parts.append(segment)
+                continue
+            value = values[segment.name]
+            if segment.conversion == "r":
+                value = repr(value)
+            elif segment.conversion == "s":
+                value = str(value)
+            parts.append(format(value, segment.spec) if segment.spec else str(value))
+        return "".join(parts)
+
+
+def compile_template(text: str, *, source: str = "<template>") -> Template:
+    segments: list[str | Placeholder] = []
+    names: set[str] = set()
+    try:
+        parsed = list(_FORMATTER.parse(text))
+    except ValueError as exc:
+        raise LocalizationValidationError(f"{source}: malformed placeholder: {exc}") from None
+
+    for literal, name, spec, conversion in parsed:
+        if literal:
+            if segments and segments[-1].__class__ is str:
+                segments[-1] += literal
+            else:
+                segments.append(literal)
+        if name is None:
+            continue
+        if not name.isidentifier():
+            raise LocalizationValidationError(
+                f"{source}: placeholders must be named identifiers, got `{{{name}}}`"
+            )
+        if spec and "{" in spec:
+            raise LocalizationValidationError(f"{source}: nested placeholders are not supported")
+        segments.append(Placeholder(name=name, spec=spec or "", conversion=conversion))
+        names.add(name)
+    return Template(segments=tuple(segments), placeholders=frozenset(names))
+
+
+def read_bundle(path: Path) -> dict[str, str]:
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(payload, dict):
+        raise LocalizationValidationError(f"{path}: localization bundle must be an object")
+    for key, value in payload.items():
+        if not isinstance(key, str):
+            raise LocalizationValidationError(f"{path}: localization key must be string")
+        if not isinstance(value, str):
+            raise LocalizationValidationError(
+                f"{path}: localization value for `{key}` must be string"
+            )
+    return payload
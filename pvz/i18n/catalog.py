@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Mapping, Sequence
+
+from pvz.i18n.bundle import Template, compile_template, read_bundle
+
+
+CACHE_FORMAT = 2
+
+
+class KeyTable:
+    """Append-only key -> index mapping shared by every locale catalog."""
+
+    __slots__ = ("keys", "_index")
+
+    def __init__(self) -> None:
+        self.keys: list[str] = []
+        self._index: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def add(self, key: str) -> int:
+        index = self._index.get(key)
+        if index is None:
+            index = len(self.keys)
+            key = sys.intern(key)
+            self.keys.append(key)
+            self._index[key] = index
+        return index
+
+    def index(self, key: str) -> int | None:
+        return self._index.get(key)
+
+
+@dataclass(frozen=True)
+class Catalog:
+    locale: str
+    values: tuple[str | None, ...]
+    templates: tuple[Template | None, ...] = ()
+
+    def text(self, index: int) -> str | None:
+        return self.values[index] if index < len(self.values) else None
+
+    def template(self, index: int) -> Template | None:
+        return self.templates[index] if index < len(self.templates) else None
+
+
+def compile_catalog(locale: str, bundle: dict[str, str], keys: KeyTable) -> Catalog:
+    """Align a merged bundle with the shared key table; values with placeholders are pre-parsed."""
+    for key in bundle:
+        keys.add(key)
+    values: list[str | None] = [None] * len(keys)
+    templates: list[Template | None] = [None] * len(keys)
+    for key, value in bundle.items():
+        index = keys.index(key)
+        values[index] = sys.intern(value)
+        if "{" in value or "}" in value:
+            templates[index] = compile_template(value, source=f"{locale}:{key}")
+    return Catalog(locale=locale, values=tuple(values), templates=tuple(templates))
+
+
+def _read_cached_bundle(path: Path, signature: list[list[Any]]) -> dict[str, str] | None:
+    """The cached merged bundle if `path` holds a well-formed entry for `signature`, else None."""
+    try:
+        cached = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("format") != CACHE_FORMAT or cached.get("signature") != signature:
+        return None
+    bundle = cached.get("bundle")
+    if not isinstance(bundle, dict) or not all(isinstance(value, str) for value in bundle.values()):
+        return None
+    return bundle
+
+
+class LocalizationService:
+    """Runtime string lookup over the localization bundles of all loaded mods.
+
+    Bundles of later mods override earlier ones key by key. Only the active and
+    fallback locales are loaded up front; others compile on first use. With
+    `cache_dir`, each locale's merged string bundle (not the compiled catalog,
+    which is rebuilt from it) is stored as JSON together with the (mtime, size)
+    signature of its source files and reused while they are unchanged. Cache
+    files that are unreadable or malformed are ignored and rewritten.
+    """
+
+    def __init__(
+        self,
+        mod_roots: Sequence[Path],
+        *,
+        locale: str = "en",
+        fallback: str = "en",
+        cache_dir: Path | None = None,
+    ) -> None:
+        self.mod_roots = list(mod_roots)
+        self.fallback = fallback
+        self.cache_dir = cache_dir
+        self.keys = KeyTable()
+        self._catalogs: dict[str, Catalog] = {}
+        self.locales = sorted(
+            {path.stem for root in self.mod_roots for path in (root / "localization").glob("*.json")}
+        )
+        self.locale = fallback
+        if not self.locales:
+            self._catalogs[fallback] = Catalog(locale=fallback, values=())
+            return
+        if fallback in self.locales:
+            self.catalog(fallback)
+        self.set_locale(locale)
+
+    def _sources(self, locale: str) -> list[Path]:
+        paths = [root / "localization" / f"{locale}.json" for root in self.mod_roots]
+        return [path for path in paths if path.is_file()]
+
+    def _merged_bundle(self, locale: str) -> dict[str, str]:
+        sources = self._sources(locale)
+        signature = []
+        for path in sources:
+            stat = path.stat()
+            signature.append([str(path), stat.st_mtime_ns, stat.st_size])
+        cache_path = self.cache_dir / f"{locale}.bundle.json" if self.cache_dir else None
+
+        if cache_path is not None and cache_path.exists():
+            cached = _read_cached_bundle(cache_path, signature)
+            if cached is not None:
+                return cached
+
+        merged: dict[str, str] = {}
+        for path in sources:
+            merged.update(read_bundle(path))
+
+        if cache_path is not None:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(
+                json.dumps({"format": CACHE_FORMAT, "signature": signature, "bundle": merged}, ensure_ascii=False),
+                encoding="utf-8",
+            )
+        return merged
+
+    def catalog(self, locale: str) -> Catalog:
+        catalog = self._catalogs.get(locale)
+        if catalog is None:
+            if locale not in self.locales:
+                raise KeyError(f"unknown locale: {locale}")
+            catalog = compile_catalog(locale, self._merged_bundle(locale), self.keys)
+            self._catalogs[locale] = catalog
+        return catalog
+
+    def set_locale(self, locale: str) -> None:
+        self.catalog(locale)
+        self.locale = locale
+
+    def index(self, key: str) -> int:
+        index = self.keys.index(key)
+        if index is None:
+            raise KeyError(f"unknown localization key: {key}")
+        return index
+
+    def text(self, index: int, *, locale: str | None = None) -> str:
+        value = self.catalog(locale or self.locale).text(index)
+        if value is None and self.fallback in self._catalogs:
+            value = self._catalogs[self.fallback].text(index)
+        if value is None:
+            return self.keys.keys[index]
+        return value
+
+    def format_index(self, index: int, values: Mapping[str, Any], *, locale: str | None = None) -> str:
+        catalog = self.catalog(locale or self.locale)
+        if catalog.text(index) is None and self.fallback in self._catalogs:
+            catalog = self._catalogs[self.fallback]
+        template = catalog.template(index)
+        if template is None:
+            return self.text(index, locale=catalog.locale)
+        return template.format(values)
+
+    def format(self, key: str, /, *, locale: str | None = None, **values: Any) -> str:
+        """Localized text for `key` with `{name}` placeholders filled from `values`."""
+        index = self.keys.index(key)
+        if index is None:
+            return key
+        return self.format_index(index, values, locale=locale)
+
+    def get(self, key: str, *, locale: str | None = None) -> str:
+        """Localized text for `key`; falls back to the fallback locale, then the key itself."""
+        index = self.keys.index(key)
+        if index is None:
+            return key
+        return self.text(index, locale=locale)
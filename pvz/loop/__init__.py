@@ -0,0 +1,13 @@
+"""Fixed-timestep game loop and tick-rate metrics."""
+
+from pvz.loop.metrics import LoopMetrics, PhaseTiming
+from pvz.loop.scheduler import GameLoop, OverrunPolicy, TimedEvent, build_session_loop
+
+__all__ = [
+    "GameLoop",
+    "LoopMetrics",
+    "OverrunPolicy",
+    "PhaseTiming",
+    "TimedEvent",
+    "build_session_loop",
+]
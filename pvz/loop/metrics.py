@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Any
+
+
+FRAME_BUCKETS_MS: tuple[float, ...] = (0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 33.0, 66.0)
+
+
+@dataclass
+class PhaseTiming:
+    calls: int = 0
+    total_s: float = 0.0
+    max_s: float = 0.0
+
+    def add(self, elapsed_s: float) -> None:
+        self.calls += 1
+        self.total_s += elapsed_s
+        if elapsed_s > self.max_s:
+            self.max_s = elapsed_s
+
+    @property
+    def mean_ms(self) -> float:
+        return (self.total_s / self.calls) * 1000.0 if self.calls else 0.0
+
+
+@dataclass
+class LoopMetrics:
+    ticks: int = 0
+    skipped_ticks: int = 0
+    busy_s: float = 0.0
+    wall_s: float = 0.0
+    phases: dict[str, PhaseTiming] = field(default_factory=dict)
+    frame_histogram: list[int] = field(default_factory=lambda: [0] * (len(FRAME_BUCKETS_MS) + 1))
+
+    def record_phase(self, name: str, elapsed_s: float) -> None:
+        timing = self.phases.get(name)
+        if timing is None:
+            timing = self.phases[name] = PhaseTiming()
+        timing.add(elapsed_s)
+
+    def record_frame(self, elapsed_s: float) -> None:
+        self.ticks += 1
+        self.busy_s += elapsed_s
+        self.frame_histogram[bisect_left(FRAME_BUCKETS_MS, elapsed_s * 1000.0)] += 1
+
+    @property
+    def ticks_per_second(self) -> float:
+        return self.ticks / self.wall_s if self.wall_s > 0 else 0.0
+
+    @property
+    def max_ticks_per_second(self) -> float:
+        """Throughput if the loop never slept; used to size sessions per core."""
+        return self.ticks / self.busy_s if self.busy_s > 0 else 0.0
+
+    def summary(self) -> dict[str, Any]:
+        labels = [f"<={bound}ms" for bound in FRAME_BUCKETS_MS] + [f">{FRAME_BUCKETS_MS[-1]}ms"]
+        return {
+            "ticks": self.ticks,
+            "skipped_ticks": self.skipped_ticks,
+            "ticks_per_second": round(self.ticks_per_second, 2),
+            "max_ticks_per_second": round(self.max_ticks_per_second, 2),
+            "phases": {
+                name: {
+                    "calls": timing.calls,
+                    "mean_ms": round(timing.mean_ms, 4),
+                    "max_ms": round(timing.max_s * 1000.0, 4),
+                }
+                for name, timing in self.phases.items()
+            },
+            "frame_histogram": dict(zip(labels, self.frame_histogram)),
+        }
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable
+
+from pvz.combat import BattleState, simulate_wave
+from pvz.loop.metrics import LoopMetrics
+from pvz.modes.zen import ZenService
+from pvz.save.store import SaveModelV1
+from pvz.scripting import HookContext, ScriptManager
+
+
+class OverrunPolicy(str, Enum):
+    CATCH_UP = "catch_up"
+    SKIP = "skip"
+
+
+@dataclass(order=True)
+class TimedEvent:
+    tick: int
+    priority: int
+    seq: int
+    callback: Callable[[int], Any] = field(compare=False)
+    cancelled: bool = field(default=False, compare=False)
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class GameLoop:
+    """Fixed-timestep loop: wall time feeds an accumulator that is consumed in whole ticks.
+
+    Each tick first fires due timed events, then runs the registered phases in order.
+    When the accumulator holds more than `max_catch_up_ticks`, CATCH_UP keeps the
+    backlog for later calls while SKIP drops it.
+    """
+
+    def __init__(
+        self,
+        *,
+        tick_rate: int = 30,
+        max_catch_up_ticks: int = 5,
+        policy: OverrunPolicy = OverrunPolicy.CATCH_UP,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        if tick_rate <= 0:
+            raise ValueError("tick_rate must be positive")
+        self.tick_rate = tick_rate
+        self.dt = 1.0 / tick_rate
+        self.max_catch_up_ticks = max_catch_up_ticks
+        self.policy = policy
+        self.clock = clock
+        self.tick = 0
+        self.metrics = LoopMetrics()
+        self._accumulator = 0.0
+        self._phases: list[tuple[str, Callable[[int], Any]]] = []
+        self._queue: list[TimedEvent] = []
+        self._seq = itertools.count()
+
+    def add_phase(self, name: str, fn: Callable[[int], Any]) -> None:
+        if any(existing == name for existing, _ in self._phases):
+            raise ValueError(f"loop phase already registered: {name}")
+        self._phases.append((name, fn))
+
+    def schedule(self, tick: int, callback: Callable[[int], Any], *, priority: int = 0) -> TimedEvent:
+        event = TimedEvent(tick=tick, priority=priority, seq=next(self._seq), callback=callback)
+        heapq.heappush(self._queue, event)
+        return event
+
+    def schedule_level_events(self, level: dict[str, Any], handler: Callable[[int, dict[str, Any]], Any]) -> int:
+        """Queue a level's `scripted_events`, offset from the current tick."""
+        count = 0
+        for event in level.get("scripted_events", []):
+            self.schedule(
+                self.tick + int(event.get("tick", 0)),
+                lambda tick, event=event: handler(tick, event),
+            )
+            count += 1
+        return count
+
+    @property
+    def pending_events(self) -> int:
+        return sum(1 for event in self._queue if not event.cancelled)
+
+    def _fire_due(self) -> None:
+        queue = self._queue
+        while queue and queue[0].tick <= self.tick:
+            event = heapq.heappop(queue)
+            if not event.cancelled:
+                event.callback(self.tick)
+
+    def step(self) -> None:
+        clock = self.clock
+        started = clock()
+        self.tick += 1
+
+        if self._queue:
+            self._fire_due()
+            mark = clock()
+            self.metrics.record_phase("events", mark - started)
+        else:
+            mark = started
+
+        for name, fn in self._phases:
+            fn(self.tick)
+            now = clock()
+            self.metrics.record_phase(name, now - mark)
+            mark = now
+
+        self.metrics.record_frame(mark - started)
+
+    def run_for(self, ticks: int) -> None:
+        """Run ticks back to back, ignoring wall time (headless and replay use)."""
+        started = self.clock()
+        for _ in range(ticks):
+            self.step()
+        self.metrics.wall_s += self.clock() - started
+
+    def advance(self, elapsed_s: float) -> int:
+        """Feed `elapsed_s` of wall time and run every whole tick it covers."""
+        self._accumulator += elapsed_s
+        due = int(self._accumulator / self.dt)
+        runnable = min(due, self.max_catch_up_ticks)
+        if due > runnable and self.policy is OverrunPolicy.SKIP:
+            self.metrics.skipped_ticks += due - runnable
+            self._accumulator -= (due - runnable) * self.dt
+        for _ in range(runnable):
+            self.step()
+        self._accumulator -= runnable * self.dt
+        self.metrics.wall_s += elapsed_s
+        return runnable
+
+    def run_realtime(self, until_tick: int, *, sleep: Callable[[float], Any] = time.sleep) -> None:
+        last = self.clock()
+        while self.tick < until_tick:
+            now = self.clock()
+            self.advance(now - last)
+            last = now
+            remaining = self.dt - self._accumulator
+            if remaining > 0 and self.tick < until_tick:
+                sleep(remaining)
+
+
+def build_session_loop(
+    *,
+    tick_rate: int = 30,
+    battle: BattleState | None = None,
+    zen: ZenService | None = None,
+    save: SaveModelV1 | None = None,
+    scripts: ScriptManager | None = None,
+    level: dict[str, Any] | None = None,
+    **options: Any,
+) -> GameLoop:
+    """Wire combat, zen growth, level scripted events and `on_tick` hooks into one loop."""
+    loop = GameLoop(tick_rate=tick_rate, **options)
+
+    if level is not None:
+
+        def on_scripted_event(tick: int, event: dict[str, Any]) -> None:
+            if scripts is not None:
+                scripts.run_hook("on_scripted_event", context=HookContext(tick=tick, payload=event))
+
+        loop.schedule_level_events(level, on_scripted_event)
+
+    if battle is not None:
+        loop.add_phase("combat", lambda tick: simulate_wave(battle, duration_ticks=1))
+
+    if zen is not None:
+        if save is None:
+            raise ValueError("zen phase requires a save model")
+        loop.add_phase("zen", lambda tick: zen.tick(save, tick))
+
+    if scripts is not None:
+
+        def run_hooks(tick: int) -> None:
+            scripts.run_hook("on_tick", context=HookContext(tick=tick))
+            scripts.end_tick()
+
+        loop.add_phase("hooks", run_hooks)
+
+    return loop
@@ -2,7 +2,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from pvz.frozen import freeze_value, thaw_value
+
+if TYPE_CHECKING:
+    from pvz.content.stats import StatTables
 
 
 @dataclass(frozen=True)
@@ -43,8 +49,13 @@ class ContentItem:
 @dataclass
 class ContentRegistry:
     categories: dict[str, dict[str, ContentItem]] = field(default_factory=dict)
+    frozen: bool = False
+    # Typed numeric stats built by the loader after patching; cleared when patches change the content.
+    stats: StatTables | None = field(default=None, repr=False, compare=False)
 
     def add(self, item: ContentItem) -> None:
+        if self.frozen:
+            raise ValueError(f"cannot add {item.id}: registry is frozen")
         bucket = self.categories.setdefault(item.category, {})
         if item.id in bucket:
             raise ValueError(f"duplicate content id: {item.id}")
@@ -53,7 +64,32 @@ class ContentRegistry:
     def get(self, category: str, item_id: str) -> ContentItem:
         return self.categories[category][item_id]
 
+    def freeze(self) -> None:
+        """Make all content read-only so it can be shared between threads without copies.
+
+        Item payloads become `FrozenMap`/tuple trees and category tables read-only
+        mappings; `add` and patching raise afterwards. This stops accidental
+        in-place edits through the normal mapping and sequence API. It is not a
+        hard guarantee: `ContentItem.data` can still be reassigned, and `dict`
+        methods called on a `FrozenMap` directly bypass its guards.
+        """
+        if self.frozen:
+            return
+        memo: dict[int, Any] = {}
+        for entries in self.categories.values():
+            for item in entries.values():
+                item.data = freeze_value(item.data, memo)
+        self.categories = MappingProxyType(
+            {category: MappingProxyType(entries) for category, entries in self.categories.items()}
+        )
+        self.frozen = True
+
     def as_plain_data(self) -> dict[str, dict[str, dict[str, Any]]]:
+        if self.frozen:
+            return {
+                category: {item_id: thaw_value(item.data) for item_id, item in entries.items()}
+                for category, entries in self.categories.items()
+            }
         return {
             category: {item_id: item.data for item_id, item in entries.items()}
             for category, entries in self.categories.items()
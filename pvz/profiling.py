@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+
+@dataclass
+class Span:
+    name: str
+    start_ns: int
+    end_ns: int = 0
+    args: dict[str, str] = field(default_factory=dict)
+    children: list["Span"] = field(default_factory=list)
+    thread_id: int = 0
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6
+
+    @property
+    def label(self) -> str:
+        if not self.args:
+            return self.name
+        return f"{self.name} [{', '.join(self.args.values())}]"
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class NullProfiler:
+    """Default profiler: every span is a shared no-op context manager."""
+
+    enabled = False
+
+    def span(self, name: str, **args: str) -> _NullSpan:
+        return _NULL_SPAN
+
+
+class Profiler:
+    """Collects nested wall-clock spans per thread for boot-time reporting.
+
+    `span(name, mod=..., category=...)` nests under whatever span is open on the
+    current thread. Args are kept for labels and for `breakdown()`.
+    """
+
+    enabled = True
+
+    def __init__(self) -> None:
+        self.roots: list[Span] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._origin_ns = time.perf_counter_ns()
+
+    def _stack(self) -> list[Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def span(self, name: str, **args: str) -> Iterator[Span]:
+        stack = self._stack()
+        span = Span(name=name, start_ns=time.perf_counter_ns(), args=args, thread_id=threading.get_ident())
+        if stack:
+            stack[-1].children.append(span)
+        else:
+            with self._lock:
+                self.roots.append(span)
+        stack.append(span)
+        try:
+            yield span
+        finally:
+            span.end_ns = time.perf_counter_ns()
+            stack.pop()
+
+    def iter_spans(self) -> Iterator[tuple[int, Span]]:
+        pending = [(0, root) for root in reversed(self.roots)]
+        while pending:
+            depth, span = pending.pop()
+            yield depth, span
+            pending.extend((depth + 1, child) for child in reversed(span.children))
+
+    def breakdown(self, arg: str) -> dict[str, float]:
+        """Total milliseconds per value of `arg`, counting only the outermost span for each value."""
+        totals: dict[str, float] = {}
+
+        def visit(span: Span, active: frozenset[str]) -> None:
+            value = span.args.get(arg)
+            if value is not None and value not in active:
+                totals[value] = totals.get(value, 0.0) + span.duration_ms
+                active = active | {value}
+            for child in span.children:
+                visit(child, active)
+
+        for root in self.roots:
+            visit(root, frozenset())
+        return dict(sorted(totals.items(), key=lambda item: -item[1]))
+
+    def report(self, *, min_ms: float = 0.0) -> str:
+        """Indented tree; sibling spans with the same label are merged as `label xN`."""
+        lines: list[str] = []
+
+        def emit(spans: list[Span], depth: int) -> None:
+            groups: dict[str, list[Span]] = {}
+            for span in spans:
+                groups.setdefault(span.label, []).append(span)
+            for label, group in groups.items():
+                total = sum(span.duration_ms for span in group)
+                if total < min_ms:
+                    continue
+                name = label if len(group) == 1 else f"{label} x{len(group)}"
+                lines.append(f"{'  ' * depth}{name:<{max(1, 56 - 2 * depth)}} {total:9.2f} ms")
+                emit([child for span in group for child in span.children], depth + 1)
+
+        emit(self.roots, 0)
+        for arg in ("mod", "category"):
+            totals = self.breakdown(arg)
+            if totals:
+                lines.append(f"by {arg}:")
+                lines.extend(f"  {value:<54} {ms:9.2f} ms" for value, ms in totals.items())
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """Trace Event Format document (complete `X` events) for chrome://tracing / Perfetto."""
+        pid = os.getpid()
+        events = [
+            {
+                "name": span.name,
+                "cat": "boot",
+                "ph": "X",
+                "ts": (span.start_ns - self._origin_ns) / 1000.0,
+                "dur": (span.end_ns - span.start_ns) / 1000.0,
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": span.args,
+            }
+            for _, span in self.iter_spans()
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_trace(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.chrome_trace()), encoding="utf-8")
+
+
+NULL_PROFILER = NullProfiler()
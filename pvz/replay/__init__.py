@@ -0,0 +1,13 @@
+"""Deterministic record-and-replay of simulation and hook runs."""
+
+from pvz.replay.log import collect_seeds, registry_fingerprint
+from pvz.replay.recorder import Recorder, ReplayMismatch, ReplayReport, replay
+
+__all__ = [
+    "collect_seeds",
+    "registry_fingerprint",
+    "Recorder",
+    "ReplayMismatch",
+    "ReplayReport",
+    "replay",
+]
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import struct
+import zlib
+from enum import IntEnum
+from typing import Any, BinaryIO, Iterator
+
+from pvz.errors import ReplayError
+from pvz.models import ContentRegistry
+
+
+MAGIC = b"PVZREC"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<6sH")
+_FRAME = struct.Struct("<BI")
+_READ_CHUNK = 64 * 1024
+
+
+class RecordKind(IntEnum):
+    HEADER = 1
+    HOOK = 2
+    TICK = 3
+    SIMULATION = 4
+
+
+def _default(value: Any) -> Any:
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    return repr(value)
+
+
+def encode_payload(payload: Any) -> bytes:
+    return json.dumps(payload, separators=(",", ":"), sort_keys=True, default=_default).encode("utf-8")
+
+
+def normalize(value: Any) -> Any:
+    """Round-trip a value through the log encoding so live and recorded values compare equal."""
+    return json.loads(encode_payload(value))
+
+
+def registry_fingerprint(registry: ContentRegistry) -> str:
+    digest = hashlib.sha256()
+    for category in sorted(registry.categories):
+        entries = registry.categories[category]
+        for item_id in sorted(entries):
+            digest.update(encode_payload([category, item_id, entries[item_id].data]))
+    return digest.hexdigest()
+
+
+def collect_seeds(registry: ContentRegistry) -> dict[str, int]:
+    seeds: dict[str, int] = {}
+    for item_id, item in registry.categories.get("mini_games", {}).items():
+        seed = item.data.get("seed")
+        if isinstance(seed, int):
+            seeds[item_id] = seed
+    return seeds
+
+
+class ReplayWriter:
+    """Append-only log: fixed header, then zlib-compressed `<kind:u8><length:u32><json>` frames."""
+
+    def __init__(self, fp: BinaryIO) -> None:
+        self._fp = fp
+        self._compressor = zlib.compressobj(level=6)
+        fp.write(_HEADER.pack(MAGIC, FORMAT_VERSION))
+
+    def write(self, kind: RecordKind, payload: Any) -> None:
+        body = encode_payload(payload)
+        self._fp.write(self._compressor.compress(_FRAME.pack(kind, len(body)) + body))
+
+    def close(self) -> None:
+        self._fp.write(self._compressor.flush())
+        self._fp.flush()
+
+
+def read_records(fp: BinaryIO) -> Iterator[tuple[RecordKind, Any]]:
+    header = fp.read(_HEADER.size)
+    if len(header) != _HEADER.size:
+        raise ReplayError("replay log is truncated")
+    magic, version = _HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ReplayError("not a replay log")
+    if version != FORMAT_VERSION:
+        raise ReplayError(f"unsupported replay log version: {version}")
+
+    decompressor = zlib.decompressobj()
+    buffer = bytearray()
+    while True:
+        chunk = fp.read(_READ_CHUNK)
+        buffer += decompressor.decompress(chunk) if chunk else decompressor.flush()
+        offset = 0
+        while len(buffer) - offset >= _FRAME.size:
+            kind, length = _FRAME.unpack_from(buffer, offset)
+            start = offset + _FRAME.size
+            end = start + length
+            if len(buffer) < end:
+                break
+            try:
+                record_kind = RecordKind(kind)
+            except ValueError:
+                raise ReplayError(f"unknown replay record kind: {kind}") from None
+            yield record_kind, json.loads(bytes(buffer[start:end]))
+            offset = end
+        del buffer[:offset]
+        if not chunk:
+            break
+    if buffer:
+        raise ReplayError("replay log ends with a partial record")
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import dataclasses
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from pvz.combat import BattleState, simulate_wave
+from pvz.errors import ReplayError
+from pvz.models import ContentRegistry
+from pvz.replay.log import (
+    RecordKind,
+    ReplayWriter,
+    collect_seeds,
+    normalize,
+    read_records,
+    registry_fingerprint,
+)
+from pvz.scripting import HookContext, ScriptManager
+from pvz.scripting.state import StateChange
+
+
+def _context_payload(context: HookContext) -> dict[str, Any]:
+    return {"tick": context.tick, "entity_id": context.entity_id, "payload": context.payload}
+
+
+def _tick_payload(changes: dict[str, Any], drained: dict[str, list]) -> dict[str, Any]:
+    return {
+        "changes": changes,
+        "events": {name: records for name, records in drained.items() if records},
+    }
+
+
+class Recorder:
+    def __init__(self, fp: BinaryIO) -> None:
+        self._writer = ReplayWriter(fp)
+        self._owned: BinaryIO | None = None
+
+    @classmethod
+    def open(cls, path: Path) -> "Recorder":
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fp = path.open("wb")
+        recorder = cls(fp)
+        recorder._owned = fp
+        return recorder
+
+    def begin(
+        self,
+        registry: ContentRegistry,
+        *,
+        mod_ids: list[str] | None = None,
+        rng_seed: int | None = None,
+        scripts: ScriptManager | None = None,
+    ) -> None:
+        """Write the header; with `rng_seed`, reseed `scripts.rng` (the `api.random` hooks see)."""
+        if rng_seed is not None and scripts is not None:
+            scripts.rng.seed(rng_seed)
+        self._writer.write(
+            RecordKind.HEADER,
+            {
+                "fingerprint": registry_fingerprint(registry),
+                "mods": list(mod_ids or []),
+                "seeds": collect_seeds(registry),
+                "rng_seed": rng_seed,
+            },
+        )
+
+    def record_hook(self, hook_name: str, context: HookContext, results: list[Any]) -> None:
+        self._writer.write(
+            RecordKind.HOOK,
+            {"hook": hook_name, "context": _context_payload(context), "results": results},
+        )
+
+    def record_tick(self, change: StateChange | None, drained: dict[str, list]) -> None:
+        changes = change.values if change is not None else {}
+        self._writer.write(RecordKind.TICK, _tick_payload(changes, drained))
+
+    def simulate(self, state: BattleState, *, duration_ticks: int = 10) -> dict[str, Any]:
+        before = dataclasses.asdict(state)
+        result = simulate_wave(state, duration_ticks=duration_ticks)
+        self._writer.write(
+            RecordKind.SIMULATION,
+            {"state": before, "duration_ticks": duration_ticks, "result": result},
+        )
+        return result
+
+    def close(self) -> None:
+        self._writer.close()
+        if self._owned is not None:
+            self._owned.close()
+            self._owned = None
+
+
+@dataclass
+class ReplayMismatch:
+    record: int
+    kind: str
+    expected: Any
+    actual: Any
+
+
+@dataclass
+class ReplayReport:
+    records: int = 0
+    hooks: int = 0
+    ticks: int = 0
+    simulations: int = 0
+    elapsed_s: float = 0.0
+    mismatches: list[ReplayMismatch] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatches
+
+
+def replay(
+    path: Path,
+    *,
+    registry: ContentRegistry,
+    scripts: ScriptManager | None = None,
+    stop_on_mismatch: bool = False,
+) -> ReplayReport:
+    """Re-execute a recorded run as fast as possible and report where it diverges.
+
+    Hook budgets are disabled during replay; `scripts` must be freshly loaded from
+    the same mods so its state starts where the recording started. Its `rng` is
+    reseeded from the recorded `rng_seed`; the process-wide `random` is untouched.
+    """
+    report = ReplayReport()
+    if scripts is not None:
+        scripts.budget_ms = None
+        scripts.recorder = None
+
+    started = time.perf_counter()
+    with path.open("rb") as fp:
+        for index, (kind, payload) in enumerate(read_records(fp)):
+            report.records += 1
+            if kind is RecordKind.HEADER:
+                expected, actual = payload["fingerprint"], registry_fingerprint(registry)
+                if payload["rng_seed"] is not None and scripts is not None:
+                    scripts.rng.seed(payload["rng_seed"])
+            elif kind is RecordKind.SIMULATION:
+                report.simulations += 1
+                state = BattleState(**payload["state"])
+                expected = payload["result"]
+                actual = normalize(simulate_wave(state, duration_ticks=payload["duration_ticks"]))
+            else:
+                if scripts is None:
+                    raise ReplayError(f"record {index}: hook replay requires a ScriptManager")
+                if kind is RecordKind.HOOK:
+                    report.hooks += 1
+                    context = HookContext(**payload["context"])
+                    expected = payload["results"]
+                    actual = normalize(scripts.run_hook(payload["hook"], context=context))
+                else:
+                    report.ticks += 1
+                    version = scripts.state.version
+                    drained = scripts.end_tick()
+                    expected = payload
+                    actual = normalize(_tick_payload(scripts.state.diff(version), drained))
+
+            if expected != actual:
+                report.mismatches.append(
+                    ReplayMismatch(record=index, kind=kind.name.lower(), expected=expected, actual=actual)
+                )
+                if stop_on_mismatch:
+                    break
+
+    report.elapsed_s = time.perf_counter() - started
+    return report
@@ -1,6 +1,20 @@
 """Restricted scripting runtime for mod hook logic."""
 
+from pvz.scripting.events import DamageEvent, EventBus, EventChannel, ScriptEvent
 from pvz.scripting.manager import ScriptManager
 from pvz.scripting.runtime import CapabilityAPI, HookContext, HookRuntime
+from pvz.scripting.state import StateSnapshot, StateStore, StateTransaction
 
-__all__ = ["ScriptManager", "CapabilityAPI", "HookContext", "HookRuntime"]
+__all__ = [
+    "ScriptManager",
+    "CapabilityAPI",
+    "DamageEvent",
+    "EventBus",
+    "EventChannel",
+    "HookContext",
+    "HookRuntime",
+    "ScriptEvent",
+    "StateSnapshot",
+    "StateStore",
+    "StateTransaction",
+]
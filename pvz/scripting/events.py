@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generic, Iterator, TypeVar
+
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class ScriptEvent:
+    event: str
+    payload: dict[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class DamageEvent:
+    target: str
+    amount: int
+
+
+class RingBuffer(Generic[T]):
+    """Fixed-capacity FIFO backed by a preallocated list; overflow drops the oldest record."""
+
+    __slots__ = ("capacity", "dropped", "_slots", "_head", "_size")
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("ring buffer capacity must be positive")
+        self.capacity = capacity
+        self.dropped = 0
+        self._slots: list[T | None] = [None] * capacity
+        self._head = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[T]:
+        for offset in range(self._size):
+            yield self._slots[(self._head + offset) % self.capacity]  # type: ignore[misc]
+
+    def push(self, record: T) -> None:
+        tail = (self._head + self._size) % self.capacity
+        self._slots[tail] = record
+        if self._size == self.capacity:
+            self._head = (self._head + 1) % self.capacity
+            self.dropped += 1
+        else:
+            self._size += 1
+
+    def drain(self) -> list[T]:
+        records = list(self)
+        for offset in range(self._size):
+            self._slots[(self._head + offset) % self.capacity] = None
+        self._head = 0
+        self._size = 0
+        return records
+
+
+@dataclass
+class EventChannel(Generic[T]):
+    name: str
+    record_type: type[T]
+    capacity: int = 1024
+    buffer: RingBuffer[T] = field(init=False)
+    subscribers: list[Callable[[T], None]] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self.buffer = RingBuffer(self.capacity)
+
+    def publish(self, record: T) -> None:
+        if not isinstance(record, self.record_type):
+            raise TypeError(
+                f"channel `{self.name}` expects {self.record_type.__name__}, "
+                f"got {type(record).__name__}"
+            )
+        self.buffer.push(record)
+
+
+class EventBus:
+    def __init__(self, *, default_capacity: int = 1024) -> None:
+        self.default_capacity = default_capacity
+        self._channels: dict[str, EventChannel[Any]] = {}
+        self.register("events", ScriptEvent)
+        self.register("damage", DamageEvent)
+
+    def register(self, name: str, record_type: type[T], *, capacity: int | None = None) -> EventChannel[T]:
+        if name in self._channels:
+            raise ValueError(f"event channel already registered: {name}")
+        channel = EventChannel(name, record_type, capacity or self.default_capacity)
+        self._channels[name] = channel
+        return channel
+
+    def channel(self, name: str) -> EventChannel[Any]:
+        try:
+            return self._channels[name]
+        except KeyError:
+            raise KeyError(f"unknown event channel: {name}") from None
+
+    def subscribe(self, name: str, callback: Callable[[Any], None]) -> None:
+        self.channel(name).subscribers.append(callback)
+
+    def unsubscribe(self, name: str, callback: Callable[[Any], None]) -> None:
+        self.channel(name).subscribers.remove(callback)
+
+    def publish(self, name: str, record: Any) -> None:
+        self.channel(name).publish(record)
+
+    def pending(self, name: str) -> list[Any]:
+        return list(self.channel(name).buffer)
+
+    def drain(self) -> dict[str, list[Any]]:
+        """Deliver buffered records to subscribers and empty every channel.
+
+        Called once per tick; returns the drained records per channel so callers
+        without subscribers can still inspect what happened during the tick.
+        """
+        drained: dict[str, list[Any]] = {}
+        for name, channel in self._channels.items():
+            records = channel.buffer.drain()
+            drained[name] = records
+            for callback in channel.subscribers:
+                for record in records:
+                    callback(record)
+        return drained
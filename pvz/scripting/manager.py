@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import random
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 
 from pvz.models import ModPackage
+from pvz.profiling import NULL_PROFILER, NullProfiler, Profiler
+from pvz.scripting.events import EventBus
 from pvz.scripting.runtime import CapabilityAPI, HookContext, HookRuntime
+from pvz.scripting.state import StateStore, StateTransaction
+
+if TYPE_CHECKING:
+    from pvz.replay.recorder import Recorder
 
 
 @dataclass
@@ -16,23 +24,58 @@ class ScriptModule:
 @dataclass
 class ScriptManager:
     modules: list[ScriptModule] = field(default_factory=list)
-    shared_state: dict = field(default_factory=dict)
+    state: StateStore = field(default_factory=StateStore)
+    events: EventBus = field(default_factory=EventBus)
+    budget_ms: int | None = 16
+    recorder: Recorder | None = None
+    rng: random.Random = field(default_factory=random.Random, repr=False)
+    profiler: Profiler | NullProfiler = field(default=NULL_PROFILER, repr=False)
+    _write_sets: dict[int, StateTransaction] = field(default_factory=dict, init=False, repr=False)
 
     def load_from_mods(self, mods: list[ModPackage]) -> None:
-        for mod in mods:
-            for _, rel_path in mod.manifest.entrypoints.items():
-                path = mod.path / rel_path
-                runtime = HookRuntime()
-                runtime.load_script(path)
-                self.modules.append(
-                    ScriptModule(
-                        mod_id=mod.manifest.id,
-                        runtime=runtime,
-                        capabilities=set(mod.manifest.capabilities),
+        with self.profiler.span("ScriptManager.load_from_mods"):
+            for mod in mods:
+                for _, rel_path in mod.manifest.entrypoints.items():
+                    path = mod.path / rel_path
+                    runtime = HookRuntime()
+                    with self.profiler.span("compile_script", mod=mod.manifest.id):
+                        runtime.load_script(path)
+                    self.modules.append(
+                        ScriptModule(
+                            mod_id=mod.manifest.id,
+                            runtime=runtime,
+                            capabilities=set(mod.manifest.capabilities),
+                        )
                     )
-                )
 
-    def run_hook(self, hook_name: str, *, context: HookContext) -> None:
-        for module in self.modules:
-            api = CapabilityAPI(capabilities=module.capabilities, state=self.shared_state)
-            module.runtime.run_hook(hook_name, context=context, api=api)
+    def _write_set(self, index: int, module: ScriptModule) -> StateTransaction:
+        txn = self._write_sets.get(index)
+        if txn is None:
+            txn = self.state.begin(module.mod_id, order=index)
+            self._write_sets[index] = txn
+        return txn
+
+    def run_hook(self, hook_name: str, *, context: HookContext) -> list[Any]:
+        results: list[Any] = []
+        for index, module in enumerate(self.modules):
+            api = CapabilityAPI(
+                capabilities=module.capabilities,
+                state=self._write_set(index, module),
+                events=self.events,
+                rng=self.rng,
+            )
+            results.append(
+                module.runtime.run_hook(hook_name, context=context, api=api, budget_ms=self.budget_ms)
+            )
+        if self.recorder is not None:
+            self.recorder.record_hook(hook_name, context, results)
+        return results
+
+    def end_tick(self) -> dict[str, list]:
+        write_sets = list(self._write_sets.values())
+        self._write_sets.clear()
+        change = self.state.commit(write_sets)
+        drained = self.events.drain()
+        if self.recorder is not None:
+            self.recorder.record_tick(change, drained)
+        return drained
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import random
 import time
+from collections.abc import MutableMapping
 from dataclasses import dataclass, field
 from pathlib import Path
-from types import MappingProxyType
 from typing import Any, Callable
 
 from pvz.errors import ScriptSecurityError
+from pvz.scripting.events import DamageEvent, EventBus, ScriptEvent
 
 
 SAFE_BUILTINS = {
@@ -37,9 +39,19 @@ class HookContext:
 
 
 class CapabilityAPI:
-    def __init__(self, *, capabilities: set[str], state: dict[str, Any]) -> None:
+    def __init__(
+        self,
+        *,
+        capabilities: set[str],
+        state: MutableMapping[str, Any],
+        events: EventBus | None = None,
+        rng: random.Random | None = None,
+    ) -> None:
         self._capabilities = capabilities
         self._state = state
+        self.events = events if events is not None else EventBus()
+        # Scripts draw from this instead of the process-wide `random` so recordings can reseed it.
+        self.random = rng if rng is not None else random.Random()
 
     def _require(self, capability: str) -> None:
         if capability not in self._capabilities:
@@ -54,13 +66,11 @@ class CapabilityAPI:
 
     def emit_event(self, event: str, payload: dict[str, Any]) -> None:
         self._require("events.emit")
-        events = self._state.setdefault("events", [])
-        events.append({"event": event, "payload": payload})
+        self.events.publish("events", ScriptEvent(event=event, payload=payload))
 
     def apply_damage(self, target_id: str, amount: int) -> None:
         self._require("combat.write")
-        damages = self._state.setdefault("damage", [])
-        damages.append({"target": target_id, "amount": amount})
+        self.events.publish("damage", DamageEvent(target=target_id, amount=amount))
 
 
 class HookRuntime:
@@ -82,7 +92,8 @@ class HookRuntime:
         builtins_table["__import__"] = self._restricted_import
 
         namespace: dict[str, Any] = {
-            "__builtins__": MappingProxyType(builtins_table),
+            # A fresh dict per script: the import machinery rejects non-dict builtins.
+            "__builtins__": builtins_table,
         }
         try:
             exec(compile(code, str(script_path), "exec"), namespace, namespace)
@@ -101,7 +112,7 @@ class HookRuntime:
         *,
         context: HookContext,
         api: CapabilityAPI,
-        budget_ms: int = 16,
+        budget_ms: int | None = 16,
     ) -> Any:
         hook = self._hooks.get(hook_name)
         if hook is None:
@@ -115,6 +126,8 @@ class HookRuntime:
         except Exception as exc:
             raise ScriptSecurityError(f"hook {hook_name} failed: {exc}") from exc
 
+        if budget_ms is None:
+            return result
         elapsed_ms = (time.perf_counter() - started) * 1000.0
         if elapsed_ms > budget_ms:
             raise ScriptSecurityError(
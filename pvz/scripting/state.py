@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from pvz.frozen import freeze_value
+
+
+_MISSING = object()
+# Chains longer than this are flattened on commit, bounding lookups and amortizing the copy.
+MAX_LAYERS = 16
+
+
+@dataclass(frozen=True)
+class StateSnapshot:
+    version: int
+    data: Mapping[str, Any]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.data.get(key, default)
+
+
+@dataclass(frozen=True)
+class StateChange:
+    version: int
+    values: dict[str, Any]
+    previous: dict[str, Any]
+    writers: dict[str, str]
+
+
+class StateLayer(Mapping[str, Any]):
+    """Read-only state at one version: the keys that version changed, over its parent's view.
+
+    A key mapped to `_MISSING` was removed at this version (by a rollback).
+    """
+
+    __slots__ = ("_values", "_parent", "depth", "_size")
+
+    def __init__(self, values: dict[str, Any], parent: StateLayer | None = None) -> None:
+        self._values = values
+        self._parent = parent
+        self.depth = parent.depth + 1 if parent is not None else 0
+        size = len(parent) if parent is not None else 0
+        for key, value in values.items():
+            present = parent is not None and key in parent
+            if value is _MISSING:
+                size -= present
+            elif not present:
+                size += 1
+        self._size = size
+
+    def __getitem__(self, key: str) -> Any:
+        layer: StateLayer | None = self
+        while layer is not None:
+            if key in layer._values:
+                value = layer._values[key]
+                if value is _MISSING:
+                    break
+                return value
+            layer = layer._parent
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        seen: set[str] = set()
+        layer: StateLayer | None = self
+        while layer is not None:
+            for key, value in layer._values.items():
+                if key not in seen:
+                    seen.add(key)
+                    if value is not _MISSING:
+                        yield key
+            layer = layer._parent
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, values: dict[str, Any]) -> StateLayer:
+        """New layer with `values` on top; flattens the chain once it reaches `MAX_LAYERS`."""
+        layer = StateLayer(values, self)
+        if layer.depth < MAX_LAYERS:
+            return layer
+        chain: list[StateLayer] = []
+        node: StateLayer | None = layer
+        while node is not None:
+            chain.append(node)
+            node = node._parent
+        flat: dict[str, Any] = {}
+        for node in reversed(chain):
+            for key, value in node._values.items():
+                if value is _MISSING:
+                    flat.pop(key, None)
+                else:
+                    flat[key] = value
+        return StateLayer(flat)
+
+
+class StateTransaction(MutableMapping[str, Any]):
+    """Per-module write set layered over the snapshot taken when the tick started.
+
+    Values are frozen (`pvz.frozen.freeze_value`) as they are written, so nothing
+    read back from a transaction or a snapshot can be mutated in place.
+    """
+
+    def __init__(self, base: StateSnapshot, *, module_id: str, order: int) -> None:
+        self.base = base
+        self.module_id = module_id
+        self.order = order
+        self.writes: dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.writes:
+            return self.writes[key]
+        return self.base.data[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.writes[key] = freeze_value(value)
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError("script state keys cannot be deleted")
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.writes
+        for key in self.base.data:
+            if key not in self.writes:
+                yield key
+
+    def __len__(self) -> int:
+        return len(self.base.data) + sum(1 for key in self.writes if key not in self.base.data)
+
+
+@dataclass
+class StateStore:
+    """Versioned script state; every commit publishes a new `StateLayer` and never mutates old ones.
+
+    A commit or rollback stacks one layer holding only the changed keys, so it
+    costs O(changes); every `MAX_LAYERS` commits the chain is flattened, adding
+    an amortized O(state / MAX_LAYERS).
+    """
+
+    history: int = 256
+    version: int = 0
+    _data: StateLayer = field(default_factory=lambda: StateLayer({}))
+    _changes: deque[StateChange] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._changes = deque(maxlen=self.history)
+
+    def snapshot(self) -> StateSnapshot:
+        return StateSnapshot(version=self.version, data=self._data)
+
+    def begin(self, module_id: str, *, order: int = 0) -> StateTransaction:
+        return StateTransaction(self.snapshot(), module_id=module_id, order=order)
+
+    def commit(self, transactions: Iterable[StateTransaction]) -> StateChange | None:
+        """Merge write sets in (order, module_id) order; later modules win on shared keys."""
+        values: dict[str, Any] = {}
+        writers: dict[str, str] = {}
+        for txn in sorted(transactions, key=lambda t: (t.order, t.module_id)):
+            for key, value in txn.writes.items():
+                values[key] = value
+                writers[key] = txn.module_id
+        if not values:
+            return None
+
+        previous = {key: self._data.get(key, _MISSING) for key in values}
+        self._data = self._data.push(values)
+        self.version += 1
+        change = StateChange(version=self.version, values=values, previous=previous, writers=writers)
+        self._changes.append(change)
+        return change
+
+    def _changes_after(self, version: int) -> list[StateChange]:
+        if version > self.version:
+            raise ValueError(f"unknown state version: {version}")
+        pending = [change for change in self._changes if change.version > version]
+        expected = self.version - version
+        if len(pending) != expected:
+            raise ValueError(f"state history no longer covers version {version}")
+        return pending
+
+    def diff(self, since_version: int) -> dict[str, Any]:
+        """Return keys changed after `since_version` with their current values."""
+        result: dict[str, Any] = {}
+        for change in self._changes_after(since_version):
+            result.update(change.values)
+        return result
+
+    def rollback(self, version: int) -> None:
+        pending = self._changes_after(version)
+        if not pending:
+            return
+        # Newest first, so the oldest pending change's `previous` (the value at `version`) wins.
+        restored: dict[str, Any] = {}
+        for change in reversed(pending):
+            restored.update(change.previous)
+        for _ in pending:
+            self._changes.pop()
+        self._data = self._data.push(restored)
+        self.version = version
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 
 @dataclass(frozen=True, order=True)
@@ -16,35 +17,160 @@ class SemVer:
             raise ValueError(f"invalid semver: {raw}")
         return cls(*(int(p) for p in parts))
 
+    def next_patch(self) -> "SemVer":
+        return SemVer(self.major, self.minor, self.patch + 1)
+
+    def __str__(self) -> str:
+        return f"{self.major}.{self.minor}.{self.patch}"
+
+
+ZERO = SemVer(0, 0, 0)
+
+
+@lru_cache(maxsize=4096)
+def parse_version(raw: str) -> SemVer:
+    return SemVer.parse(raw)
+
+
+@dataclass(frozen=True)
+class Interval:
+    """Half-open version range `[lower, upper)`; `upper=None` is unbounded."""
+
+    lower: SemVer = ZERO
+    upper: SemVer | None = None
+
+    @property
+    def is_empty(self) -> bool:
+        return self.upper is not None and self.lower >= self.upper
+
+    def contains(self, version: SemVer) -> bool:
+        return self.lower <= version and (self.upper is None or version < self.upper)
+
+    def intersect(self, other: "Interval") -> "Interval":
+        lower = max(self.lower, other.lower)
+        if self.upper is None:
+            upper = other.upper
+        elif other.upper is None:
+            upper = self.upper
+        else:
+            upper = min(self.upper, other.upper)
+        return Interval(lower, upper)
+
+    def __str__(self) -> str:
+        if self.upper is None:
+            return f">={self.lower}"
+        if self.upper == self.lower.next_patch():
+            return f"=={self.lower}"
+        return f">={self.lower}, <{self.upper}"
+
+
+def _normalize(intervals: list[Interval]) -> tuple[Interval, ...]:
+    """Drop empty intervals, sort, and merge overlapping or touching ones."""
+    merged: list[Interval] = []
+    for interval in sorted((i for i in intervals if not i.is_empty), key=lambda i: i.lower):
+        if merged:
+            last = merged[-1]
+            if last.upper is None or interval.lower <= last.upper:
+                upper = None if last.upper is None or interval.upper is None else max(last.upper, interval.upper)
+                merged[-1] = Interval(last.lower, upper)
+                continue
+        merged.append(interval)
+    return tuple(merged)
+
+
+def _clause(piece: str) -> Interval:
+    if piece[0] in "^~":
+        base = SemVer.parse(piece[1:])
+        if piece[0] == "^":
+            return Interval(base, SemVer(base.major + 1, 0, 0))
+        return Interval(base, SemVer(base.major, base.minor + 1, 0))
+    for op in (">=", "<=", "==", ">", "<"):
+        if piece.startswith(op):
+            bound = SemVer.parse(piece[len(op) :])
+            break
+    else:
+        op, bound = "==", SemVer.parse(piece)
+    if op == ">=":
+        return Interval(bound, None)
+    if op == ">":
+        return Interval(bound.next_patch(), None)
+    if op == "<":
+        return Interval(ZERO, bound)
+    if op == "<=":
+        return Interval(ZERO, bound.next_patch())
+    return Interval(bound, bound.next_patch())
+
+
+@dataclass(frozen=True)
+class Constraint:
+    """A compiled version constraint: a sorted union of disjoint half-open intervals.
+
+    Comma-separated clauses are intersected; `^1.2.3` is `[1.2.3, 2.0.0)`,
+    `~1.2.3` is `[1.2.3, 1.3.0)` and `>x`/`<=x` use the next patch version as the
+    bound, so every constraint normalizes to the same interval form.
+    """
+
+    intervals: tuple[Interval, ...]
+    source: str = field(default="", compare=False)
+
+    @classmethod
+    def parse(cls, raw: str) -> "Constraint":
+        return _parse_constraint(raw)
+
+    @classmethod
+    def any(cls) -> "Constraint":
+        return ANY
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.intervals
+
+    def contains(self, version: SemVer) -> bool:
+        for interval in self.intervals:
+            if version < interval.lower:
+                return False
+            if interval.upper is None or version < interval.upper:
+                return True
+        return False
+
+    def intersect(self, other: "Constraint") -> "Constraint":
+        pieces = [a.intersect(b) for a in self.intervals for b in other.intervals]
+        source = ", ".join(part for part in (self.source, other.source) if part)
+        return Constraint(_normalize(pieces), source=source)
+
+    def complement(self) -> "Constraint":
+        pieces: list[Interval] = []
+        cursor: SemVer | None = ZERO
+        for interval in self.intervals:
+            if cursor is not None and cursor < interval.lower:
+                pieces.append(Interval(cursor, interval.lower))
+            cursor = interval.upper
+        if cursor is not None:
+            pieces.append(Interval(cursor, None))
+        return Constraint(_normalize(pieces), source=f"not ({self.source})" if self.source else "")
+
+    def __str__(self) -> str:
+        if self.source:
+            return self.source
+        if not self.intervals:
+            return "<empty>"
+        return " || ".join(str(interval) for interval in self.intervals)
+
+
+ANY = Constraint((Interval(),), source="*")
+
+
+@lru_cache(maxsize=4096)
+def _parse_constraint(raw: str) -> Constraint:
+    result = ANY
+    for piece in raw.split(","):
+        piece = piece.strip()
+        if piece:
+            result = result.intersect(Constraint((_clause(piece),)))
+    return Constraint(result.intervals, source=raw.strip())
+
 
 def satisfies(version: str, constraint: str) -> bool:
     if not constraint:
         return True
-    v = SemVer.parse(version)
-    c = constraint.strip()
-
-    if "," in c:
-        return all(satisfies(version, piece.strip()) for piece in c.split(","))
-
-    if c.startswith("^"):
-        base = SemVer.parse(c[1:])
-        return v >= base and v.major == base.major
-    if c.startswith("~"):
-        base = SemVer.parse(c[1:])
-        return v >= base and (v.major, v.minor) == (base.major, base.minor)
-
-    ops = [">=", "<=", ">", "<", "=="]
-    for op in ops:
-        if c.startswith(op):
-            rhs = SemVer.parse(c[len(op) :])
-            if op == ">=":
-                return v >= rhs
-            if op == "<=":
-                return v <= rhs
-            if op == ">":
-                return v > rhs
-            if op == "<":
-                return v < rhs
-            return v == rhs
-
-    return v == SemVer.parse(c)
+    return Constraint.parse(constraint).contains(parse_version(version))
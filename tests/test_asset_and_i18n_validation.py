@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import json
+import shutil
 import tempfile
 import unittest
 from pathlib import Path
 
+from pvz.assets import AssetRegistry, BuiltinJSONHandler
+from pvz.assets.archive import ModArchive, write_archive
+from pvz.content.asset_validation import AssetIndex
 from pvz.content.loader import ModLoader
 from pvz.errors import AssetValidationError, LocalizationValidationError
 
@@ -80,6 +84,34 @@ class AssetAndI18nValidationTests(unittest.TestCase):
                 loaded.registry.categories["media_resources"],
             )
 
+    def test_refs_resolve_against_packed_archive(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            mods = Path(tmp)
+            base = _init_base_mod(mods)
+            raw = base / "assets" / "indexes" / "media" / "raw.json"
+            raw.parent.mkdir(parents=True, exist_ok=True)
+            raw.write_text(json.dumps({"pages": ["x"] * 200}), encoding="utf-8")
+            write_archive(base)
+            shutil.rmtree(base / "assets")
+
+            _write_json(
+                base / "content" / "media_resources" / "index.json",
+                {
+                    "id": "media_index",
+                    "source": "test",
+                    "textures": [],
+                    "sounds": [],
+                    "raw_snapshot": "assets/indexes/media/raw.json",
+                },
+            )
+            ModLoader(mods, schema_root=SCHEMAS).load()
+
+            assets = AssetRegistry()
+            assets.register(BuiltinJSONHandler())
+            self.assertTrue(assets.mount(base))
+            payload = assets.load_path(base / "assets" / "indexes" / "media" / "raw.json")
+            self.assertEqual(len(payload["pages"]), 200)
+
     def test_animation_texture_parent_traversal_fails(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             mods = Path(tmp)
@@ -106,6 +138,44 @@ class AssetAndI18nValidationTests(unittest.TestCase):
             with self.assertRaises(AssetValidationError):
                 loader.load()
 
+    def test_asset_index_normalizes_refs_and_rejects_escaping_symlinks(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            base = _init_base_mod(root / "mods")
+            sprite = base / "assets" / "sprites" / "pea.png"
+            sprite.parent.mkdir(parents=True)
+            sprite.write_bytes(b"png")
+            outside = root / "outside.png"
+            outside.write_bytes(b"png")
+            (base / "assets" / "sprites" / "escape.png").symlink_to(outside)
+
+            index = AssetIndex.build(base)
+            self.assertIsNone(index.check("assets/sprites/pea.png"))
+            self.assertIsNone(index.check("assets/./sprites//pea.png"))
+            self.assertEqual(index.check("assets/sprites/escape.png"), "asset path escapes mod root")
+            self.assertEqual(index.check("/etc/passwd"), "absolute asset path is not allowed")
+
+            write_archive(base)
+            self.assertNotIn("assets/sprites/escape.png", ModArchive(base / "assets.pak"))
+            packed = AssetIndex.build(base)
+            self.assertEqual(packed.check("assets/sprites/escape.png"), "asset path escapes mod root")
+
+    def test_asset_index_rejects_assets_dir_symlinked_outside_mod(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            base = _init_base_mod(root / "mods")
+            outside = root / "outside"
+            (outside / "sprites").mkdir(parents=True)
+            (outside / "sprites" / "pea.png").write_bytes(b"png")
+            (base / "assets").symlink_to(outside, target_is_directory=True)
+
+            index = AssetIndex.build(base)
+            self.assertEqual(index.check("assets/sprites/pea.png"), "asset path escapes mod root")
+            self.assertNotIn("assets/sprites/pea.png", index.paths)
+
+            write_archive(base)
+            self.assertEqual(len(ModArchive(base / "assets.pak")), 0)
+
     def test_localization_extra_key_fails(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             mods = Path(tmp)
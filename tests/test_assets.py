@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import struct
+import tempfile
+import unittest
+from pathlib import Path
+
+from pvz.assets import AssetCache, AssetPrefetcher, AssetRegistry, BuiltinJSONHandler, plan_level_assets
+from pvz.assets.atlas import TextureInfo, apply_atlas, pack_textures, read_png_size
+from pvz.models import ContentItem, ContentRegistry
+
+
+def _item(category: str, item_id: str, data: dict, source_mod: str = "test.mod") -> ContentItem:
+    return ContentItem(
+        id=item_id,
+        category=category,
+        data=data,
+        source_mod=source_mod,
+        source_path=Path(f"{item_id}.json"),
+    )
+
+
+class ChunkCounter:
+    suffixes = (".bank",)
+
+    def can_handle(self, path: Path) -> bool:
+        return True
+
+    def load_stream(self, chunks, *, path: Path) -> list[int]:
+        return [len(chunk) for chunk in chunks]
+
+
+class AssetRegistryTests(unittest.TestCase):
+    def test_dispatches_by_suffix(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "data.JSON"
+            path.write_text('{"a": 1}', encoding="utf-8")
+            assets = AssetRegistry()
+            assets.register(BuiltinJSONHandler())
+            self.assertEqual(assets.load_path(path), {"a": 1})
+            self.assertIsNone(assets.handler_for(Path("sheet.png")))
+
+    def test_large_unhandled_files_are_memory_mapped(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "sheet.png"
+            path.write_bytes(b"x" * 4096)
+            assets = AssetRegistry(mmap_threshold=1024)
+            view = assets.load_path(path)
+            self.assertIsInstance(view, memoryview)
+            self.assertEqual(view.nbytes, 4096)
+            self.assertEqual(bytes(view[:2]), b"xx")
+
+    def test_empty_files_are_not_memory_mapped(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "empty.png"
+            path.write_bytes(b"")
+            self.assertEqual(AssetRegistry(mmap_threshold=0).load_path(path), b"")
+
+    def test_streaming_handler_receives_chunks(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "music.bank"
+            path.write_bytes(b"y" * 2500)
+            assets = AssetRegistry(chunk_size=1000)
+            assets.register(ChunkCounter())
+            self.assertEqual(assets.load_path(path), [1000, 1000, 500])
+
+    def test_cache_reuses_decoded_assets(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "anim.json"
+            path.write_text('{"frames": []}', encoding="utf-8")
+            assets = AssetRegistry()
+            assets.register(BuiltinJSONHandler())
+            first = assets.load_path(path)
+            self.assertIs(assets.load_path(path), first)
+            self.assertEqual((assets.cache.stats.hits, assets.cache.stats.misses), (1, 1))
+
+    def test_lru_eviction_skips_referenced_and_pinned_entries(self) -> None:
+        cache = AssetCache(max_bytes=30)
+        cache.put("held", "h", 10, acquire=True)
+        cache.put("pinned", "p", 10)
+        cache.pin("pinned")
+        cache.put("old", "o", 10)
+        cache.put("new", "n", 10)
+
+        self.assertNotIn("old", cache)
+        self.assertIn("held", cache)
+        self.assertIn("pinned", cache)
+        self.assertEqual(cache.stats.evictions, 1)
+
+        cache.release("held")
+        cache.put("newer", "n", 10)
+        self.assertNotIn("held", cache)
+        self.assertEqual(cache.size_bytes, 30)
+
+    def test_pin_keeps_assets_larger_than_the_free_budget(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            first, second = Path(tmp) / "big1.bin", Path(tmp) / "big2.bin"
+            first.write_bytes(b"a" * 3000)
+            second.write_bytes(b"b" * 3000)
+            assets = AssetRegistry(cache=AssetCache(max_bytes=4000))
+            assets.pin(first)
+            self.assertEqual(bytes(assets.pin(second)), b"b" * 3000)
+            self.assertIn(str(first), assets.cache)
+            self.assertIn(str(second), assets.cache)
+
+            assets.cache.unpin(str(first))
+            self.assertNotIn(str(first), assets.cache)
+            self.assertEqual(assets.cache.size_bytes, 3000)
+
+    def test_prefetch_plan_covers_level_entities(self) -> None:
+        registry = ContentRegistry()
+        registry.add(
+            _item(
+                "levels",
+                "test.mod:levels:one",
+                {"zombie_pool": ["z:basic"], "waves": [{"zombie_id": "z:cone", "tick": 1}]},
+            )
+        )
+        registry.add(_item("plants", "p:pea", {"projectile_id": "proj:pea"}))
+        for target, texture in (
+            ("z:cone", "assets/cone.png"),
+            ("proj:pea", "https://example.com/pea.png"),
+            ("z:unused", "assets/unused.png"),
+        ):
+            registry.add(
+                _item(
+                    "animation_configs",
+                    f"anim:{target}",
+                    {"target_id": target, "frames": [{"texture": texture}], "sound_events": []},
+                )
+            )
+        registry.add(_item("audio_events", "a:hit", {"asset": "assets/hit.ogg", "tags": ["combat"]}))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            mod_root = Path(tmp)
+            (mod_root / "assets").mkdir()
+            (mod_root / "assets" / "cone.png").write_bytes(b"cone")
+
+            plan = plan_level_assets(
+                registry,
+                "test.mod:levels:one",
+                mod_paths={"test.mod": mod_root},
+                unlocked_plants=["p:pea"],
+            )
+            self.assertEqual(plan.entities, ["z:basic", "z:cone", "p:pea", "proj:pea"])
+            self.assertEqual(plan.paths, [mod_root / "assets/cone.png", mod_root / "assets/hit.ogg"])
+            self.assertEqual(plan.remote, ["https://example.com/pea.png"])
+
+            assets = AssetRegistry()
+            with AssetPrefetcher(assets, max_workers=2) as prefetcher:
+                result = prefetcher.start(plan).wait()
+            self.assertEqual(result.loaded, [mod_root / "assets/cone.png"])
+            self.assertIn(mod_root / "assets/hit.ogg", result.failed)
+            self.assertIn(str(mod_root / "assets/cone.png"), assets.cache)
+
+    def test_prefetch_plan_keeps_same_ref_from_different_mods(self) -> None:
+        registry = ContentRegistry()
+        registry.add(_item("levels", "test.mod:levels:one", {"zombie_pool": ["z:basic", "z:cone"]}))
+        for target, mod in (("z:basic", "test.mod"), ("z:cone", "other.mod")):
+            frames = [{"texture": "textures/zombie.png"}, {"texture": "https://example.com/shared.png"}]
+            registry.add(
+                _item("animation_configs", f"anim:{target}", {"target_id": target, "frames": frames}, source_mod=mod)
+            )
+
+        mod_paths = {"test.mod": Path("mods/test"), "other.mod": Path("mods/other")}
+        plan = plan_level_assets(registry, "test.mod:levels:one", mod_paths=mod_paths)
+        self.assertEqual(plan.paths, [Path("mods/test/textures/zombie.png"), Path("mods/other/textures/zombie.png")])
+        self.assertEqual(plan.remote, ["https://example.com/shared.png"])
+
+    def test_atlas_packing_is_incremental(self) -> None:
+        png = b"\x89PNG\r\n\x1a\n" + struct.pack(">I4sII", 13, b"IHDR", 30, 20)
+        self.assertEqual(read_png_size(png), (30, 20))
+
+        textures = {
+            "m/assets/a.png": TextureInfo(100, 60, "a"),
+            "m/assets/b.png": TextureInfo(40, 60, "b"),
+            "m/assets/c.png": TextureInfo(80, 30, "c"),
+        }
+        first = pack_textures(textures, page_size=128)
+        self.assertEqual(len(first.pages), 1)
+        self.assertEqual(first.uv("m/assets/a.png"), (0.0, 0.0, 100 / 128, 60 / 128))
+
+        textures["m/assets/b.png"] = TextureInfo(40, 60, "b2")
+        textures["m/assets/d.png"] = TextureInfo(120, 120, "d")
+        second = pack_textures(textures, previous=first, page_size=128)
+        for name in ("m/assets/a.png", "m/assets/b.png", "m/assets/c.png"):
+            self.assertEqual(
+                (second.placements[name].page, second.placements[name].x, second.placements[name].y),
+                (first.placements[name].page, first.placements[name].x, first.placements[name].y),
+            )
+        self.assertEqual(second.placements["m/assets/d.png"].page, 1)
+        self.assertEqual(second.dirty_pages, {0, 1})
+
+        # Dropping or resizing a texture leaves stale pixels on its old page, so that page is recomposed.
+        unchanged = pack_textures(textures, previous=second, page_size=128)
+        self.assertEqual(unchanged.dirty_pages, set())
+        del textures["m/assets/d.png"]
+        self.assertEqual(pack_textures(textures, previous=second, page_size=128).dirty_pages, {1})
+        textures["m/assets/c.png"] = TextureInfo(20, 10, "c")
+        resized = pack_textures(textures, previous=second, page_size=128)
+        self.assertIn(0, resized.dirty_pages)
+        self.assertNotIn("m/assets/d.png", resized.placements)
+
+        registry = ContentRegistry()
+        registry.add(
+            ContentItem(
+                id="m:animation_configs:walk",
+                category="animation_configs",
+                data={"frames": [{"texture": "assets/c.png"}, {"texture": "https://example.com/x.png"}]},
+                source_mod="m",
+                source_path=Path("walk.json"),
+            )
+        )
+        self.assertEqual(apply_atlas(registry, second), 1)
+        frame = registry.get("animation_configs", "m:animation_configs:walk").data["frames"][0]
+        self.assertEqual(frame["atlas"]["page"], "page_0.png")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from benchmarks.harness import compare, measure
+from benchmarks.suite import build_suite
+from benchmarks.synthetic import SCALES, generate_mod_set
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCHEMAS = ROOT / "schemas"
+
+
+class BenchmarkSuiteTests(unittest.TestCase):
+    def test_suite_runs_on_tiny_synthetic_mod_set(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            mods = generate_mod_set(Path(tmp), SCALES["tiny"], seed=7)
+            suite = build_suite(mods, SCHEMAS)
+            names = [bench.name for bench in suite]
+            self.assertEqual(
+                names,
+                [
+                    "loader.load",
+                    "schema.validate",
+                    "patcher.apply_patches",
+                    "dependency.resolve_load_order",
+                    "dependency.resolve_load_order.memo",
+                    "stats.build",
+                    "combat.simulate_wave",
+                    "combat.grid.step",
+                    "combat.naive.step",
+                ],
+            )
+            for bench in suite:
+                timing = measure(bench, repeat=1, warmup=0)
+                self.assertEqual(len(timing.samples_s), 1)
+                self.assertGreater(timing.to_json()["items"], 0)
+
+    def test_compare_flags_regressions_beyond_threshold(self) -> None:
+        baseline = {"results": {"a": {"median_s": 1.0}, "b": {"median_s": 1.0}, "gone": {"median_s": 1.0}}}
+        current = {"results": {"a": {"median_s": 1.2}, "b": {"median_s": 0.5}, "added": {"median_s": 1.0}}}
+        statuses = {row.name: row.status for row in compare(baseline, current, threshold=0.1)}
+        self.assertEqual(statuses, {"a": "regressed", "b": "improved", "gone": "missing", "added": "new"})
+
+
+if __name__ == "__main__":
+    unittest.main()
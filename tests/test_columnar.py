@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import importlib.util
+import math
+import unittest
+from pathlib import Path
+
+from pvz.content.columnar import build_table, build_tables, scalar_columns
+from pvz.content.loader import ModLoader
+from pvz.models import ContentItem, ContentRegistry
+
+
+ROOT = Path(__file__).resolve().parents[1]
+ZOMBIE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "string"},
+        "speed": {"type": "number"},
+        "reward": {"type": "integer"},
+        "armored": {"type": "boolean"},
+        "resists": {"type": "array"},
+        "drop": {"type": "object", "properties": {"item": {"type": "string"}}},
+    },
+}
+
+
+def _registry(*rows: dict) -> ContentRegistry:
+    registry = ContentRegistry()
+    for data in rows:
+        registry.add(ContentItem(id=data["id"], category="zombies", data=data, source_mod="test", source_path=Path("x.json")))
+    return registry
+
+
+class ColumnarTests(unittest.TestCase):
+    def test_scalar_columns_flatten_nested_objects(self) -> None:
+        names = [spec.name for spec in scalar_columns(ZOMBIE_SCHEMA)]
+        self.assertEqual(names, ["id", "speed", "reward", "armored", "drop.item"])
+
+    def test_typed_columns_with_null_masks(self) -> None:
+        registry = _registry(
+            {"id": "b", "speed": 2, "reward": 10, "armored": True, "drop": {"item": "coin"}},
+            {"id": "a", "speed": 0.5, "reward": "lots"},
+        )
+        table = build_table(registry, "zombies", ZOMBIE_SCHEMA)
+        self.assertEqual(table.ids, ["a", "b"])
+        self.assertNotIn("id", table.columns)
+
+        speed = table.column("speed")
+        self.assertEqual(speed.values.typecode, "d")
+        self.assertEqual(list(speed.values), [0.5, 2.0])
+
+        reward = table.column("reward")
+        self.assertEqual(list(reward.valid), [0, 1])
+        self.assertIsNone(table.value("a", "reward"))
+        self.assertEqual(table.value("b", "reward"), 10)
+        self.assertIs(table.value("b", "armored"), True)
+        self.assertEqual(table.value("b", "drop.item"), "coin")
+        self.assertIsNone(table.value("a", "drop.item"))
+
+    def test_out_of_range_numbers_are_masked(self) -> None:
+        registry = _registry(
+            {"id": "a", "speed": 10**400, "reward": 2**63},
+            {"id": "b", "speed": 1.5, "reward": -(2**63)},
+        )
+        table = build_table(registry, "zombies", ZOMBIE_SCHEMA)
+        self.assertIsNone(table.value("a", "reward"))
+        self.assertIsNone(table.value("a", "speed"))
+        self.assertEqual(table.value("b", "reward"), -(2**63))
+        self.assertEqual(table.value("b", "speed"), 1.5)
+
+    def test_base_mod_stats(self) -> None:
+        loader = ModLoader(ROOT / "mods", schema_root=ROOT / "schemas")
+        registry = loader.load().registry
+        tables = build_tables(registry, loader.schemas, ["plants", "zombies"])
+        plants = tables["plants"]
+        self.assertEqual(len(plants), len(registry.categories["plants"]))
+        for item_id, item in registry.categories["plants"].items():
+            self.assertEqual(plants.value(item_id, "cost"), item.data["cost"])
+            self.assertTrue(math.isclose(plants.value(item_id, "cooldown"), item.data["cooldown"]))
+        self.assertTrue(all(tables["zombies"].column("speed").valid))
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "numpy is not installed")
+    def test_numpy_record_array(self) -> None:
+        table = build_table(_registry({"id": "a", "speed": 1.5, "reward": 3}), "zombies", ZOMBIE_SCHEMA)
+        records = table.to_numpy()
+        self.assertEqual(records["reward"][0], 3)
+        self.assertFalse(records["armored.valid"][0])
+
+
+if __name__ == "__main__":
+    unittest.main()
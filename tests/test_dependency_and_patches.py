@@ -3,10 +3,14 @@ from __future__ import annotations
 import json
 import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from pvz.content.dedup import SubtreePool
+from pvz.content.dependency import LoadOrderCache, resolve_load_order
 from pvz.content.loader import ModLoader
 from pvz.errors import DependencyError
+from pvz.models import Dependency, ModManifest, ModPackage
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -18,6 +22,11 @@ def _write_json(path: Path, payload: dict) -> None:
     path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
 
 
+def _mod(mod_id: str, version: str = "1.0.0", *, requires: tuple[Dependency, ...] = (), **fields) -> ModPackage:
+    manifest = ModManifest(id=mod_id, version=version, title=mod_id, engine_api="1.0", requires=requires, **fields)
+    return ModPackage(manifest=manifest, path=Path(mod_id))
+
+
 class DependencyAndPatchTests(unittest.TestCase):
     def test_dependency_version_mismatch_fails(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
@@ -119,6 +128,146 @@ class DependencyAndPatchTests(unittest.TestCase):
             self.assertEqual(pea["damage"], 35)
             self.assertEqual(loaded.mod_ids, ["pvz.base", "addon"])
 
+    def test_resolver_reports_every_violation_at_once(self) -> None:
+        mods = {
+            "base": _mod("base", "1.4.0"),
+            "a": _mod("a", requires=(Dependency("base", "^2.0.0"),)),
+            "b": _mod("b", requires=(Dependency("ghost"),)),
+            "c": _mod("c", conflicts=(Dependency("base", "~1.4.0"),)),
+        }
+        with self.assertRaises(DependencyError) as ctx:
+            resolve_load_order(mods, memoize=False)
+        self.assertEqual(
+            sorted(ctx.exception.problems),
+            [
+                "a requires base ^2.0.0, got 1.4.0",
+                "b requires missing mod ghost",
+                "c conflicts with base ~1.4.0",
+            ],
+        )
+
+    def test_resolver_detects_unsatisfiable_constraint_combinations(self) -> None:
+        mods = {
+            "base": _mod("base", "1.4.0"),
+            "old": _mod("old", requires=(Dependency("lib", "^1.0.0"),)),
+            "new": _mod("new", requires=(Dependency("lib", ">=2.0.0"),)),
+            "pin": _mod("pin", requires=(Dependency("base", "~1.4.0"),)),
+            "hater": _mod("hater", conflicts=(Dependency("base", "^1.0.0"),)),
+        }
+        with self.assertRaises(DependencyError) as ctx:
+            resolve_load_order(mods, memoize=False)
+        self.assertEqual(
+            sorted(ctx.exception.problems),
+            [
+                "no version of base can satisfy: pin requires ~1.4.0; hater conflicts with ^1.0.0",
+                "no version of lib can satisfy: old requires ^1.0.0; new requires >=2.0.0",
+            ],
+        )
+
+    def test_resolver_reports_exact_cycles(self) -> None:
+        mods = {
+            "base": _mod("base"),
+            "a": _mod("a", load_after=("c",)),
+            "b": _mod("b", load_after=("a",)),
+            "c": _mod("c", load_after=("b",)),
+            "d": _mod("d", load_after=("d",)),
+            "e": _mod("e", load_after=("a",)),
+        }
+        with self.assertRaises(DependencyError) as ctx:
+            resolve_load_order(mods, memoize=False)
+        self.assertEqual(
+            sorted(ctx.exception.problems),
+            [
+                "dependency cycle: a -> b -> c -> a (members: a, b, c)",
+                "dependency cycle: d -> d (members: d)",
+            ],
+        )
+
+    def test_memoized_resolution_is_thread_safe(self) -> None:
+        # More distinct manifest sets than the memo holds, so threads keep inserting and trimming it.
+        mod_sets = [
+            {"base": _mod("base", f"1.0.{n}"), "addon": _mod("addon", requires=(Dependency("base"),))}
+            for n in range(40)
+        ]
+
+        def resolve(index: int) -> list[str]:
+            return [mod.manifest.id for mod in resolve_load_order(mod_sets[index % len(mod_sets)])]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            orders = list(pool.map(resolve, range(2000)))
+        self.assertEqual(orders, [["base", "addon"]] * 2000)
+
+    def test_resolved_order_is_memoized_and_persisted(self) -> None:
+        mods = {
+            "base": _mod("base"),
+            "ui": _mod("ui", requires=(Dependency("base", ">=1.0.0"),), load_before=("addon",)),
+            "addon": _mod("addon", requires=(Dependency("base"),)),
+        }
+        first = [mod.manifest.id for mod in resolve_load_order(mods)]
+        self.assertEqual(first, ["base", "ui", "addon"])
+        self.assertEqual([mod.manifest.id for mod in resolve_load_order(dict(mods))], first)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "load_order.json"
+            cache = LoadOrderCache(path)
+            resolve_load_order(mods, cache=cache, memoize=False)
+            cache.save()
+            reloaded = LoadOrderCache(path)
+            self.assertEqual(len(json.loads(path.read_text())), 1)
+            ordered = resolve_load_order(mods, cache=reloaded, memoize=False)
+            self.assertEqual([mod.manifest.id for mod in ordered], first)
+
+    def test_identical_subtrees_are_shared_and_patched_copy_on_write(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            mods = Path(tmp)
+            _write_json(
+                mods / "pvz.base" / "mod.json",
+                {"id": "pvz.base", "version": "1.0.0", "title": "Base", "engine_api": "1.0"},
+            )
+            for plant_id in ("pea", "repeater", "threepeater"):
+                _write_json(
+                    mods / "pvz.base" / "content" / "plants" / f"{plant_id}.json",
+                    {
+                        "id": plant_id,
+                        "name": plant_id.title(),
+                        "cost": 100,
+                        "cooldown": 7.5,
+                        "max_hp": 300,
+                        "damage": 20,
+                        "family": "shooter",
+                        "tags": ["starter", "day"],
+                    },
+                )
+            _write_json(
+                mods / "pvz.base" / "patches" / "tags.json",
+                {"ops": [{"target": "pvz.base:plants:repeater", "op": "append", "path": "/tags", "value": "double"}]},
+            )
+
+            loader = ModLoader(mods, schema_root=SCHEMAS, dedup=True)
+            plants = loader.load().registry.categories["plants"]
+            pea = plants["pvz.base:plants:pea"].data
+            repeater = plants["pvz.base:plants:repeater"].data
+            self.assertEqual(pea["tags"], ["starter", "day"])
+            self.assertEqual(repeater["tags"], ["starter", "day", "double"])
+            self.assertIs(pea["tags"], plants["pvz.base:plants:threepeater"].data["tags"])
+            self.assertGreater(loader.subtrees.stats.shared, 0)
+
+            # Without opting in, every item owns its containers and can be mutated safely.
+            plants = ModLoader(mods, schema_root=SCHEMAS).load().registry.categories["plants"]
+            plants["pvz.base:plants:pea"].data["tags"].append("night")
+            self.assertEqual(plants["pvz.base:plants:threepeater"].data["tags"], ["starter", "day"])
+
+    def test_subtree_pool_distinguishes_json_types(self) -> None:
+        pool = SubtreePool()
+        first = pool.intern({"a": [1, {"b": True}]})
+        second = pool.intern({"a": [1, {"b": True}]})
+        self.assertIs(first, second)
+        self.assertIsNot(pool.intern([1]), pool.intern([1.0]))
+        self.assertIsNot(pool.intern([1]), pool.intern([True]))
+        # Keys are built by concatenating child keys, so they must stay self-delimiting.
+        self.assertIsNot(pool.intern(["as", "b"]), pool.intern(["a", "sb"]))
+        self.assertIsNot(pool.intern({"as": "b"}), pool.intern({"a": "sb"}))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import io
+import json
+import unittest
+from pathlib import Path
+
+from pvz.content.loader import ModLoader
+from pvz.models import ContentRegistry
+from tools.dump_registry import iter_items, write_json, write_jsonl
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+class DumpRegistryTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.registry = ModLoader(ROOT / "mods", schema_root=ROOT / "schemas").load().registry
+
+    def test_streamed_json_matches_full_dump(self) -> None:
+        out = io.StringIO()
+        count = write_json(iter_items(self.registry), out)
+        expected = json.dumps(self.registry.as_plain_data(), indent=2, sort_keys=True) + "\n"
+        self.assertEqual(out.getvalue(), expected)
+        self.assertEqual(count, sum(len(entries) for entries in self.registry.categories.values()))
+
+        empty = io.StringIO()
+        write_json(iter_items(ContentRegistry()), empty)
+        self.assertEqual(json.loads(empty.getvalue()), {})
+
+    def test_jsonl_with_category_and_id_filters(self) -> None:
+        out = io.StringIO()
+        write_jsonl(iter_items(self.registry, categories=["plants", "zombies"], id_glob="*:plants:*"), out)
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertTrue(records)
+        self.assertEqual({record["category"] for record in records}, {"plants"})
+        self.assertEqual([record["id"] for record in records], sorted(self.registry.categories["plants"]))
+        first = records[0]
+        self.assertEqual(first["data"], self.registry.categories["plants"][first["id"]].data)
+
+
+if __name__ == "__main__":
+    unittest.main()
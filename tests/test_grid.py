@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import random
+import unittest
+from pathlib import Path
+
+from benchmarks.combat import lane_scenario, run_grid, run_naive
+from pvz.combat import LaneGrid, Projectile, step_projectiles
+from pvz.content.loader import ModLoader
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+class LaneGridTests(unittest.TestCase):
+    def test_queries_stay_sorted_per_lane(self) -> None:
+        rng = random.Random(2)
+        grid = LaneGrid(3, columns=9, cell_width=1.0)
+        positions = {}
+        for zombie in range(60):
+            lane, x = rng.randrange(3), rng.uniform(0, 9)
+            grid.add(zombie, lane, x)
+            positions[zombie] = (lane, x)
+        for zombie in range(0, 60, 7):
+            grid.remove(zombie)
+            del positions[zombie]
+        grid.move(1, 4.5)
+        positions[1] = (positions[1][0], 4.5)
+
+        for lane in range(3):
+            expected = sorted((x, zombie) for zombie, (zl, x) in positions.items() if zl == lane)
+            self.assertEqual(grid.lane(lane), [(zombie, x) for x, zombie in expected])
+            self.assertEqual(grid.query(lane, 2.0, 5.0), [zombie for x, zombie in expected if 2.0 < x <= 5.0])
+            self.assertEqual(grid.in_cell(lane, 3), [zombie for x, zombie in expected if 3.0 <= x < 4.0])
+            self.assertEqual(grid.front(lane), expected[0][1] if expected else None)
+
+        speed = [rng.uniform(0.1, 0.5) for _ in range(60)]
+        reach = grid.advance(speed)
+        for lane in range(3):
+            xs = [x for _, x in grid.lane(lane)]
+            self.assertEqual(xs, sorted(xs))
+            moved = [speed[zombie] for zombie, (zl, _) in positions.items() if zl == lane]
+            self.assertEqual(reach[lane], max(moved, default=0.0))
+
+    def test_pierce_walks_forward_nearest_first(self) -> None:
+        grid = LaneGrid(1, columns=10)
+        for zombie, x in enumerate([5.0, 2.0, 3.0, 8.0]):
+            grid.add(zombie, 0, x)
+        hp = [10, 10, 30, 10]
+        shot = Projectile(lane=0, x=1.0, speed=4.5, damage=10, pierce=1, ttl=5)
+        flying = step_projectiles(grid, [shot], hp)
+        self.assertEqual(shot.hits, {1, 2})
+        self.assertEqual(hp, [10, 0, 20, 10])
+        self.assertNotIn(1, grid)
+        self.assertEqual(flying, [])
+
+        lone = Projectile(lane=0, x=5.5, speed=1.0, damage=10, ttl=1)
+        self.assertEqual(step_projectiles(grid, [lone], hp), [])
+        self.assertEqual(lone.hits, set())
+
+    def test_shot_hits_the_zombie_that_crossed_it_not_one_behind(self) -> None:
+        grid = LaneGrid(1, columns=10)
+        grid.add(0, 0, 4.9)
+        grid.add(1, 0, 6.0)
+        self.assertEqual(grid.advance([0.1, 1.0]), [1.0])
+        hp = [10, 10]
+        shot = Projectile(lane=0, x=5.0, speed=0.5, damage=10, ttl=3)
+        step_projectiles(grid, [shot], hp)
+        # Zombie 0 was already behind the shot; zombie 1 went from 6.0 to 5.0 and met it at 5.25.
+        self.assertEqual(shot.hits, {1})
+        self.assertEqual(hp, [10, 0])
+
+    def test_piercing_shot_hits_in_meeting_order(self) -> None:
+        grid = LaneGrid(1, columns=10)
+        grid.add(0, 0, 6.0)
+        grid.add(1, 0, 9.0)
+        # Zombie 1 ends up nearer the house than zombie 0, but the shot meets zombie 0 first (t=0.5 versus t=2/3).
+        grid.advance([0.0, 4.0])
+        self.assertEqual(grid.crossings(0, 5.0, 2.0, 2), [0, 1])
+        self.assertEqual(grid.crossings(0, 5.0, 2.0, 1), [0])
+        self.assertEqual(grid.crossings(0, 5.0, 2.0, 2, skip={0}), [1])
+
+    def test_grid_matches_all_pairs_reference(self) -> None:
+        stats = ModLoader(ROOT / "mods", schema_root=ROOT / "schemas").load().registry.stats
+        grid_run = lane_scenario(stats, zombies=150, projectiles=300, seed=9)
+        naive_run = lane_scenario(stats, zombies=150, projectiles=300, seed=9)
+        run_grid(grid_run, 25)
+        positions = run_naive(naive_run, 25)
+
+        self.assertEqual(grid_run.hp, naive_run.hp)
+        self.assertLess(sum(hp > 0 for hp in grid_run.hp), 150)
+        self.assertEqual(len(grid_run.projectiles), len(naive_run.projectiles))
+        survivors = {
+            zombie: (lane, x) for lane in range(grid_run.grid.lanes) for zombie, x in grid_run.grid.lane(lane)
+        }
+        self.assertEqual(survivors, positions)
+
+
+if __name__ == "__main__":
+    unittest.main()
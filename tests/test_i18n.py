@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from pvz.content.localization_validation import ValidationCache, validate_localization_files
+from pvz.errors import LocalizationValidationError
+from pvz.i18n import LocalizationService, compile_template
+
+
+def _write_json(path: Path, payload: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+class LocalizationServiceTests(unittest.TestCase):
+    def test_later_mods_override_and_locales_load_lazily(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            base, addon = Path(tmp) / "base", Path(tmp) / "addon"
+            _write_json(base / "localization" / "en.json", {"menu.start": "Start", "menu.shop": "Shop"})
+            _write_json(base / "localization" / "fr.json", {"menu.start": "Jouer", "menu.shop": "Boutique"})
+            _write_json(addon / "localization" / "en.json", {"menu.shop": "Store", "addon.hello": "Hi"})
+
+            service = LocalizationService([base, addon])
+            self.assertEqual(service.locales, ["en", "fr"])
+            self.assertEqual(service.get("menu.shop"), "Store")
+            self.assertEqual(service.get("missing.key"), "missing.key")
+            self.assertNotIn("fr", service._catalogs)
+
+            service.set_locale("fr")
+            self.assertEqual(service.get("menu.start"), "Jouer")
+            self.assertEqual(service.get("addon.hello"), "Hi")
+            index = service.index("menu.start")
+            self.assertEqual(service.text(index, locale="en"), "Start")
+
+    def test_compiled_locale_is_reused_from_disk_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            base, cache = Path(tmp) / "base", Path(tmp) / "cache"
+            _write_json(base / "localization" / "en.json", {"menu.start": "Start"})
+
+            LocalizationService([base], cache_dir=cache)
+            cached = json.loads((cache / "en.bundle.json").read_text(encoding="utf-8"))
+            self.assertEqual(cached["bundle"], {"menu.start": "Start"})
+            cached["bundle"]["menu.start"] = "From cache"
+            (cache / "en.bundle.json").write_text(json.dumps(cached), encoding="utf-8")
+            service = LocalizationService([base], cache_dir=cache)
+            self.assertEqual(service.get("menu.start"), "From cache")
+
+            for garbage in (b"\x80\x04\x95 not json", b"[1, 2]", b'{"format": 2, "signature": [], "bundle": 3}'):
+                (cache / "en.bundle.json").write_bytes(garbage)
+                self.assertEqual(LocalizationService([base], cache_dir=cache).get("menu.start"), "Start")
+
+    def test_validation_cache_skips_unchanged_bundles_only(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            mod = Path(tmp) / "mod"
+            _write_json(mod / "localization" / "en.json", {"a": "A"})
+            _write_json(mod / "localization" / "de.json", {"a": "A"})
+            cache = ValidationCache(Path(tmp) / "cache.json")
+            validate_localization_files(mod, cache=cache)
+            cache.save()
+
+            reloaded = ValidationCache(Path(tmp) / "cache.json")
+            validate_localization_files(mod, cache=reloaded)
+
+            _write_json(mod / "localization" / "de.json", {"a": "A", "b": "extra"})
+            with self.assertRaises(LocalizationValidationError):
+                validate_localization_files(mod, cache=reloaded)
+
+    def test_templates_are_precompiled_into_segments(self) -> None:
+        template = compile_template("{{Wave}} {current:02d}/{total}")
+        self.assertEqual(template.placeholders, frozenset({"current", "total"}))
+        self.assertEqual(template.segments[0], "{Wave} ")
+        self.assertEqual(template.format({"current": 3, "total": 10}), "{Wave} 03/10")
+        with self.assertRaises(LocalizationValidationError):
+            compile_template("Wave {0}")
+        with self.assertRaises(LocalizationValidationError):
+            compile_template("Wave {current")
+
+    def test_service_formats_with_fallback(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            base = Path(tmp) / "base"
+            _write_json(base / "localization" / "en.json", {"hud.sun": "Sun: {amount}", "hud.wave": "Wave {n}"})
+            _write_json(base / "localization" / "de.json", {"hud.sun": "Sonne: {amount}"})
+
+            service = LocalizationService([base], locale="de")
+            self.assertEqual(service.format("hud.sun", amount=50), "Sonne: 50")
+            self.assertEqual(service.format("hud.wave", n=2), "Wave 2")
+
+    def test_placeholder_mismatch_fails_validation(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            mod = Path(tmp) / "mod"
+            _write_json(mod / "localization" / "en.json", {"hud.sun": "Sun: {amount}"})
+            _write_json(mod / "localization" / "zh-CN.json", {"hud.sun": "阳光: {count}"})
+            with self.assertRaises(LocalizationValidationError):
+                validate_localization_files(mod)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,9 +6,12 @@ import unittest
 from pathlib import Path
 
 from pvz.content.loader import ModLoader
+from pvz.content.patcher import apply_patches
 from pvz.errors import AssetValidationError
 from pvz.errors import LocalizationValidationError
 from pvz.errors import MissingBaseModError
+from pvz.errors import PatchError
+from pvz.frozen import FrozenMap
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -135,6 +138,35 @@ class LoaderTests(unittest.TestCase):
             with self.assertRaises(LocalizationValidationError):
                 loader.load()
 
+    def test_frozen_registry_is_read_only_and_hashable(self) -> None:
+        loaded = ModLoader(ROOT / "mods", schema_root=SCHEMAS).load()
+        registry = loaded.registry
+        registry.freeze()
+
+        pea = registry.get("plants", "pvz.base:plants:peashooter").data
+        self.assertIsInstance(pea, FrozenMap)
+        self.assertIsInstance(pea["tags"], tuple)
+        self.assertEqual(hash(pea), hash(pea))
+        self.assertEqual(json.loads(json.dumps(pea))["id"], "pvz.base:plants:peashooter")
+        with self.assertRaises(TypeError):
+            pea["damage"] = 999
+        with self.assertRaises(TypeError):
+            registry.categories["plants"]["x"] = None
+        with self.assertRaises(ValueError):
+            registry.add(registry.get("plants", "pvz.base:plants:peashooter"))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            patch = Path(tmp) / "patch.json"
+            patch.write_text(json.dumps([{"target": pea["id"], "op": "replace", "path": "/damage", "value": 1}]))
+            with self.assertRaises(PatchError):
+                apply_patches(registry, patch)
+
+        plain = registry.as_plain_data()["plants"]["pvz.base:plants:peashooter"]
+        self.assertIs(type(plain), dict)
+        self.assertIs(type(plain["tags"]), list)
+        plain["damage"] = 999
+        self.assertNotEqual(pea["damage"], 999)
+
 
 if __name__ == "__main__":
     unittest.main()
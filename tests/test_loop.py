@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import unittest
+
+from pvz.combat import BattleState
+from pvz.loop import GameLoop, OverrunPolicy, build_session_loop
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class GameLoopTests(unittest.TestCase):
+    def test_accumulator_runs_whole_ticks_and_keeps_remainder(self) -> None:
+        loop = GameLoop(tick_rate=10, clock=FakeClock())
+        ticks: list[int] = []
+        loop.add_phase("record", ticks.append)
+
+        self.assertEqual(loop.advance(0.25), 2)
+        self.assertEqual(loop.advance(0.06), 1)
+        self.assertEqual(ticks, [1, 2, 3])
+        self.assertEqual(loop.metrics.phases["record"].calls, 3)
+
+    def test_overrun_policies(self) -> None:
+        catch_up = GameLoop(tick_rate=10, max_catch_up_ticks=2, clock=FakeClock())
+        self.assertEqual(catch_up.advance(0.55), 2)
+        self.assertEqual(catch_up.advance(0.0), 2)
+        self.assertEqual(catch_up.advance(0.0), 1)
+
+        skip = GameLoop(tick_rate=10, max_catch_up_ticks=2, policy=OverrunPolicy.SKIP, clock=FakeClock())
+        self.assertEqual(skip.advance(0.55), 2)
+        self.assertEqual(skip.advance(0.0), 0)
+        self.assertEqual(skip.metrics.skipped_ticks, 3)
+
+    def test_timed_events_fire_in_tick_and_priority_order(self) -> None:
+        loop = GameLoop(clock=FakeClock())
+        fired: list[tuple[int, str]] = []
+        loop.schedule(2, lambda tick: fired.append((tick, "late")), priority=1)
+        loop.schedule(2, lambda tick: fired.append((tick, "early")), priority=0)
+        loop.schedule(1, lambda tick: fired.append((tick, "cancelled"))).cancel()
+        loop.run_for(3)
+        self.assertEqual(fired, [(2, "early"), (2, "late")])
+
+    def test_session_loop_drives_combat_and_level_events(self) -> None:
+        battle = BattleState(sun=50, lawns=5, active_plants=[{"damage": 10}], active_zombies=[{"hp": 30}])
+        level = {"scripted_events": [{"tick": 2, "event": "music_cue"}]}
+        loop = build_session_loop(battle=battle, level=level, clock=FakeClock())
+        loop.run_for(3)
+        self.assertEqual(battle.tick, 3)
+        self.assertEqual(battle.active_zombies, [])
+        self.assertEqual(loop.metrics.phases["events"].calls, 2)
+        self.assertEqual(loop.metrics.summary()["ticks"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from pvz.game import GameBootstrap
+from pvz.profiling import NULL_PROFILER, Profiler
+from pvz.scripting import ScriptManager
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+class ProfilingTests(unittest.TestCase):
+    def test_nested_spans_report_and_breakdown(self) -> None:
+        profiler = Profiler()
+        with profiler.span("load"):
+            for category in ("plants", "zombies", "plants"):
+                with profiler.span("category", mod="base", category=category):
+                    with profiler.span("parse"):
+                        pass
+
+        self.assertEqual(len(profiler.roots), 1)
+        self.assertEqual(len(profiler.roots[0].children), 3)
+        self.assertEqual(set(profiler.breakdown("category")), {"plants", "zombies"})
+        self.assertEqual(list(profiler.breakdown("mod")), ["base"])
+        report = profiler.report()
+        self.assertIn("category [base, plants] x2", report)
+        self.assertIn("parse x2", report)
+
+        events = profiler.chrome_trace()["traceEvents"]
+        self.assertEqual(len(events), 7)
+        self.assertTrue(all(event["ph"] == "X" and event["dur"] >= 0 for event in events))
+
+    def test_boot_spans_cover_loader_and_scripts(self) -> None:
+        profiler = Profiler()
+        with tempfile.TemporaryDirectory() as tmp:
+            bootstrap = GameBootstrap(
+                mods_dir=ROOT / "mods",
+                schemas_dir=ROOT / "schemas",
+                save_path=Path(tmp) / "save.json",
+                profiler=profiler,
+            )
+            loaded = bootstrap.load_content()
+            ScriptManager(profiler=profiler).load_from_mods(loaded.mods)
+            bootstrap.ensure_save()
+
+            trace = Path(tmp) / "trace.json"
+            profiler.write_trace(trace)
+            names = {event["name"] for event in json.loads(trace.read_text())["traceEvents"]}
+
+        for name in ("ModLoader.load", "resolve_load_order", "category", "schema", "localization",
+                     "patches", "ScriptManager.load_from_mods", "GameBootstrap.ensure_save"):
+            self.assertIn(name, names)
+        self.assertIn("plants", profiler.breakdown("category"))
+        self.assertIn("pvz.base", profiler.breakdown("mod"))
+
+    def test_null_profiler_is_a_no_op(self) -> None:
+        with NULL_PROFILER.span("anything", mod="x") as span:
+            self.assertIsNone(span)
+        self.assertFalse(NULL_PROFILER.enabled)
+
+
+if __name__ == "__main__":
+    unittest.main()
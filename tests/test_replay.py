@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+from pvz.combat import BattleState
+from pvz.content.loader import ModLoader
+from pvz.replay import Recorder, collect_seeds, replay
+from pvz.scripting import HookContext, HookRuntime, ScriptManager
+from pvz.scripting.manager import ScriptModule
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCHEMAS = ROOT / "schemas"
+
+SCRIPT = """
+def on_tick(context, api):
+    roll = api.random.randint(1, 1000)
+    api.set_state('last_roll', roll)
+    api.emit_event('rolled', {'tick': context.tick, 'roll': roll})
+    return roll
+"""
+
+
+def _manager(script: Path) -> ScriptManager:
+    runtime = HookRuntime()
+    runtime.load_script(script)
+    manager = ScriptManager()
+    manager.modules.append(
+        ScriptModule(mod_id="test.mod", runtime=runtime, capabilities={"state.write", "events.emit"})
+    )
+    return manager
+
+
+class ReplayTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.registry = ModLoader(ROOT / "mods", schema_root=SCHEMAS).load().registry
+
+    def _record(self, tmp: Path, script: Path) -> Path:
+        log_path = tmp / "run.pvzrec"
+        manager = _manager(script)
+        recorder = Recorder.open(log_path)
+        manager.recorder = recorder
+        state = BattleState(sun=50, lawns=5, active_plants=[{"damage": 20}], active_zombies=[{"hp": 90}])
+        recorder.begin(self.registry, mod_ids=["pvz.base"], rng_seed=7, scripts=manager)
+        for tick in range(1, 6):
+            manager.run_hook("on_tick", context=HookContext(tick=tick))
+            manager.end_tick()
+        recorder.simulate(state, duration_ticks=5)
+        recorder.close()
+        return log_path
+
+    def test_replay_of_recorded_run_matches(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            script = Path(tmp) / "mod.py"
+            script.write_text(SCRIPT, encoding="utf-8")
+            log_path = self._record(Path(tmp), script)
+
+            random.seed(123)
+            expected_global = random.random()
+            random.seed(123)
+            report = replay(log_path, registry=self.registry, scripts=_manager(script))
+            self.assertTrue(report.ok, msg=report.mismatches)
+            self.assertEqual((report.hooks, report.ticks, report.simulations), (5, 5, 1))
+            # Recording and replay reseed the scripts' own RNG, never the process-wide one.
+            self.assertEqual(random.random(), expected_global)
+
+    def test_replay_reports_divergence(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            script = Path(tmp) / "mod.py"
+            script.write_text(SCRIPT, encoding="utf-8")
+            log_path = self._record(Path(tmp), script)
+
+            script.write_text(SCRIPT.replace("return roll", "return roll + 1"), encoding="utf-8")
+            report = replay(log_path, registry=self.registry, scripts=_manager(script), stop_on_mismatch=True)
+            self.assertFalse(report.ok)
+            self.assertEqual(report.mismatches[0].kind, "hook")
+
+    def test_collects_minigame_seeds(self) -> None:
+        seeds = collect_seeds(self.registry)
+        self.assertEqual(seeds["pvz.base:mini_games:air_raid"], 1020)
+
+
+if __name__ == "__main__":
+    unittest.main()
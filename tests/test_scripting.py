@@ -1,11 +1,22 @@
 from __future__ import annotations
 
+import random
 import tempfile
 import unittest
 from pathlib import Path
 
 from pvz.errors import ScriptSecurityError
-from pvz.scripting import CapabilityAPI, HookContext, HookRuntime
+from pvz.scripting import (
+    CapabilityAPI,
+    EventBus,
+    HookContext,
+    HookRuntime,
+    ScriptEvent,
+    ScriptManager,
+    StateStore,
+)
+from pvz.scripting.manager import ScriptModule
+from pvz.scripting.state import MAX_LAYERS
 
 
 def _write(path: Path, content: str) -> None:
@@ -60,7 +71,106 @@ def on_tick(context, api):
             state = {}
             api = CapabilityAPI(capabilities={"events.emit"}, state=state)
             runtime.run_hook("on_tick", context=HookContext(tick=3), api=api)
-            self.assertEqual(state["events"][0]["event"], "tick")
+            self.assertNotIn("events", state)
+            self.assertEqual(api.events.pending("events")[0].event, "tick")
+
+    def test_event_bus_is_bounded_and_drains_per_tick(self) -> None:
+        bus = EventBus(default_capacity=4)
+        received: list[ScriptEvent] = []
+        bus.subscribe("events", received.append)
+        for n in range(10):
+            bus.publish("events", ScriptEvent(event="tick", payload={"n": n}))
+
+        channel = bus.channel("events")
+        self.assertEqual(len(channel.buffer), 4)
+        self.assertEqual(channel.buffer.dropped, 6)
+
+        drained = bus.drain()
+        self.assertEqual([e.payload["n"] for e in drained["events"]], [6, 7, 8, 9])
+        self.assertEqual(received, drained["events"])
+        self.assertEqual(bus.pending("events"), [])
+        with self.assertRaises(TypeError):
+            bus.publish("damage", ScriptEvent(event="oops", payload={}))
+
+    def test_state_writes_are_isolated_until_end_of_tick(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = ScriptManager()
+            for name, value in (("first", 1), ("second", 2)):
+                script = Path(tmp) / f"{name}.py"
+                _write(
+                    script,
+                    f"""
+def on_tick(context, api):
+    api.set_state('seen', api.get_state('owner'))
+    api.set_state('owner', {value})
+""",
+                )
+                runtime = HookRuntime()
+                runtime.load_script(script)
+                manager.modules.append(
+                    ScriptModule(mod_id=name, runtime=runtime, capabilities={"state.write"})
+                )
+
+            before = manager.state.snapshot()
+            manager.run_hook("on_tick", context=HookContext(tick=1))
+            self.assertEqual(manager.state.version, 0)
+            manager.end_tick()
+
+            self.assertEqual(manager.state.snapshot().get("owner"), 2)
+            self.assertIsNone(manager.state.snapshot().get("seen"))
+            self.assertEqual(dict(before.data), {})
+            self.assertEqual(manager.state.diff(0), {"owner": 2, "seen": None})
+
+    def test_state_store_rollback_restores_previous_values(self) -> None:
+        store = StateStore()
+        txn = store.begin("mod")
+        txn["a"] = 1
+        store.commit([txn])
+        txn = store.begin("mod")
+        txn["a"] = 2
+        txn["b"] = 3
+        store.commit([txn])
+
+        self.assertEqual(store.diff(1), {"a": 2, "b": 3})
+        store.rollback(1)
+        self.assertEqual(store.version, 1)
+        self.assertEqual(dict(store.snapshot().data), {"a": 1})
+
+    def test_committed_state_cannot_be_mutated_through_reads(self) -> None:
+        store = StateStore()
+        txn = store.begin("mod")
+        api = CapabilityAPI(capabilities={"state.write"}, state=txn)
+        api.set_state("wave", {"hp": 10, "spawned": ["basic"]})
+        store.commit([txn])
+        published = store.snapshot()
+
+        api = CapabilityAPI(capabilities={"state.write"}, state=store.begin("mod"))
+        wave = api.get_state("wave")
+        with self.assertRaises(TypeError):
+            wave["hp"] -= 1
+        with self.assertRaises(AttributeError):
+            wave["spawned"].append("cone")
+        self.assertEqual(published.get("wave"), {"hp": 10, "spawned": ("basic",)})
+
+    def test_state_layers_match_plain_dict_across_commits_and_rollbacks(self) -> None:
+        rng = random.Random(4)
+        store = StateStore()
+        expected: list[dict] = [{}]
+        for _ in range(120):
+            if rng.random() < 0.2 and store.version > 1:
+                version = rng.randrange(max(0, store.version - 10), store.version)
+                store.rollback(version)
+                del expected[version + 1 :]
+            else:
+                txn = store.begin("mod")
+                for _ in range(rng.randint(1, 3)):
+                    txn[f"k{rng.randrange(8)}"] = rng.randrange(100)
+                store.commit([txn])
+                expected.append({**expected[-1], **txn.writes})
+            data = store.snapshot().data
+            self.assertEqual(dict(data), expected[-1])
+            self.assertEqual(len(data), len(expected[-1]))
+            self.assertLessEqual(data.depth, MAX_LAYERS)
 
 
 if __name__ == "__main__":
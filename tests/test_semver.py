@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import unittest
+
+from pvz.semver import Constraint, Interval, SemVer, satisfies
+
+
+def v(raw: str) -> SemVer:
+    return SemVer.parse(raw)
+
+
+class ConstraintTests(unittest.TestCase):
+    def test_caret_and_tilde_normalize_to_half_open_intervals(self) -> None:
+        self.assertEqual(Constraint.parse("^1.2.3").intervals, (Interval(v("1.2.3"), v("2.0.0")),))
+        self.assertEqual(Constraint.parse("~1.2.3").intervals, (Interval(v("1.2.3"), v("1.3.0")),))
+        self.assertEqual(Constraint.parse(">1.0.0, <=1.4.2").intervals, (Interval(v("1.0.1"), v("1.4.3")),))
+        self.assertEqual(Constraint.parse(">=1.0.0,<2.0.0"), Constraint.parse("^1.0.0"))
+        self.assertIs(Constraint.parse("^1.2.3"), Constraint.parse("^1.2.3"))
+
+    def test_contains_matches_satisfies(self) -> None:
+        constraint = Constraint.parse("^1.2.0, <1.5.0")
+        self.assertTrue(constraint.contains(v("1.4.9")))
+        self.assertFalse(constraint.contains(v("1.5.0")))
+        self.assertFalse(constraint.contains(v("1.1.9")))
+        self.assertTrue(satisfies("1.2.0", "~1.2.0"))
+        self.assertFalse(satisfies("1.3.0", "~1.2.0"))
+        self.assertTrue(satisfies("0.0.1", ""))
+
+    def test_intersection_emptiness_and_complement(self) -> None:
+        self.assertTrue(Constraint.parse("^1.0.0").intersect(Constraint.parse("^2.0.0")).is_empty)
+        self.assertTrue(Constraint.parse(">=2.0.0, <1.0.0").is_empty)
+        overlap = Constraint.parse("^1.0.0").intersect(Constraint.parse(">=1.4.0"))
+        self.assertEqual(overlap.intervals, (Interval(v("1.4.0"), v("2.0.0")),))
+
+        outside = Constraint.parse("~1.4.0").complement()
+        self.assertEqual(outside.intervals, (Interval(v("0.0.0"), v("1.4.0")), Interval(v("1.5.0"), None)))
+        self.assertTrue(Constraint.parse("~1.4.0").intersect(outside).is_empty)
+
+    def test_invalid_constraints_raise_value_error(self) -> None:
+        with self.assertRaises(ValueError):
+            Constraint.parse("^1.2")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from pvz.content.loader import ModLoader
+from pvz.content.patcher import apply_patches
+from pvz.content.stats import STAT_CATEGORIES
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCHEMAS = ROOT / "schemas"
+
+
+class StatTableTests(unittest.TestCase):
+    def test_loader_builds_typed_tables_after_patching(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            mods = Path(tmp)
+            shutil.copytree(ROOT / "mods" / "pvz.base", mods / "pvz.base")
+            patch = mods / "pvz.base" / "patches" / "zz_stats_test.json"
+            patch.parent.mkdir(exist_ok=True)
+            patch.write_text(
+                json.dumps({"ops": [{"target": "pvz.base:plants:peashooter", "op": "replace", "path": "/damage", "value": 33}]}),
+                encoding="utf-8",
+            )
+            registry = ModLoader(mods, schema_root=SCHEMAS).load().registry
+            stats = registry.stats
+            apply_patches(registry, patch)
+            self.assertIsNone(registry.stats)
+
+        self.assertIsNotNone(stats)
+        for category in STAT_CATEGORIES:
+            table = getattr(stats, category)
+            self.assertEqual(table.ids, sorted(registry.categories[category]))
+            self.assertEqual([table.row(item_id) for item_id in table.ids], list(range(len(table))))
+
+        plants = stats.plants
+        self.assertEqual(plants.column("damage").typecode, "q")
+        self.assertEqual(plants.column("cooldown").typecode, "d")
+        self.assertNotIn("name", plants.columns)
+        self.assertEqual(plants.column("damage")[plants.row("pvz.base:plants:peashooter")], 33)
+        for item_id, item in registry.categories["zombies"].items():
+            self.assertEqual(stats.zombies.get(item_id, "reward"), item.data.get("reward", 0))
+
+    def test_out_of_int64_range_stat_loads_masked(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            mods = Path(tmp)
+            shutil.copytree(ROOT / "mods" / "pvz.base", mods / "pvz.base")
+            patch = mods / "pvz.base" / "patches" / "zz_overflow_test.json"
+            patch.parent.mkdir(exist_ok=True)
+            patch.write_text(
+                json.dumps({"ops": [{"target": "pvz.base:plants:peashooter", "op": "replace", "path": "/damage", "value": 2**63}]}),
+                encoding="utf-8",
+            )
+            registry = ModLoader(mods, schema_root=SCHEMAS).load().registry
+
+        self.assertEqual(registry.get("plants", "pvz.base:plants:peashooter").data["damage"], 2**63)
+        self.assertIsNone(registry.stats.plants.get("pvz.base:plants:peashooter", "damage", None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from pvz.content.loader import CATEGORY_SCHEMA, ModLoader
+from tools.gen_synthetic_mods import CATEGORY_WEIGHTS, GENERATION_ORDER, GeneratorConfig, generate
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCHEMAS = ROOT / "schemas"
+
+
+def _tree(root: Path) -> dict[str, bytes]:
+    return {path.relative_to(root).as_posix(): path.read_bytes() for path in sorted(root.rglob("*")) if path.is_file()}
+
+
+class SyntheticModTests(unittest.TestCase):
+    def test_covers_every_schema_category(self) -> None:
+        self.assertEqual(set(CATEGORY_WEIGHTS), set(CATEGORY_SCHEMA))
+        self.assertEqual(set(GENERATION_ORDER), set(CATEGORY_SCHEMA))
+
+    def test_generated_mods_load_and_patch_cleanly(self) -> None:
+        config = GeneratorConfig(mods=6, items_per_mod=60, patches_per_mod=15, locales=("en", "de", "ja"), seed=3)
+        with tempfile.TemporaryDirectory() as tmp:
+            summary = generate(Path(tmp), config)
+            loaded = ModLoader(Path(tmp), schema_root=SCHEMAS).load()
+
+        self.assertEqual(loaded.mod_ids[0], "pvz.base")
+        self.assertEqual(sorted(loaded.mod_ids), sorted(summary.mods))
+        self.assertEqual(set(loaded.registry.categories), set(CATEGORY_SCHEMA))
+        self.assertEqual(sum(len(items) for items in loaded.registry.categories.values()), summary.items)
+        self.assertGreater(summary.patch_ops, 0)
+
+    def test_same_seed_produces_identical_tree(self) -> None:
+        config = GeneratorConfig(mods=3, items_per_mod=30, patches_per_mod=5, seed=11)
+        with tempfile.TemporaryDirectory() as first, tempfile.TemporaryDirectory() as second:
+            generate(Path(first), config)
+            generate(Path(second), config)
+            self.assertEqual(_tree(Path(first)), _tree(Path(second)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from tools.gen_synthetic_mods import GeneratorConfig, generate
+from tools.validate_mod import ReportCache, validate_all
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCHEMAS = ROOT / "schemas"
+
+
+class ValidateAllTests(unittest.TestCase):
+    def test_collects_every_error_and_skips_unchanged_mods(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            mods = Path(tmp) / "mods"
+            summary = generate(mods, GeneratorConfig(mods=4, items_per_mod=20, patches_per_mod=2, seed=5))
+            broken = mods / summary.mods[1] / "content"
+            first, second = sorted(broken.rglob("*.json"))[:2]
+            first.write_text("{not json", encoding="utf-8")
+            second.write_text("[]", encoding="utf-8")
+
+            cache = ReportCache(Path(tmp) / "cache.json")
+            reports = validate_all(mods, SCHEMAS, jobs=2, cache=cache)
+            self.assertEqual([report.mod_id for report in reports], summary.mods)
+            failed = [report for report in reports if not report.ok]
+            self.assertEqual([report.mod_id for report in failed], [summary.mods[1]])
+            self.assertEqual(len(failed[0].errors), 2)
+            self.assertFalse(any(report.cached for report in reports))
+
+            again = validate_all(mods, SCHEMAS, jobs=1, cache=ReportCache(Path(tmp) / "cache.json"))
+            self.assertTrue(all(report.cached for report in again))
+            self.assertEqual([report.errors for report in again], [report.errors for report in reports])
+
+            first.write_text(json.dumps({"id": "fixed"}), encoding="utf-8")
+            third = validate_all(mods, SCHEMAS, jobs=1, cache=ReportCache(Path(tmp) / "cache.json"))
+            self.assertEqual([report.cached for report in third], [True, False, True, True])
+            self.assertTrue(third[1].errors)
+
+            # A file the digest cannot read fails that mod only; the rest of the run still reports.
+            (mods / summary.mods[2] / os.fsdecode(b"bad\xff.bin")).write_bytes(b"x")
+            fourth = validate_all(mods, SCHEMAS, jobs=1, cache=ReportCache(Path(tmp) / "cache.json"))
+            self.assertEqual([report.ok for report in fourth], [True, False, False, True])
+            self.assertIn("UnicodeEncodeError", fourth[2].errors[0])
+            os.remove(mods / summary.mods[2] / os.fsdecode(b"bad\xff.bin"))
+
+            shutil.rmtree(mods / summary.mods[3])
+            validate_all(mods, SCHEMAS, jobs=1, cache=ReportCache(Path(tmp) / "cache.json"))
+            entries = json.loads((Path(tmp) / "cache.json").read_text(encoding="utf-8"))
+            self.assertEqual(sorted(entries), sorted(str((mods / mod_id).resolve()) for mod_id in summary.mods[:3]))
+
+
+if __name__ == "__main__":
+    unittest.main()
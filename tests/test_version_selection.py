@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import itertools
+import json
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+from pvz.content.loader import ModLoader
+from pvz.content.selection import VersionSelector, select_versions
+from pvz.errors import DependencyError, ManifestError
+from pvz.models import Dependency, ModManifest, ModPackage
+from pvz.semver import satisfies
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCHEMAS = ROOT / "schemas"
+
+
+def _mod(mod_id: str, version: str, *, requires: dict[str, str] | None = None, conflicts: dict[str, str] | None = None) -> ModPackage:
+    manifest = ModManifest(
+        id=mod_id,
+        version=version,
+        title=mod_id,
+        engine_api="1.0",
+        requires=tuple(Dependency(id=dep, version=spec) for dep, spec in (requires or {}).items()),
+        conflicts=tuple(Dependency(id=dep, version=spec) for dep, spec in (conflicts or {}).items()),
+    )
+    return ModPackage(manifest=manifest, path=Path(f"{mod_id}-{version}"))
+
+
+def _candidates(*packages: ModPackage) -> dict[str, list[ModPackage]]:
+    result: dict[str, list[ModPackage]] = {}
+    for package in packages:
+        result.setdefault(package.manifest.id, []).append(package)
+    return result
+
+
+def _versions(selection: dict[str, ModPackage]) -> dict[str, str]:
+    return {mod_id: package.manifest.version for mod_id, package in selection.items()}
+
+
+def _consistent(selection: dict[str, ModPackage]) -> bool:
+    for package in selection.values():
+        for dep in package.manifest.requires:
+            if dep.id not in selection or not satisfies(selection[dep.id].manifest.version, dep.version):
+                return False
+        for dep in package.manifest.conflicts:
+            if dep.id in selection and satisfies(selection[dep.id].manifest.version, dep.version):
+                return False
+    return True
+
+
+class VersionSelectionTests(unittest.TestCase):
+    def test_prefers_newest_consistent_versions(self) -> None:
+        candidates = _candidates(
+            _mod("pvz.base", "1.0.0"),
+            _mod("pvz.base", "2.0.0"),
+            _mod("addon", "1.0.0", requires={"pvz.base": "^1.0.0"}),
+            _mod("addon", "1.1.0", requires={"pvz.base": "^2.0.0"}),
+            _mod("legacy", "1.0.0", requires={"pvz.base": "<2.0.0"}),
+        )
+        selection = select_versions(candidates, memoize=False)
+        self.assertEqual(_versions(selection), {"pvz.base": "1.0.0", "addon": "1.0.0", "legacy": "1.0.0"})
+
+    def test_backjumps_over_unrelated_choices(self) -> None:
+        packages = [_mod("a", "1.0.0"), _mod("a", "2.0.0")]
+        for index in range(6):
+            packages += [_mod(f"filler{index}", "1.0.0"), _mod(f"filler{index}", "1.1.0")]
+        packages += [
+            _mod("z", "1.0.0", requires={"a": "==1.0.0"}),
+            _mod("z", "1.1.0", requires={"a": "==1.0.0"}),
+        ]
+        selector = VersionSelector(_candidates(*packages))
+        selection = selector.solve()
+        self.assertEqual(selection["a"].manifest.version, "1.0.0")
+        self.assertTrue(all(selection[f"filler{i}"].manifest.version == "1.1.0" for i in range(6)))
+        # One failure at `z` jumps straight back to `a` instead of walking every filler version.
+        self.assertLessEqual(selector.stats.assignments, 20)
+
+    def test_unsatisfiable_reports_problems(self) -> None:
+        candidates = _candidates(
+            _mod("pvz.base", "1.0.0"),
+            _mod("pvz.base", "2.0.0"),
+            _mod("left", "1.0.0", requires={"pvz.base": "^1.0.0"}),
+            _mod("right", "1.0.0", requires={"pvz.base": "^2.0.0"}),
+        )
+        with self.assertRaises(DependencyError) as ctx:
+            select_versions(candidates, memoize=False)
+        self.assertTrue(any("is compatible with any selection" in problem for problem in ctx.exception.problems))
+
+        candidates["orphan"] = [_mod("orphan", "1.0.0", requires={"missing": ""})]
+        with self.assertRaises(DependencyError) as ctx:
+            select_versions(candidates, memoize=False)
+        self.assertEqual(ctx.exception.problems, ["orphan@1.0.0 requires missing mod missing"])
+
+    def test_matches_exhaustive_search(self) -> None:
+        rng = random.Random(7)
+        specs = ["^1.0.0", "^2.0.0", ">=1.1.0", "<2.0.0", "==1.0.0", ""]
+        versions = ["1.0.0", "1.1.0", "2.0.0"]
+        for _ in range(150):
+            ids = [f"m{i}" for i in range(5)]
+            packages = []
+            for mod_id in ids:
+                for version in rng.sample(versions, rng.randint(1, 3)):
+                    others = [other for other in ids if other != mod_id]
+                    requires = {other: rng.choice(specs) for other in rng.sample(others, rng.randint(0, 2))}
+                    conflicts = {other: rng.choice(specs[:4]) for other in rng.sample(others, rng.randint(0, 1))}
+                    packages.append(_mod(mod_id, version, requires=requires, conflicts=conflicts))
+            candidates = _candidates(*packages)
+
+            expected = None
+            ordered = [sorted(candidates[mod_id], key=lambda p: tuple(map(int, p.manifest.version.split("."))), reverse=True) for mod_id in ids]
+            for combo in itertools.product(*ordered):
+                selection = {package.manifest.id: package for package in combo}
+                if _consistent(selection):
+                    expected = selection
+                    break
+
+            if expected is None:
+                with self.assertRaises(DependencyError):
+                    select_versions(candidates, memoize=False)
+            else:
+                selection = select_versions(candidates, memoize=False)
+                self.assertTrue(_consistent(selection))
+                self.assertEqual(set(selection), set(ids))
+
+    def test_memoized_by_manifest_set(self) -> None:
+        candidates = _candidates(_mod("pvz.base", "1.0.0"), _mod("pvz.base", "1.2.0"))
+        first = select_versions(candidates)
+        again = _candidates(_mod("pvz.base", "1.2.0"), _mod("pvz.base", "1.0.0"))
+        second = select_versions(again)
+        self.assertEqual(_versions(first), _versions(second))
+        self.assertIs(second["pvz.base"], again["pvz.base"][0])
+
+    def test_loader_selects_among_side_by_side_versions(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            mods = Path(tmp)
+
+            def write_manifest(folder: str, payload: dict) -> None:
+                path = mods / folder / "mod.json"
+                path.parent.mkdir(parents=True)
+                path.write_text(json.dumps({"title": payload["id"], "engine_api": "1.0", **payload}), encoding="utf-8")
+
+            write_manifest("base-1", {"id": "pvz.base", "version": "1.0.0"})
+            write_manifest("base-2", {"id": "pvz.base", "version": "2.0.0"})
+            write_manifest("addon", {"id": "addon", "version": "1.0.0", "requires": [{"id": "pvz.base", "version": "^1.0.0"}]})
+
+            loader = ModLoader(mods, schema_root=SCHEMAS)
+            selection = loader.discover_mods()
+            self.assertEqual(selection["pvz.base"].path, mods / "base-1")
+
+            write_manifest("base-1-copy", {"id": "pvz.base", "version": "1.0.0"})
+            with self.assertRaisesRegex(ManifestError, "duplicate mod id: pvz.base 1.0.0"):
+                loader.discover_mods()
+
+
+if __name__ == "__main__":
+    unittest.main()
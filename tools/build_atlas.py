@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+from pvz.assets.atlas import (
+    AtlasLayout,
+    TextureInfo,
+    collect_frame_textures,
+    load_layout,
+    pack_textures,
+    page_name,
+)
+from pvz.content.loader import ModLoader
+
+
+def _stale_pages(layout: AtlasLayout, out_dir: Path) -> set[int]:
+    """Dirty pages plus any page whose image is missing (e.g. an earlier run had no Pillow)."""
+    missing = {page for page in range(len(layout.pages)) if not (out_dir / page_name(page)).exists()}
+    return layout.dirty_pages | missing
+
+
+def _compose_pages(layout: AtlasLayout, sources: dict[str, Path], out_dir: Path) -> int:
+    try:
+        from PIL import Image
+    except ImportError:
+        print("Pillow is not installed; wrote atlas layout only")
+        return 0
+
+    pages = _stale_pages(layout, out_dir)
+    for page in sorted(pages):
+        canvas = Image.new("RGBA", (layout.page_size, layout.page_size))
+        for name, placement in layout.placements.items():
+            if placement.page != page:
+                continue
+            with Image.open(sources[name]) as texture:
+                canvas.paste(texture.convert("RGBA"), (placement.x, placement.y))
+        canvas.save(out_dir / page_name(page))
+    return len(pages)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Pack local animation frame textures into atlas pages")
+    parser.add_argument("mods_dir", type=Path)
+    parser.add_argument("--schemas", type=Path, default=Path("schemas"))
+    parser.add_argument("--output", type=Path, default=Path("build/atlas"))
+    parser.add_argument("--page-size", type=int, default=2048)
+    parser.add_argument("--padding", type=int, default=1)
+    parser.add_argument("--full", action="store_true", help="ignore the previous layout and repack everything")
+    args = parser.parse_args()
+
+    loaded = ModLoader(args.mods_dir, schema_root=args.schemas).load()
+    mod_paths = {mod.manifest.id: mod.path for mod in loaded.mods}
+    sources = collect_frame_textures(loaded.registry, mod_paths=mod_paths)
+    textures = {name: TextureInfo.from_file(path) for name, path in sources.items()}
+
+    layout_path = args.output / "atlas.json"
+    previous = None
+    if layout_path.exists() and not args.full:
+        previous = load_layout(layout_path)
+
+    layout = pack_textures(textures, previous=previous, page_size=args.page_size, padding=args.padding)
+    args.output.mkdir(parents=True, exist_ok=True)
+    composed = _compose_pages(layout, sources, args.output)
+    layout_path.write_text(json.dumps(layout.to_json(), indent=2, sort_keys=True), encoding="utf-8")
+
+    print(
+        f"OK: {len(layout.placements)} texture(s) on {len(layout.pages)} page(s), "
+        f"{composed} page(s) rebuilt -> {layout_path}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
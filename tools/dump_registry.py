@@ -2,20 +2,81 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
+from fnmatch import fnmatchcase
 from pathlib import Path
+from typing import Any, Iterable, Iterator, TextIO
 
 from pvz.content.loader import ModLoader
+from pvz.models import ContentRegistry
+
+
+def iter_items(
+    registry: ContentRegistry,
+    *,
+    categories: Iterable[str] | None = None,
+    id_glob: str | None = None,
+) -> Iterator[tuple[str, str, Any]]:
+    """Yield `(category, item_id, data)` in sorted order, filtered by category names and an id glob."""
+    wanted = set(categories) if categories else None
+    for category in sorted(registry.categories):
+        if wanted is not None and category not in wanted:
+            continue
+        entries = registry.categories[category]
+        for item_id in sorted(entries):
+            if id_glob is None or fnmatchcase(item_id, id_glob):
+                yield category, item_id, entries[item_id].data
+
+
+def write_json(items: Iterable[tuple[str, str, Any]], out: TextIO) -> int:
+    """Write `{category: {id: data}}` one item at a time, byte-identical to `json.dumps(..., indent=2, sort_keys=True)`."""
+    count = 0
+    current: str | None = None
+    for category, item_id, data in items:
+        if category != current:
+            out.write("{\n" if current is None else "\n  },\n")
+            out.write(f"  {json.dumps(category)}: {{\n")
+            current = category
+        else:
+            out.write(",\n")
+        body = json.dumps(data, indent=2, sort_keys=True).replace("\n", "\n    ")
+        out.write(f"    {json.dumps(item_id)}: {body}")
+        count += 1
+    out.write("{}\n" if current is None else "\n  }\n}\n")
+    return count
+
+
+def write_jsonl(items: Iterable[tuple[str, str, Any]], out: TextIO) -> int:
+    """Write one compact `{"category", "id", "data"}` object per line."""
+    count = 0
+    for category, item_id, data in items:
+        record = {"category": category, "id": item_id, "data": data}
+        out.write(json.dumps(record, sort_keys=True, separators=(",", ":")))
+        out.write("\n")
+        count += 1
+    return count
 
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="Dump fully resolved content registry")
     parser.add_argument("mods_dir", type=Path)
     parser.add_argument("--schemas", type=Path, default=Path("schemas"))
+    parser.add_argument("--format", choices=("json", "jsonl"), default="json")
+    parser.add_argument("--category", action="append", default=None, help="only dump this category (repeatable)")
+    parser.add_argument("--id", dest="id_glob", default=None, help="only dump ids matching this glob, e.g. 'pvz.base:plants:*'")
+    parser.add_argument("--output", type=Path, default=None, help="write here instead of stdout")
     args = parser.parse_args()
 
     loader = ModLoader(args.mods_dir, schema_root=args.schemas)
     loaded = loader.load()
-    print(json.dumps(loaded.registry.as_plain_data(), indent=2, sort_keys=True))
+    items = iter_items(loaded.registry, categories=args.category, id_glob=args.id_glob)
+    writer = write_jsonl if args.format == "jsonl" else write_json
+
+    if args.output is None:
+        writer(items, sys.stdout)
+    else:
+        with args.output.open("w", encoding="utf-8") as out:
+            writer(items, out)
     return 0
 
 
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import argparse
+import csv
+from pathlib import Path
+
+from pvz.content.columnar import ColumnarTable, build_tables
+from pvz.content.loader import ModLoader
+
+
+def _write_csv(table: ColumnarTable, path: Path) -> None:
+    columns = list(table.columns.values())
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["id", *(column.name for column in columns)])
+        for row, item_id in enumerate(table.ids):
+            cells = [column.get(row) for column in columns]
+            writer.writerow([item_id, *("" if cell is None else cell for cell in cells)])
+
+
+def _write_npy(table: ColumnarTable, path: Path) -> None:
+    import numpy as np
+
+    np.save(path, table.to_numpy(), allow_pickle=True)
+
+
+WRITERS = {
+    "csv": (_write_csv, ".csv", None),
+    "npy": (_write_npy, ".npy", "numpy"),
+    "parquet": (ColumnarTable.write_parquet, ".parquet", "pyarrow"),
+}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Export schema scalar fields of registry categories as column tables")
+    parser.add_argument("mods_dir", type=Path)
+    parser.add_argument("--schemas", type=Path, default=Path("schemas"))
+    parser.add_argument("--category", action="append", default=None, help="category to export (repeatable, default all)")
+    parser.add_argument("--format", choices=sorted(WRITERS), default="csv")
+    parser.add_argument("--output", type=Path, default=Path("build/columns"))
+    args = parser.parse_args()
+
+    write, suffix, module = WRITERS[args.format]
+    if module is not None:
+        try:
+            __import__(module)
+        except ImportError:
+            print(f"{module} is not installed; use --format csv")
+            return 1
+
+    loader = ModLoader(args.mods_dir, schema_root=args.schemas)
+    registry = loader.load().registry
+    tables = build_tables(registry, loader.schemas, args.category)
+    args.output.mkdir(parents=True, exist_ok=True)
+    for category, table in tables.items():
+        path = args.output / f"{category}{suffix}"
+        write(table, path)
+        print(f"{category}: {len(table)} rows x {len(table.columns)} columns -> {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,569 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import shutil
+import struct
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+
+# Relative share of each content category in a generated mod; plants/zombies/levels dominate
+# like they do in real content packs.
+CATEGORY_WEIGHTS: dict[str, int] = {
+    "plants": 14,
+    "zombies": 12,
+    "projectiles": 6,
+    "status_effects": 3,
+    "levels": 10,
+    "waves": 8,
+    "map_nodes": 6,
+    "mini_games": 3,
+    "puzzle_levels": 3,
+    "survival_levels": 2,
+    "shop": 3,
+    "almanac": 10,
+    "zen": 2,
+    "unlock_rules": 5,
+    "achievements": 5,
+    "economy": 1,
+    "ui_screens": 2,
+    "audio_events": 3,
+    "media_resources": 1,
+    "animation_configs": 6,
+}
+
+# Categories are generated in this order so cross-references point at ids that already exist.
+GENERATION_ORDER: tuple[str, ...] = (
+    "projectiles",
+    "status_effects",
+    "plants",
+    "zombies",
+    "levels",
+    "waves",
+    "unlock_rules",
+    "map_nodes",
+    "mini_games",
+    "puzzle_levels",
+    "survival_levels",
+    "shop",
+    "almanac",
+    "zen",
+    "achievements",
+    "economy",
+    "ui_screens",
+    "audio_events",
+    "media_resources",
+    "animation_configs",
+)
+
+TAGS = ("day", "night", "pool", "roof", "fog", "starter", "support", "defense", "upgrade", "combat")
+LOCALE_PREFIX = {"en": "", "de": "[de] ", "fr": "[fr] ", "zh-CN": "[zh] ", "ja": "[ja] "}
+
+
+@dataclass(frozen=True)
+class GeneratorConfig:
+    mods: int = 20
+    items_per_mod: int = 200
+    patches_per_mod: int = 20
+    locales: tuple[str, ...] = ("en", "de")
+    max_requires: int = 3
+    ordering_hints: float = 0.3
+    remote_asset_ratio: float = 0.5
+    assets_per_mod: int = 8
+    seed: int = 0
+
+
+@dataclass
+class GenerationSummary:
+    mods: list[str] = field(default_factory=list)
+    items: int = 0
+    patch_ops: int = 0
+    localization_keys: int = 0
+    by_category: dict[str, int] = field(default_factory=dict)
+
+
+def _write_json(path: Path, payload: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=1, ensure_ascii=False), encoding="utf-8")
+
+
+def _png(width: int, height: int) -> bytes:
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    rows = b"".join(b"\x00" + b"\x00\x00\x00\xff" * width for _ in range(height))
+    header = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(rows)) + chunk(b"IEND", b"")
+
+
+def category_counts(total: int, *, at_least_one: bool) -> dict[str, int]:
+    weight_sum = sum(CATEGORY_WEIGHTS.values())
+    counts = {category: total * weight // weight_sum for category, weight in CATEGORY_WEIGHTS.items()}
+    remainder = total - sum(counts.values())
+    for category in sorted(CATEGORY_WEIGHTS, key=lambda name: -CATEGORY_WEIGHTS[name])[:remainder]:
+        counts[category] += 1
+    if at_least_one:
+        counts = {category: max(1, count) for category, count in counts.items()}
+    return counts
+
+
+class _ModWriter:
+    """Builds one mod; `visible` holds full ids per category from this mod and its dependencies."""
+
+    def __init__(
+        self,
+        rng: random.Random,
+        config: GeneratorConfig,
+        mod_id: str,
+        root: Path,
+        visible: dict[str, list[str]],
+    ) -> None:
+        self.rng = rng
+        self.config = config
+        self.mod_id = mod_id
+        self.root = root
+        self.visible = visible
+        self.own: dict[str, list[str]] = {}
+        self.strings: dict[str, str] = {}
+        self.textures: list[str] = []
+        self.sounds: list[str] = []
+
+    def pick(self, category: str, fallback: str) -> str:
+        pool = self.visible.get(category)
+        return self.rng.choice(pool) if pool else fallback
+
+    def sample(self, category: str, count: int) -> list[str]:
+        pool = self.visible.get(category, [])
+        return self.rng.sample(pool, min(count, len(pool)))
+
+    def asset(self, kind: str) -> str:
+        rng = self.rng
+        local = self.textures if kind == "texture" else self.sounds
+        if local and rng.random() >= self.config.remote_asset_ratio:
+            return rng.choice(local)
+        suffix = "png" if kind == "texture" else "ogg"
+        return f"https://cdn.example.invalid/{self.mod_id}/{kind}_{rng.randrange(10_000)}.{suffix}"
+
+    def write_assets(self) -> None:
+        for index in range(self.config.assets_per_mod):
+            if index % 2 == 0:
+                size = self.rng.choice((16, 32, 48, 64))
+                ref = f"assets/textures/tex_{index}.png"
+                (self.root / ref).parent.mkdir(parents=True, exist_ok=True)
+                (self.root / ref).write_bytes(_png(size, size))
+                self.textures.append(ref)
+            else:
+                ref = f"assets/sounds/snd_{index}.ogg"
+                (self.root / ref).parent.mkdir(parents=True, exist_ok=True)
+                (self.root / ref).write_bytes(b"OggS" + bytes(self.rng.randrange(256) for _ in range(60)))
+                self.sounds.append(ref)
+
+    def add(self, category: str, local_id: str, payload: dict[str, Any]) -> None:
+        payload = {"id": local_id, **payload}
+        _write_json(self.root / "content" / category / f"{local_id}.json", payload)
+        full_id = f"{self.mod_id}:{category}:{local_id}"
+        self.own.setdefault(category, []).append(full_id)
+        self.visible.setdefault(category, []).append(full_id)
+
+    def name(self, category: str, local_id: str, text: str) -> str:
+        self.strings[f"{self.mod_id}.{category}.{local_id}.name"] = text
+        return text
+
+
+def _build_item(writer: _ModWriter, category: str, index: int) -> dict[str, Any]:
+    rng = writer.rng
+    local_id = f"{category}_{index}"
+    title = writer.name(category, local_id, f"{category.replace('_', ' ').title()} {index}")
+    builder = _BUILDERS[category]
+    return builder(writer, rng, local_id, title, index)
+
+
+def _projectile(w: _ModWriter, rng: random.Random, local_id: str, title: str, index: int) -> dict[str, Any]:
+    return {
+        "name": title,
+        "speed": rng.choice((2.5, 4.0, 6.0)),
+        "damage": rng.randint(5, 80),
+        "pierce": rng.choice((0, 0, 1, 3)),
+        "lifetime_ticks": rng.randint(60, 600),
+        "status_effects": w.sample("status_effects", rng.randint(0, 1)),
+    }
+
+
+def _status_effect(w: _ModWriter, rng: random.Random, local_id: str, title: str, index: int) -> dict[str, Any]:
+    return {
+        "name": title,
+        "duration_ticks": rng.randint(30, 600),
+        "stack_limit": rng.randint(1, 5),
+        "kind": rng.choice(("slow", "freeze", "poison", "butter")),
+        "modifiers": {"speed_mult": rng.choice((0.5, 0.0, 1.0)), "damage_per_tick": rng.randint(0, 5)},
+    }
+
+
+def _plant(w: _ModWriter, rng: random.Random, local_id: str, title: str, index: int) -> dict[str, Any]:
+    payload: dict[str, Any] = {
+        "name": title,
+        "cost": rng.choice((25, 50, 75, 100, 125, 150, 175, 200, 225)),
+        "cooldown": rng.choice((7.5, 30.0, 50.0)),
+        "max_hp": rng.choice((300, 400, 4000, 8000)),
+        "damage": rng.randint(0, 60),
+        "family": rng.choice(("shooter", "wall", "producer", "explosive", "lobber")),
+        "tags": sorted(rng.sample(TAGS, rng.randint(1, 3))),
+    }
+    if w.visible.get("projectiles") and rng.random() < 0.6:
+        payload["projectile_id"] = w.pick("projectiles", "")
+    if w.visible.get("plants") and rng.random() < 0.1:
+        if "upgrade" not in payload["tags"]:
+            payload["tags"].append("upgrade")
+        payload["upgrade"] = {
+            "from": w.sample("plants", 1),
+            "consume": 1,
+            "placement": rng.choice(("same_tile", "adjacent_pair", "same_tile_requires_host")),
+            "inherit": {"hp_ratio": True, "statuses": rng.random() < 0.5},
+        }
+    return payload
+
+
+def _zombie(w: _ModWriter, rng: random.Random, local_id: str, title: str, index: int) -> dict[str, Any]:
+    return {
+        "name": title,
+        "speed": rng.choice((0.5, 1.0, 1.5, 2.0)),
+        "max_hp": rng.choice((190, 370, 560, 1290, 3000)),
+        "damage": 100,
+        "reward": rng.randint(0, 50),
+        "tier": rng.choice(("basic", "armored", "elite", "boss")),
+        "abilities": rng.sample(("vault", "dig", "swim", "fly", "summon"), rng.randint(0, 2)),
+        "resists": w.sample("status_effects", rng.randint(0, 1)),
+    }
+
+
+def _spawns(w: _ModWriter, rng: random.Random, count: int) -> list[dict[str, Any]]:
+    return [
+        {"zombie_id": w.pick("zombies", "pvz.base:zombies:basic"), "count": rng.randint(1, 6), "lane": rng.randint(0, 4)}
+        for _ in range(count)
+    ]
+
+
+def _level(w: _ModWriter, rng: random.Random, local_id: str, title: str, index: int) -> dict[str, Any]:
+    ticks = sorted(rng.randint(1, 200) * 5 for _ in range(rng.randint(4, 16)))
+    waves = [{"tick": tick, **spawn} for tick, spawn in zip(ticks, _spawns(w, rng, len(ticks)))]
+    return {
+        "name": title,
+        "lawns": rng.choice((1, 3, 5, 6)),
+        "sun_start": rng.choice((50, 150, 300)),
+        "mode": rng.choice(("adventure_day", "adventure_night", "adventure_pool", "adventure_roof")),
+        "special_type": rng.choice(("standard", "standard", "conveyor", "boss")),
+        "flags_count": rng.randint(1, 4),
+        "fog": rng.random() < 0.2,
+        "zombie_pool": w.sample("zombies", rng.randint(1, 5)),
+        "waves": waves,
+        "reward": {"type": rng.choice(("coins", "plant", "note"))},
+    }
+
+
+def _wave(w: _ModWriter, rng: random.Random, local_id: str, title: str, index: int) -> dict[str, Any]:
+    return {"tick": rng.randint(1, 400) * 5, "entries": _spawns(w, rng, rng.randint(1, 5))}
+
+
+def _unlock_rule(w: _ModWriter, rng: random.Random, local_id: str, title: str, index: int) -> dict[str, Any]:
+    kind = rng.choice(("level", "plant", "shop", "mode"))
+    target = w.pick({"level": "levels", "plant": "plants"}.get(kind, "levels"), f"{w.mod_id}:{kind}:{index}")
+    return {
+        "kind": kind,
+        "target_id": target,
+        "conditions": [
+            {"metric": "level_complete", "operator": "contains", "value": w.pick("levels", "pvz.base:levels:day_1")},
+        ],
+    }
+
+
+def _map_node(w: _ModWriter, rng: random.Random, local_id: str, title: str, index: int) -> dict[str, Any]:
+    payload = {
+        "name": title,
+        "kind": rng.choice(("adventure", "minigame", "puzzle", "survival")),
+        "level_ref": w.pick("levels", "pvz.base:levels:day_1"),
+        "next": [f"{w.mod_id}:map_nodes:map_nodes_{index + 1}"] if rng.random() < 0.8 else [],
+    }
+    if w.visible.get("unlock_rules"):
+        payload["unlock_rule_id"] = w.pick("unlock_rules", "")
+    return payload
+
+
+def _mini_game(w: _ModWriter, rng: random.Random, local_id: str, title: str, index: int) -> dict[str, Any]:
+    return {
+        "name": title,
+        "ruleset": rng.choice(("wallnut_bowling", "slot_machine", "beghouled", "zombotany")),
+        "starting_loadout": w.sample("plants", rng.randint(2, 6)),
+        "seed": rng.randrange(2**31),
+        "difficulty": rng.choice(("easy", "normal", "hard")),
+        "rewards": ["coins"],
+    }
+
+
+def _puzzle(w: _ModWriter, rng: random.Random, local_id: str, title: str, index: int) -> dict[str, Any]:
+    return {
+        "name": title,
+        "puzzle_type": rng.choice(("vasebreaker", "i_zombie", "last_stand")),
+        "slots": rng.randint(3, 10),
+        "target": "eat_all_brains",
+        "layout": [{"lane": lane, "contains": w.pick("plants", "")} for lane in range(rng.randint(1, 5))],
+    }
+
+
+def _survival(w: _ModWriter, rng: random.Random, local_id: str, title: str, index: int) -> dict[str, Any]:
+    return {
+        "name": title,
+        "stage": rng.choice(("day", "night", "pool", "fog", "roof")),
+        "rounds": rng.choice((5, 10, 20)),
+        "level_ref": w.pick("levels", "pvz.base:levels:day_1"),
+        "modifiers": rng.sample(("hard", "endless", "no_sun"), rng.randint(0, 2)),
+    }
+
+
+def _shop_item(w: _ModWriter, rng: random.Random, local_id: str, title: str, index: int) -> dict[str, Any]:
+    return {"name": title, "price": rng.choice((750, 1000, 2000, 5000, 30000)), "grants": w.pick("plants", "upgrade")}
+
+
+def _almanac(w: _ModWriter, rng: random.Random, local_id: str, title: str, index: int) -> dict[str, Any]:
+    kind = rng.choice(("plant", "zombie"))
+    key = f"{w.mod_id}.almanac.{local_id}.description"
+    w.strings[key] = "Deals {damage} damage every {seconds} seconds."
+    return {
+        "title": title,
+        "kind": kind,
+        "target_id": w.pick(f"{kind}s", f"pvz.base:{kind}s:basic"),
+        "description": f"Generated almanac entry {index}. See {key}.",
+    }
+
+
+def _zen(w: _ModWriter, rng: random.Random, local_id: str, title: str, index: int) -> dict[str, Any]:
+    return {"name": title, "growth_time": rng.randint(60, 3600), "sell_value": rng.randint(500, 15000)}
+
+
+def _achievement(w: _ModWriter, rng: random.Random, local_id: str, title: str, index: int) -> dict[str, Any]:
+    # Many real achievements share condition/reward shapes; keep them template-like on purpose.
+    metric = rng.choice(("levels_completed", "zombies_killed", "minigames_cleared"))
+    return {
+        "title": title,
+        "description": f"Reach {metric}.",
+        "conditions": [{"metric": metric, "count": rng.choice((1, 10, 50))}],
+        "reward": {"coins": rng.choice((500, 1000, 3000))},
+    }
+
+
+def _economy(w: _ModWriter, rng: random.Random, local_id: str, title: str, index: int) -> dict[str, Any]:
+    return {
+        "currency": rng.choice(("sun", "coins", "diamonds")),
+        "start_amount": rng.choice((0, 50, 150)),
+        "max_amount": rng.choice((9990, 99999)),
+        "income_sources": [{"source": "sunflower", "value": 25}, {"source": "sky", "value": 25}],
+    }
+
+
+def _ui_screen(w: _ModWriter, rng: random.Random, local_id: str, title: str, index: int) -> dict[str, Any]:
+    return {
+        "title": title,
+        "layout": rng.choice(("grid", "stack", "overlay")),
+        "widgets": [
+            {"id": f"widget_{slot}", "kind": rng.choice(("button", "label", "list")), "bind": f"state.slot_{slot}"}
+            for slot in range(rng.randint(1, 6))
+        ],
+    }
+
+
+def _audio_event(w: _ModWriter, rng: random.Random, local_id: str, title: str, index: int) -> dict[str, Any]:
+    return {
+        "event": rng.choice(("shoot", "hit", "eat", "explode", "plant")),
+        "bus": rng.choice(("sfx", "music", "ui")),
+        "asset": w.asset("sound"),
+        "volume": rng.choice((0.5, 0.8, 1.0)),
+        "tags": rng.sample(("combat", "ui", "ambient"), rng.randint(1, 2)),
+    }
+
+
+def _media(w: _ModWriter, rng: random.Random, local_id: str, title: str, index: int) -> dict[str, Any]:
+    return {
+        "source": "synthetic",
+        "textures": [w.asset("texture") for _ in range(rng.randint(1, 6))],
+        "sounds": [w.asset("sound") for _ in range(rng.randint(0, 4))],
+    }
+
+
+def _animation(w: _ModWriter, rng: random.Random, local_id: str, title: str, index: int) -> dict[str, Any]:
+    target_category = rng.choice(("plants", "zombies"))
+    return {
+        "target_id": w.pick(target_category, f"pvz.base:{target_category}:basic"),
+        "fps": rng.choice((8, 10, 12, 24)),
+        "loop": rng.random() < 0.8,
+        "frames": [
+            {"frame": frame, "texture": w.asset("texture"), "duration_ms": 100} for frame in range(rng.randint(2, 8))
+        ],
+        "sound_events": [{"event": "attack", "sound_url": w.asset("sound")}] if rng.random() < 0.5 else [],
+    }
+
+
+_BUILDERS: dict[str, Callable[..., dict[str, Any]]] = {
+    "projectiles": _projectile,
+    "status_effects": _status_effect,
+    "plants": _plant,
+    "zombies": _zombie,
+    "levels": _level,
+    "waves": _wave,
+    "unlock_rules": _unlock_rule,
+    "map_nodes": _map_node,
+    "mini_games": _mini_game,
+    "puzzle_levels": _puzzle,
+    "survival_levels": _survival,
+    "shop": _shop_item,
+    "almanac": _almanac,
+    "zen": _zen,
+    "achievements": _achievement,
+    "economy": _economy,
+    "ui_screens": _ui_screen,
+    "audio_events": _audio_event,
+    "media_resources": _media,
+    "animation_configs": _animation,
+}
+
+
+def _patch_ops(writer: _ModWriter, targets: dict[str, list[str]], count: int) -> list[dict[str, Any]]:
+    rng = writer.rng
+    makers: list[tuple[str, Callable[[str], dict[str, Any]]]] = [
+        ("plants", lambda t: {"target": t, "op": "replace", "path": "/damage", "value": rng.randint(0, 90)}),
+        ("plants", lambda t: {"target": t, "op": "replace", "path": "/cost", "value": rng.choice((50, 100, 150))}),
+        ("plants", lambda t: {"target": t, "op": "append", "path": "/tags", "value": rng.choice(TAGS)}),
+        ("plants", lambda t: {"target": t, "op": "add", "path": "/abilities", "value": ["rebalanced"]}),
+        ("zombies", lambda t: {"target": t, "op": "replace", "path": "/max_hp", "value": rng.randint(150, 4000)}),
+        ("achievements", lambda t: {"target": t, "op": "merge", "path": "/reward", "value": {"coins": 250}}),
+        ("levels", lambda t: {"target": t, "op": "replace", "path": "/sun_start", "value": rng.choice((50, 100, 200))}),
+    ]
+    available = [(category, maker) for category, maker in makers if targets.get(category)]
+    ops: list[dict[str, Any]] = []
+    for _ in range(count if available else 0):
+        category, maker = rng.choice(available)
+        ops.append(maker(rng.choice(targets[category])))
+    return ops
+
+
+def _localize(strings: dict[str, str], locale: str) -> dict[str, str]:
+    prefix = LOCALE_PREFIX.get(locale, f"[{locale}] ")
+    return {key: prefix + value for key, value in sorted(strings.items())}
+
+
+def generate(root: Path, config: GeneratorConfig) -> GenerationSummary:
+    """Write `config.mods` schema-valid mods under `root`; identical configs produce identical trees.
+
+    Mod 0 is `pvz.base` and holds at least one item of every category. Each later
+    mod requires the base plus up to `max_requires` earlier mods (caret
+    constraints that its dependencies satisfy), may carry load_before/load_after
+    hints that agree with that order, references content of its dependencies,
+    and patches their plants, zombies, levels and achievements.
+    """
+    rng = random.Random(config.seed)
+    summary = GenerationSummary()
+    mod_ids = ["pvz.base"] + [f"synthetic.mod{index:04d}" for index in range(1, config.mods)]
+    versions = {mod_id: f"1.{rng.randint(0, 9)}.{rng.randint(0, 9)}" for mod_id in mod_ids}
+    exported: dict[str, dict[str, list[str]]] = {}
+
+    for position, mod_id in enumerate(mod_ids):
+        mod_root = root / mod_id
+        earlier = mod_ids[1:position]
+        requires = (["pvz.base"] if position else []) + rng.sample(
+            earlier, min(len(earlier), rng.randint(0, config.max_requires))
+        )
+        manifest: dict[str, Any] = {
+            "id": mod_id,
+            "version": versions[mod_id],
+            "title": f"Synthetic {mod_id}",
+            "engine_api": "1.0",
+            "requires": [{"id": dep, "version": f"^1.{versions[dep].split('.')[1]}.0"} for dep in requires],
+            "conflicts": [{"id": f"legacy.{mod_id}", "version": "<1.0.0"}] if rng.random() < 0.1 else [],
+            "load_after": [],
+            "load_before": [],
+        }
+        if earlier and rng.random() < config.ordering_hints:
+            manifest["load_after"].append(rng.choice(earlier))
+        later = mod_ids[position + 1 :]
+        if later and position and rng.random() < config.ordering_hints:
+            manifest["load_before"].append(rng.choice(later))
+        _write_json(mod_root / "mod.json", manifest)
+
+        visible: dict[str, list[str]] = {}
+        for dep in requires:
+            for category, ids in exported[dep].items():
+                visible.setdefault(category, []).extend(ids)
+        targets = {category: list(ids) for category, ids in visible.items()}
+
+        writer = _ModWriter(rng, config, mod_id, mod_root, visible)
+        writer.write_assets()
+        counts = category_counts(config.items_per_mod, at_least_one=position == 0)
+        for category in GENERATION_ORDER:
+            for index in range(counts[category]):
+                writer.add(category, f"{category}_{index}", _build_item(writer, category, index))
+                summary.by_category[category] = summary.by_category.get(category, 0) + 1
+        exported[mod_id] = writer.own
+
+        for locale in config.locales:
+            _write_json(mod_root / "localization" / f"{locale}.json", _localize(writer.strings, locale))
+        summary.localization_keys += len(writer.strings)
+
+        ops = _patch_ops(writer, targets, config.patches_per_mod)
+        if ops:
+            _write_json(mod_root / "patches" / "balance.json", {"ops": ops})
+
+        summary.mods.append(mod_id)
+        summary.items += sum(counts.values())
+        summary.patch_ops += len(ops)
+    return summary
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate a large synthetic mod set for scale testing")
+    parser.add_argument("output", type=Path, help="mods directory to create")
+    parser.add_argument("--mods", type=int, default=GeneratorConfig.mods)
+    parser.add_argument("--items-per-mod", type=int, default=GeneratorConfig.items_per_mod)
+    parser.add_argument("--patches-per-mod", type=int, default=GeneratorConfig.patches_per_mod)
+    parser.add_argument("--locales", nargs="+", default=list(GeneratorConfig.locales))
+    parser.add_argument("--max-requires", type=int, default=GeneratorConfig.max_requires)
+    parser.add_argument("--assets-per-mod", type=int, default=GeneratorConfig.assets_per_mod)
+    parser.add_argument("--seed", type=int, default=GeneratorConfig.seed)
+    parser.add_argument("--force", action="store_true", help="delete the output directory first")
+    args = parser.parse_args()
+
+    # Check every argument before --force deletes anything.
+    if "en" not in args.locales:
+        parser.error("--locales must include en")
+    if args.mods < 1:
+        parser.error("--mods must be at least 1")
+    for option in ("items_per_mod", "patches_per_mod", "max_requires", "assets_per_mod"):
+        if getattr(args, option) < 0:
+            parser.error(f"--{option.replace('_', '-')} must not be negative")
+    if args.output.exists() and not args.output.is_dir():
+        parser.error(f"{args.output} is not a directory")
+    if args.output.exists() and any(args.output.iterdir()):
+        if not args.force:
+            parser.error(f"{args.output} is not empty (use --force to replace it)")
+        shutil.rmtree(args.output)
+
+    config = GeneratorConfig(
+        mods=args.mods,
+        items_per_mod=args.items_per_mod,
+        patches_per_mod=args.patches_per_mod,
+        locales=tuple(args.locales),
+        max_requires=args.max_requires,
+        assets_per_mod=args.assets_per_mod,
+        seed=args.seed,
+    )
+    summary = generate(args.output, config)
+    print(
+        f"Generated {len(summary.mods)} mods, {summary.items} items, {summary.patch_ops} patch ops, "
+        f"{summary.localization_keys} localization keys under {args.output}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from pvz.assets.archive import ARCHIVE_NAME, DEFAULT_ALIGNMENT, ModArchive, write_archive
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Pack a mod's assets/ tree into a single indexed archive")
+    parser.add_argument("mod_path", type=Path)
+    parser.add_argument("--output", type=Path, default=None, help=f"archive path (default: <mod>/{ARCHIVE_NAME})")
+    parser.add_argument("--alignment", type=int, default=DEFAULT_ALIGNMENT, help="entry alignment in bytes")
+    parser.add_argument("--no-compress", action="store_true", help="store every entry uncompressed")
+    args = parser.parse_args()
+
+    dest = write_archive(
+        args.mod_path,
+        args.output,
+        alignment=args.alignment,
+        compress=not args.no_compress,
+    )
+    archive = ModArchive(dest)
+    stored = sum(entry.stored_size for entry in archive.entries.values())
+    raw = sum(entry.size for entry in archive.entries.values())
+    compressed = sum(1 for entry in archive.entries.values() if entry.codec != "raw")
+    archive.close()
+    print(f"OK: {dest} ({len(archive)} entries, {compressed} compressed, {raw} -> {stored} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,51 +1,231 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
-from pvz.content.asset_validation import validate_content_asset_refs
-from pvz.content.loader import CATEGORY_SCHEMA
+from pvz.content.asset_validation import AssetIndex
+from pvz.content.loader import CATEGORY_SCHEMA, content_category, read_content_file
 from pvz.content.localization_validation import validate_localization_files
 from pvz.content.manifest import parse_manifest
 from pvz.content.schema_validator import SchemaStore, validate_against_schema
+from pvz.errors import PvzError
+
+
+# Errors a broken mod can raise; anything else is a bug in the validator and should surface.
+VALIDATION_ERRORS = (PvzError, ValueError, OSError)
+
+
+@dataclass
+class ModReport:
+    path: str
+    mod_id: str | None = None
+    version: str | None = None
+    errors: list[str] = field(default_factory=list)
+    digest: str = ""
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def to_json(self) -> dict:
+        return {**asdict(self), "ok": self.ok}
+
+
+def tree_digest(root: Path) -> str:
+    """Content hash of every file under `root` (relative paths and bytes)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(p for p in root.rglob("*") if p.is_file()):
+        rel = path.relative_to(root).as_posix().encode("utf-8")
+        data = path.read_bytes()
+        digest.update(b"%d:%s%d:" % (len(rel), rel, len(data)))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def _error(exc: BaseException) -> str:
+    return f"{type(exc).__name__}: {exc}"
+
+
+def validate_mod(mod_path: Path, schemas: SchemaStore) -> ModReport:
+    """Validate manifest, content and localization of one mod, collecting every error instead of stopping."""
+    report = ModReport(path=str(mod_path))
+    manifest_path = mod_path / "mod.json"
+    try:
+        manifest_payload = json.loads(manifest_path.read_text(encoding="utf-8"))
+        validate_against_schema(manifest_payload, schemas.get("manifest"), source=str(manifest_path))
+        manifest = parse_manifest(mod_path)
+    except VALIDATION_ERRORS as exc:
+        report.errors.append(_error(exc))
+        return report
+    report.mod_id = manifest.id
+    report.version = manifest.version
+
+    content_root = mod_path / "content"
+    if content_root.exists():
+        try:
+            asset_index = AssetIndex.build(mod_path)
+        except VALIDATION_ERRORS as exc:
+            report.errors.append(_error(exc))
+            asset_index = None
+        if asset_index is not None:
+            for file_path in sorted(content_root.rglob("*.json")):
+                category = content_category(content_root, file_path)
+                if category not in CATEGORY_SCHEMA:
+                    continue
+                try:
+                    read_content_file(
+                        manifest.id,
+                        mod_path,
+                        file_path,
+                        category,
+                        schemas=schemas,
+                        asset_index=asset_index,
+                    )
+                except VALIDATION_ERRORS as exc:
+                    report.errors.append(_error(exc))
+
+    try:
+        validate_localization_files(mod_path)
+    except VALIDATION_ERRORS as exc:
+        report.errors.append(_error(exc))
+    return report
+
+
+class ReportCache:
+    """Validation reports keyed by mod path, reused while the mod's content hash is unchanged."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._entries: dict[str, dict] = {}
+        self._dirty = False
+        if path.exists():
+            try:
+                self._entries = json.loads(path.read_text(encoding="utf-8"))
+            except ValueError:
+                self._entries = {}
+
+    def entry(self, mod_path: Path) -> dict | None:
+        return self._entries.get(str(mod_path.resolve()))
+
+    def put(self, mod_path: Path, report: ModReport) -> None:
+        self._entries[str(mod_path.resolve())] = {**report.to_json(), "cached": False}
+        self._dirty = True
+
+    def retain(self, mod_paths: list[Path]) -> None:
+        """Drop entries for mods outside `mod_paths`, e.g. ones deleted since the last run."""
+        keep = {str(mod_path.resolve()) for mod_path in mod_paths}
+        stale = [key for key in self._entries if key not in keep]
+        for key in stale:
+            del self._entries[key]
+        self._dirty = self._dirty or bool(stale)
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self._entries, sort_keys=True), encoding="utf-8")
+        self._dirty = False
+
+
+def _validate_job(job: tuple[str, str, str, dict | None]) -> dict:
+    """Process-pool entry point: hash the mod, reuse the cached report if it still matches, else validate."""
+    mod_path, schemas_dir, schemas_digest, cached = job
+    try:
+        tree = tree_digest(Path(mod_path))
+    except VALIDATION_ERRORS as exc:
+        # An unreadable file fails this mod only; leave the digest empty so it is never served from cache.
+        return ModReport(path=mod_path, errors=[_error(exc)]).to_json()
+    digest = hashlib.blake2b(f"{schemas_digest}:{tree}".encode("utf-8"), digest_size=16).hexdigest()
+    if cached is not None and cached.get("digest") == digest:
+        return {**cached, "cached": True}
+    report = validate_mod(Path(mod_path), SchemaStore(Path(schemas_dir)))
+    report.digest = digest
+    return report.to_json()
+
+
+def discover_mod_paths(mods_dir: Path) -> list[Path]:
+    return [child for child in sorted(mods_dir.iterdir()) if (child / "mod.json").is_file()]
+
+
+def validate_all(
+    mods_dir: Path,
+    schemas_dir: Path,
+    *,
+    jobs: int | None = None,
+    cache: ReportCache | None = None,
+) -> list[ModReport]:
+    """Validate every mod under `mods_dir` in a process pool; reports come back in folder order."""
+    mod_paths = discover_mod_paths(mods_dir)
+    schemas_digest = tree_digest(schemas_dir)
+    job_list = []
+    for mod_path in mod_paths:
+        cached = cache.entry(mod_path) if cache is not None else None
+        job_list.append((str(mod_path), str(schemas_dir), schemas_digest, cached))
+
+    workers = min(jobs or os.cpu_count() or 1, len(job_list))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_validate_job, job_list, chunksize=max(1, len(job_list) // (workers * 4))))
+    else:
+        results = [_validate_job(job) for job in job_list]
+
+    reports = []
+    for mod_path, payload in zip(mod_paths, results):
+        report = ModReport(**{key: value for key, value in payload.items() if key != "ok"})
+        if cache is not None and not report.cached:
+            cache.put(mod_path, report)
+        reports.append(report)
+    if cache is not None:
+        cache.retain(mod_paths)
+        cache.save()
+    return reports
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser(description="Validate a mod folder")
+    parser = argparse.ArgumentParser(description="Validate a mod folder, or with --all every mod under a directory")
     parser.add_argument("mod_path", type=Path)
     parser.add_argument("--schemas", type=Path, default=Path("schemas"))
+    parser.add_argument("--all", action="store_true", help="treat mod_path as a mods directory and validate every mod")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes for --all (default: CPU count)")
+    parser.add_argument("--cache", type=Path, default=None, help="report cache file; unchanged mods are skipped")
+    parser.add_argument("--report", type=Path, default=None, help="write a JSON report here ('-' for stdout)")
     args = parser.parse_args()
 
-    mod_path = args.mod_path
-    manifest_payload = json.loads((mod_path / "mod.json").read_text(encoding="utf-8"))
-    schemas = SchemaStore(args.schemas)
-    validate_against_schema(manifest_payload, schemas.get("manifest"), source=str(mod_path / "mod.json"))
+    if args.all:
+        cache = ReportCache(args.cache) if args.cache else None
+        reports = validate_all(args.mod_path, args.schemas, jobs=args.jobs, cache=cache)
+    else:
+        reports = [validate_mod(args.mod_path, SchemaStore(args.schemas))]
 
-    manifest = parse_manifest(mod_path)
+    failed = sum(not report.ok for report in reports)
+    if args.report is not None:
+        document = {
+            "mods": len(reports),
+            "failed": failed,
+            "cached": sum(report.cached for report in reports),
+            "reports": [report.to_json() for report in reports],
+        }
+        text = json.dumps(document, indent=2)
+        if str(args.report) == "-":
+            print(text)
+            return 1 if failed else 0
+        args.report.write_text(text + "\n", encoding="utf-8")
 
-    content_root = mod_path / "content"
-    for file_path in sorted(content_root.rglob("*.json")):
-        rel = file_path.relative_to(content_root)
-        category = rel.parts[0] if rel.parts else "misc"
-        schema_name = CATEGORY_SCHEMA.get(category)
-        if not schema_name:
+    for report in reports:
+        label = f"{report.mod_id} ({report.version})" if report.mod_id else report.path
+        if report.ok:
+            print(f"OK: {label}")
             continue
-        payload = json.loads(file_path.read_text(encoding="utf-8"))
-        if ":" not in str(payload.get("id", "")):
-            payload["id"] = f"{manifest.id}:{category}:{payload.get('id', rel.stem)}"
-        validate_against_schema(payload, schemas.get(schema_name), source=str(file_path))
-        validate_content_asset_refs(
-            payload,
-            category=category,
-            mod_root=mod_path,
-            source=str(file_path),
-        )
-
-    validate_localization_files(mod_path)
-
-    print(f"OK: {manifest.id} ({manifest.version})")
-    return 0
+        print(f"FAIL: {label}")
+        for error in report.errors:
+            print(f"  - {error}")
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":